@@ -4,12 +4,17 @@ Corrected Configuration Gateway - Complete Adapter Support
 Single source for all system configuration with full adapter method support.
 """
 
+import copy
 import json
 import logging
 import os
 import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from configs.snapshot import ConfigSnapshot
 
 # Load .env file if available
 try:
@@ -23,6 +28,8 @@ __all__ = [
     # Core config functions
     "get_config",
     "get_schema",
+    "get_schema_registry",
+    "SchemaRegistry",
     "get_env",
     "get_env_required",
     "validate_required_env",
@@ -43,6 +50,100 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Config file behind each ConfigurationManager cache, for selective hot reloads
+_CACHE_ATTRIBUTES = {
+    "model_schema.json": "_schema_cache",
+    "field_mappings.json": "_mappings_cache",
+    "dashboard_config.json": "_dashboard_cache",
+    "system_constants.json": "_system_constants_cache",
+    "workflow_stages.json": "_workflow_stages_cache",
+    "entity_classification.json": "_entity_classification_cache",
+    "entity_connections.json": "_entity_connections_cache",
+    "field_analysis.json": "_field_analysis_cache",
+    "dashboard_styling.json": "_dashboard_styling_cache",
+    "dashboard_charts.json": "_dashboard_charts_cache",
+    "field_category_display_mapping.json": "_field_category_display_cache",
+    "case_study_schema.json": "_case_study_cache",
+    "graph_search_config.json": "_graph_search_cache",
+    "stakeholder_essential_queries.json": "_stakeholder_queries_cache",
+    "symptom_classification_config.json": "_symptom_classification_cache",
+}
+
+
+@dataclass(frozen=True)
+class SchemaRegistry:
+    """Immutable lookup tables compiled once from model_schema.json per config generation"""
+
+    generation: int
+    entity_names: Tuple[str, ...]
+    entities: Mapping[str, Dict[str, Any]]
+    primary_keys: Mapping[str, Optional[str]]
+    property_types: Mapping[str, Mapping[str, str]]
+    cascade_priorities: Mapping[str, Tuple[str, ...]]
+    relationship_types: Mapping[Tuple[str, str], str]
+
+    @classmethod
+    def compile(cls, schema: Dict[str, Any], generation: int = 0) -> "SchemaRegistry":
+        """Build the lookup tables in a single pass over the schema"""
+        entities = {
+            entity["name"]: entity for entity in schema.get("entities", []) if entity.get("name")
+        }
+        primary_keys = {
+            name: next(
+                (
+                    prop
+                    for prop, spec in entity.get("properties", {}).items()
+                    if spec.get("primary_key")
+                ),
+                None,
+            )
+            for name, entity in entities.items()
+        }
+        property_types = {
+            name: MappingProxyType(
+                {
+                    prop: spec.get("type", "string")
+                    for prop, spec in entity.get("properties", {}).items()
+                }
+            )
+            for name, entity in entities.items()
+        }
+        # Only entities with dynamic labelling switched on get a cascade
+        cascade_priorities = {
+            name: tuple(entity["dynamic_labeling"].get("cascade_priority", []))
+            for name, entity in entities.items()
+            if entity.get("dynamic_labeling", {}).get("enabled")
+        }
+        relationship_types = {
+            (rel["from"], rel["to"]): rel["type"] for rel in schema.get("relationships", [])
+        }
+        return cls(
+            generation=generation,
+            entity_names=tuple(entities),
+            entities=MappingProxyType(entities),
+            primary_keys=MappingProxyType(primary_keys),
+            property_types=MappingProxyType(property_types),
+            cascade_priorities=MappingProxyType(cascade_priorities),
+            relationship_types=MappingProxyType(relationship_types),
+        )
+
+    def entity(self, entity_name: str) -> Dict[str, Any]:
+        """Entity definition, empty when the schema does not declare it"""
+        return self.entities.get(entity_name, {})
+
+    def primary_key(self, entity_name: str, fallback: bool = False) -> Optional[str]:
+        """Primary key property, optionally falling back to the <entity>_id convention"""
+        primary_key = self.primary_keys.get(entity_name)
+        if primary_key is None and fallback:
+            return f"{entity_name.lower()}_id"
+        return primary_key
+
+    def relationship_type(
+        self, from_entity: str, to_entity: str, default: str = "RELATED_TO"
+    ) -> str:
+        """Relationship type declared between two entities"""
+        return self.relationship_types.get((from_entity, to_entity), default)
+
 
 class ConfigurationManager:
     """Thread-safe configuration manager with complete adapter support"""
@@ -62,7 +163,24 @@ class ConfigurationManager:
         self._case_study_cache: Optional[Dict[str, Any]] = None
         self._graph_search_cache: Optional[Dict[str, Any]] = None
         self._stakeholder_queries_cache: Optional[Dict[str, Any]] = None
+        self._symptom_classification_cache: Optional[Dict[str, Any]] = None
+        self._schema_registry_cache: Optional[SchemaRegistry] = None
+        # Bumped by clear_cache so compiled views know which config load they came from
+        self._generation = 0
         self._lock = threading.Lock()
+        self._snapshot = self._create_snapshot()
+
+    @staticmethod
+    def _create_snapshot() -> Optional[ConfigSnapshot]:
+        """Pickled snapshot of configs/*.json, unless CONFIG_SNAPSHOT=false"""
+        if os.environ.get("CONFIG_SNAPSHOT", "true").lower() in ("false", "0", "no"):
+            return None
+        cache_path = Path(
+            os.environ.get("CONFIG_SNAPSHOT_PATH", "data/config_snapshot/configs.json")
+        )
+        if not cache_path.is_absolute():
+            cache_path = Path(__file__).parent.parent / cache_path
+        return ConfigSnapshot(Path(__file__).parent, cache_path)
 
     def get_system_constants(self) -> Dict[str, Any]:
         """Load system constants configuration with thread-safe caching"""
@@ -80,6 +198,15 @@ class ConfigurationManager:
                     self._schema_cache = self._load_json_config("model_schema.json")
         return self._schema_cache
 
+    def get_schema_registry(self) -> SchemaRegistry:
+        """Compile schema lookup tables once per config generation"""
+        if self._schema_registry_cache is None:
+            schema = self.get_schema()
+            with self._lock:
+                if self._schema_registry_cache is None:
+                    self._schema_registry_cache = SchemaRegistry.compile(schema, self._generation)
+        return self._schema_registry_cache
+
     def get_mappings(self) -> Dict[str, Any]:
         """Load field mappings configuration with thread-safe caching"""
         if self._mappings_cache is None:
@@ -117,7 +244,10 @@ class ConfigurationManager:
         if self._workflow_stages_cache is None:
             with self._lock:
                 if self._workflow_stages_cache is None:
-                    self._workflow_stages_cache = self._load_json_config("workflow_stages.json")
+                    # Copied because the stage list is edited below and the snapshot is shared
+                    self._workflow_stages_cache = copy.deepcopy(
+                        self._load_json_config("workflow_stages.json")
+                    )
                     # Dynamically exclude "Root Cause (tail extraction)" from business fields
                     for stage in self._workflow_stages_cache.get("workflow_stages", []):
                         if stage.get("entity_name") == "RootCause":
@@ -196,6 +326,35 @@ class ConfigurationManager:
                     )
         return self._stakeholder_queries_cache
 
+    def get_symptom_classification_config(self) -> Dict[str, Any]:
+        """Load symptom classification configuration with thread-safe caching"""
+        if self._symptom_classification_cache is None:
+            with self._lock:
+                if self._symptom_classification_cache is None:
+                    self._symptom_classification_cache = self._load_json_config(
+                        "symptom_classification_config.json"
+                    )
+        return self._symptom_classification_cache
+
+    def reload_changed(self) -> Set[str]:
+        """Re-read only config files edited since they were loaded, keeping other caches"""
+        if self._snapshot is None:
+            self.clear_cache()
+            return set(_CACHE_ATTRIBUTES)
+        changed = self._snapshot.refresh()
+        if changed:
+            with self._lock:
+                for filename in changed:
+                    if filename in _CACHE_ATTRIBUTES:
+                        setattr(self, _CACHE_ATTRIBUTES[filename], None)
+                self._schema_registry_cache = None
+                self._generation += 1
+        return changed
+
+    def get_config_errors(self) -> Dict[str, str]:
+        """Validation errors from the config snapshot, by filename"""
+        return self._snapshot.errors() if self._snapshot is not None else {}
+
     def clear_cache(self):
         """Clear configuration cache (useful for testing)"""
         with self._lock:
@@ -213,9 +372,19 @@ class ConfigurationManager:
             self._case_study_cache = None
             self._graph_search_cache = None
             self._stakeholder_queries_cache = None
+            self._symptom_classification_cache = None
+            self._schema_registry_cache = None
+            self._generation += 1
+        if self._snapshot is not None:
+            self._snapshot.refresh()
 
     def _load_json_config(self, filename: str) -> Dict[str, Any]:
         """Load JSON configuration file with error handling"""
+        if self._snapshot is not None:
+            config = self._snapshot.get(filename)
+            if config is not None:
+                return config
+
         config_dir = Path(__file__).parent
         config_path = config_dir / filename
 
@@ -231,6 +400,9 @@ class ConfigurationManager:
                     f"graph_search_config.json not found at {config_path}. Returning empty config."
                 )
                 return {}
+            if filename == "symptom_classification_config.json":
+                logger.warning(f"{filename} not found at {config_path}. Using default terms.")
+                return {}
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         try:
@@ -317,8 +489,9 @@ def get_log_level() -> str:
 
 
 def get_batch_size() -> int:
-    """Get processing batch size"""
-    return int(get_env("NEO4J_BATCH_SIZE", "1000"))
+    """Get processing batch size, defaulting to system constants"""
+    default = get_system_constants().get("database", {}).get("batch_size", 1000)
+    return int(get_env("NEO4J_BATCH_SIZE", str(default)))
 
 
 def get_connection_timeout() -> int:
@@ -331,10 +504,46 @@ def get_max_retries() -> int:
     return int(get_env("NEO4J_MAX_RETRIES", "3"))
 
 
+def get_connection_pool_config() -> Dict[str, Any]:
+    """Get Neo4j connection pool settings from system constants"""
+    pooling = (
+        get_system_constants()
+        .get("database", {})
+        .get("adapter_optimization", {})
+        .get("connection_pooling", {})
+    )
+    return {
+        "enabled": bool(pooling.get("enabled", True)),
+        "max_pool_size": int(pooling.get("max_pool_size", 100)),
+        "min_pool_size": int(pooling.get("min_pool_size", 0)),
+        "idle_timeout": float(pooling.get("idle_timeout", 300)),
+        "acquisition_timeout": float(pooling.get("acquisition_timeout", 60)),
+        "max_connection_lifetime": float(pooling.get("max_connection_lifetime", 3600)),
+        "max_transaction_retry_time": float(pooling.get("max_transaction_retry_time", 30)),
+        "fetch_size": int(pooling.get("fetch_size", 1000)),
+    }
+
+
+def get_incident_chain_config() -> Dict[str, Any]:
+    """Get incident-chain projection settings from system constants"""
+    projection = (
+        get_system_constants()
+        .get("database", {})
+        .get("adapter_optimization", {})
+        .get("incident_chain_projection", {})
+    )
+    return {
+        "enabled": bool(projection.get("enabled", False)),
+        "maintain_on_write": bool(projection.get("maintain_on_write", True)),
+        "batch_size": int(projection.get("batch_size", 1000)),
+    }
+
+
 def get_root_cause_delimiters() -> List[str]:
     """Get configurable root cause extraction delimiters"""
     delimiters_str = get_env("ROOT_CAUSE_DELIMITERS", ";,|,\n, - , / , and , & ")
-    return [d.strip() for d in delimiters_str.split(",")]
+    # Padding is significant (" and " must not split "sandwich"); only empty entries are dropped
+    return [d for d in delimiters_str.split(",") if d]
 
 
 def get_log_file() -> Optional[str]:
@@ -402,24 +611,34 @@ def get_stakeholder_queries_config() -> Dict[str, Any]:
     return _config_manager.get_stakeholder_queries_config()
 
 
+def get_symptom_classification_config() -> Dict[str, Any]:
+    """Load symptom classification configuration with optimized caching"""
+    return _config_manager.get_symptom_classification_config()
+
+
+def reload_changed_configs() -> Set[str]:
+    """Hot-reload config files edited on disk, returning their names"""
+    return _config_manager.reload_changed()
+
+
+def get_config_errors() -> Dict[str, str]:
+    """Validation errors for config files that failed to parse"""
+    return _config_manager.get_config_errors()
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """Get compiled schema lookup tables for the current config generation"""
+    return _config_manager.get_schema_registry()
+
+
 def get_entity_names() -> List[str]:
     """Get list of all entity names from schema configuration"""
-    schema = get_schema()
-    entities = schema.get("entities", [])
-    return [entity.get("name") for entity in entities if entity.get("name")]
+    return list(get_schema_registry().entity_names)
 
 
 def get_entity_primary_key(entity_name: str) -> Optional[str]:
     """Get the primary key field for a given entity from schema"""
-    schema = get_schema()
-    entities = schema.get("entities", [])
-    for entity in entities:
-        if entity.get("name") == entity_name:
-            properties = entity.get("properties", {})
-            for prop_name, prop_details in properties.items():
-                if prop_details.get("primary_key"):
-                    return prop_name
-    return None
+    return get_schema_registry().primary_keys.get(entity_name)
 
 
 # Dashboard-specific configuration functions
@@ -445,6 +664,183 @@ def get_dashboard_performance_config() -> Dict[str, Any]:
     return config.get("performance", {"query_timeout_warning": 5.0, "cache_ttl_seconds": 300})
 
 
+def get_query_cache_config() -> Dict[str, Any]:
+    """Get query result cache bounds from system constants and dashboard TTL"""
+    constants = get_system_constants()
+    query_opts = (
+        constants.get("database", {}).get("adapter_optimization", {}).get("query_optimization", {})
+    )
+    cache_settings = constants.get("caching_framework", {}).get("global_cache_settings", {})
+    return {
+        "enabled": bool(query_opts.get("use_query_cache", True)),
+        "max_entries": int(query_opts.get("cache_size", 1000)),
+        "max_bytes": int(cache_settings.get("max_cache_size_mb", 256)) * 1024 * 1024,
+        "ttl_seconds": float(get_dashboard_performance_config().get("cache_ttl_seconds", 300)),
+    }
+
+
+def get_data_health_config() -> Dict[str, Any]:
+    """Get concurrency and timeout settings for data health scans"""
+    health = (
+        get_system_constants()
+        .get("database", {})
+        .get("adapter_optimization", {})
+        .get("data_health", {})
+    )
+    return {
+        "max_parallel_scans": int(health.get("max_parallel_scans", 6)),
+        "scan_timeout_seconds": float(health.get("scan_timeout_seconds", 300)),
+    }
+
+
+def get_entity_statistics_config() -> Dict[str, Any]:
+    """Get cache lifetime for count-store entity statistics"""
+    statistics = (
+        get_system_constants()
+        .get("database", {})
+        .get("adapter_optimization", {})
+        .get("entity_statistics", {})
+    )
+    # Bounds staleness from writes made by other processes, e.g. a separate importer
+    return {"max_age_seconds": float(statistics.get("max_age_seconds", 300))}
+
+
+def get_routing_config() -> Dict[str, Any]:
+    """Get read/write routing settings from system constants"""
+    routing = (
+        get_system_constants()
+        .get("database", {})
+        .get("adapter_optimization", {})
+        .get("routing", {})
+    )
+    return {"causal_consistency": bool(routing.get("causal_consistency", True))}
+
+
+def get_streaming_config() -> Dict[str, Any]:
+    """Get default fetch size and row/byte caps for streamed reads (0 means uncapped)"""
+    streaming = (
+        get_system_constants()
+        .get("database", {})
+        .get("adapter_optimization", {})
+        .get("streaming", {})
+    )
+    return {
+        "fetch_size": int(streaming.get("fetch_size", get_connection_pool_config()["fetch_size"])),
+        "max_rows": int(streaming.get("max_rows", 0)),
+        "max_bytes": int(float(streaming.get("max_result_size_mb", 0)) * 1024 * 1024),
+    }
+
+
+def get_dynamic_label_config() -> Dict[str, Any]:
+    """Get the per-entity dynamic label budget and long-tail fallback property"""
+    labels = (
+        get_system_constants()
+        .get("database", {})
+        .get("adapter_optimization", {})
+        .get("dynamic_labels", {})
+    )
+    return {
+        "enabled": bool(labels.get("budget_enabled", True)),
+        "max_labels_per_entity": int(labels.get("max_labels_per_entity", 100)),
+        "entity_budgets": {
+            name: int(budget) for name, budget in labels.get("entity_budgets", {}).items()
+        },
+        "fallback_property": labels.get("fallback_property", "label_value"),
+        "clean_cache_size": int(labels.get("clean_cache_size", 10000)),
+        "seed_from_database": bool(labels.get("seed_from_database", True)),
+    }
+
+
+def get_ingestion_config() -> Dict[str, Any]:
+    """Get batch sizing and backpressure settings for streaming facility imports"""
+    constants = get_system_constants()
+    ingestion = (
+        constants.get("database", {}).get("adapter_optimization", {}).get("ingestion", {})
+    )
+    io_buffer = (
+        constants.get("processing", {})
+        .get("performance_optimization", {})
+        .get("io_buffer_size", 65536)
+    )
+    return {
+        "batch_size": int(ingestion.get("batch_size", get_batch_size())),
+        "queue_depth": int(ingestion.get("queue_depth", 4)),
+        "read_chunk_bytes": int(ingestion.get("read_chunk_bytes", io_buffer)),
+        "records_key": ingestion.get("records_key", "records"),
+        "file_patterns": list(ingestion.get("file_patterns", ["*.json", "*.jsonl"])),
+        "delta_mode": bool(ingestion.get("delta_mode", False)),
+        "content_hash_property": ingestion.get("content_hash_property", "content_hash"),
+        "columnar_normalization": bool(ingestion.get("columnar_normalization", True)),
+        "journal_enabled": bool(ingestion.get("journal_enabled", True)),
+        "journal_path": get_project_root()
+        / ingestion.get("journal_path", "data/import_journal/journal.jsonl"),
+    }
+
+
+def get_bulk_export_config() -> Dict[str, Any]:
+    """Get output locations and batching for neo4j-admin / LOAD CSV bulk-load files"""
+    export = (
+        get_system_constants()
+        .get("database", {})
+        .get("adapter_optimization", {})
+        .get("bulk_export", {})
+    )
+    # data/imports is mounted as the Neo4j import directory in docker-compose.yml
+    return {
+        "imports_dir": get_project_root() / export.get("imports_dir", "data/imports"),
+        "output_subdir": export.get("output_subdir", "bulk"),
+        "container_import_dir": export.get("container_import_dir", "/var/lib/neo4j/import"),
+        "database": get_env("NEO4J_DATABASE", "neo4j"),
+        "load_csv_batch_size": int(export.get("load_csv_batch_size", get_batch_size())),
+        "array_delimiter": export.get("array_delimiter", ";"),
+    }
+
+
+def get_import_scheduler_config() -> Dict[str, Any]:
+    """Get worker pool, dependency and retry settings for parallel imports"""
+    constants = get_system_constants()
+    processing = constants.get("processing", {})
+    adapter_processing = processing.get("adapter_processing", {})
+    scheduler = (
+        constants.get("database", {}).get("adapter_optimization", {}).get("import_scheduler", {})
+    )
+    utilization = float(
+        processing.get("performance_optimization", {}).get("cpu_cores_utilization", 0.8)
+    )
+    # Workers beyond the connection pool would only wait for a connection
+    default_workers = min(
+        max(1, int((os.cpu_count() or 1) * utilization)),
+        get_connection_pool_config()["max_pool_size"],
+    )
+    return {
+        "parallel_entity_loading": bool(adapter_processing.get("parallel_entity_loading", True)),
+        "dependency_resolution": adapter_processing.get("dependency_resolution", "topological_sort"),
+        "continue_on_error": adapter_processing.get("error_handling", "continue_on_error")
+        == "continue_on_error",
+        "max_workers": int(scheduler.get("max_workers") or default_workers),
+        "facility_workers": int(scheduler.get("facility_workers", 2)),
+        "max_attempts": int(scheduler.get("max_attempts", get_max_retries())),
+        "retry_backoff_seconds": float(scheduler.get("retry_backoff_seconds", 0.5)),
+    }
+
+
+def get_query_monitoring_config() -> Dict[str, Any]:
+    """Get slow-query logging and latency tracking settings"""
+    monitoring = (
+        get_system_constants()
+        .get("database", {})
+        .get("adapter_optimization", {})
+        .get("performance_monitoring", {})
+    )
+    return {
+        "enabled": bool(monitoring.get("track_query_performance", True)),
+        "log_slow_queries": bool(monitoring.get("log_slow_queries", True)),
+        "slow_query_threshold_ms": float(monitoring.get("slow_query_threshold_ms", 1000)),
+        "histogram_window": int(monitoring.get("histogram_window", 1000)),
+        "slow_query_log_file": get_env("SLOW_QUERY_LOG_FILE"),
+    }
+
+
 def get_project_root() -> Path:
     """Get project root directory"""
     return Path(__file__).resolve().parent.parent
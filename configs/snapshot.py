@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Configuration Snapshot - Validated, Cached Copy of configs/*.json
+Parses and validates every config file once, then serves later starts from a single file read.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout or validation rules change
+SNAPSHOT_VERSION = 2
+
+
+def _validate_schema(data: Dict[str, Any]):
+    """model_schema.json: named entities and fully specified relationships"""
+    entities = data.get("entities")
+    if not isinstance(entities, list) or not all(entity.get("name") for entity in entities):
+        raise ValueError("'entities' must be a list of entities with a 'name'")
+    for rel in data.get("relationships", []):
+        missing = {"from", "to", "type"} - set(rel)
+        if missing:
+            raise ValueError(f"relationship {rel} is missing {sorted(missing)}")
+
+
+_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    "model_schema.json": _validate_schema,
+}
+
+
+class ConfigSnapshot:
+    """Per-file parsed configs keyed by mtime, size and content hash, persisted as one JSON file"""
+
+    def __init__(self, config_dir: Union[str, Path], cache_path: Union[str, Path] = None):
+        self.config_dir = Path(config_dir)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def get(self, filename: str) -> Optional[Dict[str, Any]]:
+        """Parsed config for a file, None when it does not exist; raises if it failed validation
+
+        The shared parsed object is returned as is; callers that adjust it must copy it first.
+        """
+        self._ensure_loaded()
+        entry = self._entries.get(filename)
+        if entry is None:
+            return None
+        if entry["error"]:
+            raise ValueError(f"Error loading {filename}: {entry['error']}")
+        return entry["data"]
+
+    def errors(self) -> Dict[str, str]:
+        """Validation errors by filename"""
+        self._ensure_loaded()
+        return {name: entry["error"] for name, entry in self._entries.items() if entry["error"]}
+
+    def refresh(self) -> Set[str]:
+        """Re-check the config directory, re-parsing only new, edited or removed files"""
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_cache()
+            changed, dirty = self._sync()
+            if dirty:
+                self._write_cache()
+        if changed:
+            logger.info(f"Config snapshot refreshed: {', '.join(sorted(changed))}")
+        return changed
+
+    def _ensure_loaded(self):
+        """Load the snapshot on first use"""
+        if self._entries is None:
+            self.refresh()
+
+    def _sync(self) -> Tuple[Set[str], bool]:
+        """Match entries to the files on disk; returns changed names and whether to rewrite"""
+        changed = set()
+        present = set()
+        dirty = False
+        # One directory read plus a stat per file is all a warm start costs
+        with os.scandir(self.config_dir) as entries:
+            files = [item for item in entries if item.name.endswith(".json") and item.is_file()]
+        for item in files:
+            path = Path(item.path)
+            present.add(path.name)
+            stat = item.stat()
+            entry = self._entries.get(path.name)
+            if entry and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+                continue
+
+            raw = path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry and entry["sha256"] == digest:
+                # Touched but not edited: keep the parsed data, remember the new mtime
+                entry["mtime_ns"] = stat.st_mtime_ns
+                dirty = True
+                continue
+
+            self._entries[path.name] = self._parse(path.name, raw, digest, stat)
+            changed.add(path.name)
+
+        for name in set(self._entries) - present:
+            del self._entries[name]
+            changed.add(name)
+        return changed, dirty or bool(changed)
+
+    @staticmethod
+    def _parse(filename: str, raw: bytes, digest: str, stat: os.stat_result) -> Dict[str, Any]:
+        """Parse and validate one config file"""
+        data, error = None, None
+        try:
+            data = json.loads(raw)
+            if not isinstance(data, dict):
+                raise ValueError("top level must be a JSON object")
+            validator = _VALIDATORS.get(filename)
+            if validator:
+                validator(data)
+        except Exception as e:
+            data, error = None, str(e)
+            logger.error(f"Invalid configuration {filename}: {error}")
+        return {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "data": data,
+            "error": error,
+        }
+
+    def _read_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Entries from the snapshot file, empty when absent, stale or unreadable"""
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            # Plain JSON: a snapshot path pointed at a crafted file can feed bad data, not code
+            payload = json.loads(self.cache_path.read_bytes())
+            if (
+                payload.get("version") == SNAPSHOT_VERSION
+                and payload.get("config_dir") == str(self.config_dir.resolve())
+                and isinstance(payload.get("entries"), dict)
+            ):
+                return payload["entries"]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable config snapshot {self.cache_path}: {e}")
+        return {}
+
+    def _write_cache(self):
+        """Persist entries atomically so concurrent workers never read a partial snapshot"""
+        if self.cache_path is None:
+            return
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "config_dir": str(self.config_dir.resolve()),
+            "entries": self._entries,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write config snapshot {self.cache_path}: {e}")
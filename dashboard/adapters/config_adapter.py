@@ -4,9 +4,7 @@ Configuration Adapter - Pure Configuration Access Layer (Enhanced)
 Central configuration adapter with caching and validation.
 """
 
-import json
 import logging
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 # Pure configuration imports
@@ -30,6 +28,7 @@ from configs.environment import (
     get_max_retries,
     get_schema,
     get_stakeholder_queries_config,
+    get_symptom_classification_config,
     get_system_constants,
     get_workflow_stages_config,
 )
@@ -242,21 +241,9 @@ class ConfigAdapter:
             return {}
 
     def get_symptom_classification_config(self) -> Dict[str, Any]:
-        """Load symptom classification configuration"""
+        """Pure access to symptom classification configuration, with default terms"""
         try:
-            config_dir = Path(__file__).parent.parent.parent / "configs"
-            config_path = config_dir / "symptom_classification_config.json"
-
-            if not config_path.exists():
-                logger.warning(f"Symptom classification config not found: {config_path}")
-                return self._get_default_symptom_config()
-
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-
-            logger.info("✅ Symptom classification config loaded successfully")
-            return config
-
+            return get_symptom_classification_config() or self._get_default_symptom_config()
         except Exception as e:
             handle_error_utility(logger, e, "loading symptom classification config")
             return self._get_default_symptom_config()
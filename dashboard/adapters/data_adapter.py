@@ -4,17 +4,30 @@ Data Adapter - Minimal Search-Only Version
 Provides only the search-related data access for the search-algorithms-only branch.
 """
 
+import logging
+import time
+
+from mine_core.database.fulltext_search import get_fulltext_search
+from mine_core.database.parallel_executor import ParallelQueryExecutor, QueryTask
 from mine_core.database.query_manager import get_query_manager
+from mine_core.database.query_templates import get_template_compiler
+
+logger = logging.getLogger(__name__)
 
 class DataAdapter:
     """Minimal data adapter for executing Cypher queries via the query manager."""
     def __init__(self):
         self.query_manager = get_query_manager()
+        self.executor = ParallelQueryExecutor(query_manager=self.query_manager)
+        self.fulltext = get_fulltext_search()
+        self.templates = get_template_compiler()
 
-    def execute_cypher_query(self, query, parameters=None):
+    def execute_cypher_query(self, query, parameters=None, max_rows=None):
         """Execute a Cypher query using the core query manager."""
         try:
-            return self.query_manager.execute_cypher_query(query, parameters=parameters)
+            return self.query_manager.execute_cypher_query(
+                query, parameters=parameters, max_rows=max_rows
+            )
         except Exception as e:
             # Optionally log or handle error here
             return None
@@ -23,34 +36,31 @@ class DataAdapter:
         """Execute comprehensive graph search combining all search query types and templates."""
         try:
             # Handle both string and dict search parameters
+            search_mode = self.fulltext.default_mode
             if isinstance(search_params, str):
                 search_term = search_params
             elif isinstance(search_params, dict):
                 search_term = search_params.get("search_term", "")
+                search_mode = search_params.get("search_mode", search_mode)
             else:
                 search_term = str(search_params)
 
             if not search_term:
                 return {"nodes": [], "relationships": [], "summary": "No search term provided"}
 
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info(f"Starting comprehensive search for: '{search_term}'")
 
             all_results = []
             category_results = {}
 
-            # Phase 1: Execute pre-built query templates first (highest priority)
-            template_results = self._execute_query_templates(search_term)
-            if template_results:
-                all_results.extend(template_results)
-                category_results["Query Templates"] = len(template_results)
-                logger.info(f"Query templates returned {len(template_results)} results")
+            # Phase 1: Pre-built query templates first (highest priority)
+            tasks = self._build_template_tasks(search_term)
 
-            # Phase 2: Execute graph configuration queries
+            # Phase 2: Graph configuration queries
             from dashboard.adapters import get_config_adapter
             config = get_config_adapter()
             graph_config = config.get_graph_search_config()
+            search_queries = graph_config.get("search_queries", {})
 
             # Execute all configured search query categories
             search_categories = [
@@ -64,37 +74,21 @@ class DataAdapter:
             ]
 
             for category_key, category_name in search_categories:
-                if category_key in graph_config.get("search_queries", {}):
-                    category_config = graph_config["search_queries"][category_key]
-                    category_count = 0
-
-                    # Execute all queries in this category
-                    for query_key, query in category_config.items():
-                        if query_key != "description" and isinstance(query, str):
-                            try:
-                                results = self.query_manager.execute_cypher_query(
-                                    query,
-                                    parameters={"search_term": search_term}
-                                )
-
-                                if results and results.get("success", False):
-                                    data = results.get("data", [])
-                                    for record in data:
-                                        record["search_category"] = category_key
-                                        record["search_subcategory"] = query_key
-                                        record["category_description"] = category_name
-
-                                    all_results.extend(data)
-                                    category_count += len(data)
-
-                            except Exception as e:
-                                logger.warning(f"Failed to execute {category_key}.{query_key}: {e}")
-                                continue
-
-                    if category_count > 0:
-                        category_results[category_name] = category_count
-
-            # Phase 3: Execute comprehensive single queries
+                for query_key, query in search_queries.get(category_key, {}).items():
+                    if query_key != "description" and isinstance(query, str):
+                        tasks.append(QueryTask(
+                            key=query_key,
+                            query=query,
+                            category=category_name,
+                            params={"search_term": search_term},
+                            metadata={
+                                "search_category": category_key,
+                                "search_subcategory": query_key,
+                                "category_description": category_name,
+                            },
+                        ))
+
+            # Phase 3: Comprehensive single queries
             comprehensive_queries = [
                 ("comprehensive_incident_search", "Incident search"),
                 ("equipment_facility_network", "Equipment network"),
@@ -102,27 +96,50 @@ class DataAdapter:
             ]
 
             for query_key, query_name in comprehensive_queries:
-                if query_key in graph_config.get("search_queries", {}):
-                    try:
-                        query = graph_config["search_queries"][query_key]
-                        results = self.query_manager.execute_cypher_query(
-                            query,
-                            parameters={"search_term": search_term}
-                        )
-
-                        if results and results.get("success", False):
-                            data = results.get("data", [])
-                            for record in data:
-                                record["search_category"] = query_key
-                                record["category_description"] = query_name
-
-                            all_results.extend(data)
-                            if data:
-                                category_results[query_name] = len(data)
-
-                    except Exception as e:
-                        logger.warning(f"Failed to execute {query_key}: {e}")
-                        continue
+                if isinstance(search_queries.get(query_key), str):
+                    tasks.append(QueryTask(
+                        key=query_key,
+                        query=search_queries[query_key],
+                        category=query_name,
+                        params={"search_term": search_term},
+                        metadata={
+                            "search_category": query_key,
+                            "category_description": query_name,
+                        },
+                    ))
+
+            if search_mode == "fulltext":
+                search_mode = self._apply_fulltext_mode(tasks, search_term)
+
+            # Fan out every phase at once; outcomes come back in task order
+            search_started = time.perf_counter()
+            outcomes = self.executor.execute(tasks)
+            search_elapsed_ms = round((time.perf_counter() - search_started) * 1000, 1)
+
+            for outcome in outcomes:
+                if not outcome.success:
+                    logger.warning(
+                        f"Failed to execute {outcome.task.category}.{outcome.task.key}: {outcome.error}"
+                    )
+                    if search_mode == "fulltext":
+                        # A dropped or rebuilding index fails rewritten queries; re-check it next search
+                        self.fulltext.reset_availability()
+                    continue
+
+                for record in outcome.data:
+                    record.update(outcome.task.metadata)
+
+                all_results.extend(outcome.data)
+                if outcome.data:
+                    category_results[outcome.task.category] = (
+                        category_results.get(outcome.task.category, 0) + len(outcome.data)
+                    )
+
+            category_timings = ParallelQueryExecutor.summarize_by_category(outcomes)
+            logger.info(
+                f"Comprehensive search ran {len(tasks)} queries in {search_elapsed_ms}ms "
+                f"(sequential equivalent {round(sum(o.elapsed_ms for o in outcomes), 1)}ms)"
+            )
 
             # Process results
             if all_results:
@@ -166,6 +183,9 @@ class DataAdapter:
                         "unique_results": len(unique_results),
                         "displayed_results": len(limited_results),
                         "categories": category_results,
+                        "category_timings": category_timings,
+                        "elapsed_ms": search_elapsed_ms,
+                        "search_mode": search_mode,
                         "search_term": search_term
                     }
                 }
@@ -177,13 +197,14 @@ class DataAdapter:
                     "search_metadata": {
                         "total_results": 0,
                         "search_term": search_term,
-                        "categories_attempted": len(search_categories) + len(comprehensive_queries)
+                        "categories_attempted": len(search_categories) + len(comprehensive_queries),
+                        "category_timings": category_timings,
+                        "elapsed_ms": search_elapsed_ms,
+                        "search_mode": search_mode
                     }
                 }
 
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Error in comprehensive graph search: {e}")
             return {
                 "nodes": [],
@@ -192,89 +213,56 @@ class DataAdapter:
                 "search_metadata": {"error": str(e)}
             }
 
-    def _execute_query_templates(self, search_term):
-        """Execute pre-built query templates from configs/queries/ directory."""
-        import os
-        import logging
-        logger = logging.getLogger(__name__)
-
-        queries_dir = "/home/291928k/uwa/alcoa/mining_reliability_db/configs/queries"
-        all_results = []
-
-        # Define filter clause for search term
-        filter_clause = f"""toLower(p.what_happened) CONTAINS toLower('{search_term}')
-           OR toLower(ar.categories) CONTAINS toLower('{search_term}')
-           OR toLower(rc.root_cause) CONTAINS toLower('{search_term}')
-           OR toLower(ap.action_plan) CONTAINS toLower('{search_term}') """
-
-        # Get all available query templates
-        try:
-            template_files = [f for f in os.listdir(queries_dir) if f.endswith('.cypher')]
-
-            # Priority templates executed first for better results ordering
-            priority_templates = [
-                "why_did_this_happen.cypher",
-                "proven_solutions.cypher",
-                "potential_root_causes.cypher",
-                "effective_actions.cypher",
-                "who_can_help_me.cypher"
-            ]
-
-            # Execute priority templates first
-            executed_templates = set()
-            for template_file in priority_templates:
-                if template_file in template_files:
-                    results = self._execute_single_template(template_file, queries_dir, filter_clause)
-                    if results:
-                        all_results.extend(results)
-                        executed_templates.add(template_file)
-                        logger.info(f"Priority template {template_file} returned {len(results)} results")
-
-            # Then execute remaining templates
-            remaining_templates = [t for t in template_files if t not in executed_templates]
-            for template_file in remaining_templates:
-                results = self._execute_single_template(template_file, queries_dir, filter_clause)
-                if results:
-                    all_results.extend(results)
-                    logger.info(f"Template {template_file} returned {len(results)} results")
-
-        except Exception as e:
-            logger.error(f"Error accessing query templates directory: {e}")
-
-        return all_results
-
-    def _execute_single_template(self, template_file, queries_dir, filter_clause):
-        """Execute a single query template file."""
-        import os
-        import logging
-        logger = logging.getLogger(__name__)
-
-        query_file = os.path.join(queries_dir, template_file)
-        results = []
-
-        try:
-            with open(query_file, 'r') as f:
-                query_template = f.read()
-
-            # Replace the filter clause placeholder
-            query = query_template.replace("{filter_clause}", filter_clause)
-
-            # Execute the query
-            query_results = self.query_manager.execute_cypher_query(query)
-
-            if query_results and query_results.get("success", False):
-                data = query_results.get("data", [])
-                for record in data:
-                    record["query_template"] = template_file
-                    record["search_category"] = "template_query"
-                    record["template_name"] = template_file.replace('.cypher', '').replace('_', ' ').title()
-
-                results = data
-
-        except Exception as e:
-            logger.warning(f"Failed to execute template {template_file}: {e}")
-
-        return results
+    def _apply_fulltext_mode(self, tasks, search_term):
+        """Rewrite CONTAINS predicates to full-text index lookups; returns the mode used."""
+        if not self.fulltext.is_available(self.query_manager):
+            return "contains"
+
+        rewritten_count = 0
+        for task in tasks:
+            rewritten = self.fulltext.rewrite(task.query)
+            if rewritten is None:
+                continue
+            lucene_params = self.fulltext.build_params(rewritten, search_term)
+            if lucene_params is None:
+                return "contains"
+            task.query = rewritten.text
+            task.params = {**task.params, **lucene_params}
+            rewritten_count += 1
+
+        logger.info(f"Full-text mode served {rewritten_count} of {len(tasks)} search queries")
+        return "fulltext"
+
+    def _build_template_tasks(self, search_term):
+        """Build query tasks for pre-built templates in configs/queries/."""
+        template_names = self.templates.template_names()
+
+        # Priority templates come first for better results ordering
+        priority_templates = [
+            "why_did_this_happen.cypher",
+            "proven_solutions.cypher",
+            "potential_root_causes.cypher",
+            "effective_actions.cypher",
+            "who_can_help_me.cypher"
+        ]
+        ordered_templates = [t for t in priority_templates if t in template_names]
+        ordered_templates += [t for t in template_names if t not in priority_templates]
+
+        # Compiled text is identical across searches so server-side plans are reused
+        return [
+            QueryTask(
+                key=template_name,
+                query=self.templates.compile(template_name),
+                category="Query Templates",
+                params={"search_term": search_term},
+                metadata={
+                    "query_template": template_name,
+                    "search_category": "template_query",
+                    "template_name": template_name.replace('.cypher', '').replace('_', ' ').title(),
+                },
+            )
+            for template_name in ordered_templates
+        ]
 
     def execute_organized_comprehensive_search(self, search_params):
         """Execute comprehensive search and return results organized by search category."""
@@ -376,9 +376,11 @@ def execute_query(n_clicks, query):
                 className="alert alert-danger",
             )
 
-        # Execute query through data adapter
+        # Execute query through data adapter, streaming no more rows than can be shown
         data_adapter = DataAdapter()
-        results = data_adapter.execute_cypher_query(query)
+        results = data_adapter.execute_cypher_query(
+            query, max_rows=config.get("component_config", {}).get("max_result_limit")
+        )
 
         if results is not None:
             result_count = len(results) if hasattr(results, "__len__") else 0
@@ -427,8 +429,12 @@ def display_results(execution_status, active_tab, query):
             return html.Div("Query was not executed successfully", className="text-muted")
 
         # Execute query to get results for display
+        config_adapter = ConfigAdapter()
+        config = config_adapter.load_cypher_search_config()
         data_adapter = DataAdapter()
-        results = data_adapter.execute_cypher_query(query)
+        results = data_adapter.execute_cypher_query(
+            query, max_rows=config.get("component_config", {}).get("max_result_limit")
+        )
 
         if not results:
             return html.Div("No data to display", className="text-muted")
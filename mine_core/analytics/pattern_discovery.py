@@ -7,7 +7,7 @@ Systematic investigation of incident patterns for engineer knowledge sharing
 import logging
 from typing import Any, Dict, List, Tuple
 
-from configs.environment import get_schema
+from configs.environment import get_schema, get_schema_registry
 from mine_core.database.db import get_database
 
 logger = logging.getLogger(__name__)
@@ -22,9 +22,10 @@ class PatternDiscovery:
     def __init__(self):
         self.db = get_database()
         self.schema = get_schema()
+        self.registry = get_schema_registry()
 
         # Extract schema components
-        self.entities = {e["name"]: e for e in self.schema.get("entities", [])}
+        self.entities = self.registry.entities
         self.relationships = {r["type"]: r for r in self.schema.get("relationships", [])}
 
         # Cache entity and relationship mappings
@@ -33,20 +34,11 @@ class PatternDiscovery:
 
     def _get_primary_key(self, entity_name: str) -> str:
         """Get primary key from schema"""
-        entity = self.entities.get(entity_name, {})
-        properties = entity.get("properties", {})
-
-        for prop_name, prop_info in properties.items():
-            if prop_info.get("primary_key", False):
-                return prop_name
-        return f"{entity_name.lower()}_id"  # fallback
+        return self.registry.primary_key(entity_name, fallback=True)
 
     def _get_relationship_type(self, from_entity: str, to_entity: str) -> str:
         """Get relationship type from schema"""
-        for rel in self.schema.get("relationships", []):
-            if rel.get("from") == from_entity and rel.get("to") == to_entity:
-                return rel["type"]
-        return "RELATED_TO"  # fallback
+        return self.registry.relationship_type(from_entity, to_entity)
 
     def investigate_cross_facility_patterns(self) -> Dict[str, Any]:
         """
@@ -125,7 +117,7 @@ class PatternDiscovery:
         ORDER BY effectiveness_rate DESC, completion_rate DESC
         """
 
-        performance_results = self.db.execute_query(performance_query)
+        performance_results = self.db.read_query(performance_query)
 
         # EDA Analysis: Performance distribution and ranking
         performance_analysis = {
@@ -215,7 +207,7 @@ class PatternDiscovery:
         LIMIT 10
         """
 
-        asset_results = self.db.execute_query(asset_query)
+        asset_results = self.db.read_query(asset_query)
 
         # EDA Analysis: Asset behavior pattern recognition
         asset_insights = {
@@ -314,7 +306,7 @@ class PatternDiscovery:
         LIMIT 15
         """
 
-        solution_results = self.db.execute_query(solution_query)
+        solution_results = self.db.read_query(solution_query)
 
         # EDA Analysis: Solution effectiveness pattern discovery
         solution_insights = {
@@ -402,7 +394,7 @@ class PatternDiscovery:
         ORDER BY size(facility_expertise) DESC
         """
 
-        transfer_results = self.db.execute_query(transfer_query)
+        transfer_results = self.db.read_query(transfer_query)
 
         # EDA Analysis: Knowledge transfer opportunity mapping
         transfer_opportunities = {
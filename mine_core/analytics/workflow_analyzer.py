@@ -7,8 +7,9 @@ Investigates workflow completeness patterns for engineer effectiveness
 import logging
 from typing import Any, Dict, List, Tuple
 
-from configs.environment import get_schema
+from configs.environment import get_schema, get_schema_registry
 from mine_core.database.db import get_database
+from mine_core.database.incident_chain import CHAIN_LABEL, get_incident_chain_projection
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +20,10 @@ class WorkflowAnalyzer:
     def __init__(self):
         self.db = get_database()
         self.schema = get_schema()
+        self.registry = get_schema_registry()
 
         # Extract schema components
-        self.entities = {e["name"]: e for e in self.schema.get("entities", [])}
+        self.entities = self.registry.entities
         self.relationships = {r["type"]: r for r in self.schema.get("relationships", [])}
 
         # Cache entity and relationship mappings
@@ -30,20 +32,11 @@ class WorkflowAnalyzer:
 
     def _get_primary_key(self, entity_name: str) -> str:
         """Get primary key from schema"""
-        entity = self.entities.get(entity_name, {})
-        properties = entity.get("properties", {})
-
-        for prop_name, prop_info in properties.items():
-            if prop_info.get("primary_key", False):
-                return prop_name
-        return f"{entity_name.lower()}_id"  # fallback
+        return self.registry.primary_key(entity_name, fallback=True)
 
     def _get_relationship_type(self, from_entity: str, to_entity: str) -> str:
         """Get relationship type from schema"""
-        for rel in self.schema.get("relationships", []):
-            if rel.get("from") == from_entity and rel.get("to") == to_entity:
-                return rel["type"]
-        return "RELATED_TO"  # fallback
+        return self.registry.relationship_type(from_entity, to_entity)
 
     def analyze_workflow_integrity(self, facility_id: str = None) -> Dict[str, Any]:
         """
@@ -122,7 +115,12 @@ class WorkflowAnalyzer:
         ORDER BY facility, pattern_type
         """
 
-        results = self.db.execute_query(chain_query, **params)
+        # Materialised chains classify each request once instead of re-walking five hops
+        projection = get_incident_chain_projection()
+        if projection.enabled and projection.is_built():
+            chain_query, params = self._projected_chain_query(facility_id)
+
+        results = self.db.read_query(chain_query, params)
 
         # EDA Analysis: Pattern frequency distribution
         pattern_analysis = {}
@@ -154,6 +152,26 @@ class WorkflowAnalyzer:
             "pattern_insights": self._interpret_chain_patterns(pattern_analysis_with_percentages),
         }
 
+    def _projected_chain_query(self, facility_id: str = None) -> Tuple[str, Dict[str, Any]]:
+        """Chain pattern query over the IncidentChain projection"""
+        facility_filter = "AND ic.facility_id = $facility_id" if facility_id else ""
+        params = {"facility_id": facility_id} if facility_id else {}
+
+        query = f"""
+        MATCH (ic:{CHAIN_LABEL})
+        WHERE ic.facility_id IS NOT NULL {facility_filter}
+        WITH ic.facility_name as facility,
+             CASE
+                WHEN ic.chain_depth = 4 THEN 'complete_chain'
+                WHEN ic.chain_depth = 3 THEN 'partial_chain'
+                WHEN ic.chain_depth >= 1 THEN 'problem_only'
+                ELSE 'request_only'
+             END as pattern_type
+        RETURN facility, pattern_type, count(*) as incident_count
+        ORDER BY facility, pattern_type
+        """
+        return query, params
+
     def _investigate_workflow_gaps(self, facility_id: str = None) -> Dict[str, Any]:
         """EDA Step 2: Identify critical workflow gaps"""
 
@@ -204,7 +222,7 @@ class WorkflowAnalyzer:
         ORDER BY facility, gap_count DESC
         """
 
-        gap_results = self.db.execute_query(gap_query, **params)
+        gap_results = self.db.read_query(gap_query, params)
 
         # EDA Analysis: Gap impact assessment
         gap_analysis = {}
@@ -294,7 +312,7 @@ class WorkflowAnalyzer:
         ORDER BY facility, usability_status
         """
 
-        impact_results = self.db.execute_query(impact_query, **params)
+        impact_results = self.db.read_query(impact_query, params)
 
         # EDA Analysis: Engineer effectiveness assessment
         engineer_impact = {}
@@ -4,6 +4,14 @@ Core Database Package
 Centralized data access and query management.
 """
 
+from mine_core.database.async_db import (
+    AsyncDatabase,
+    AsyncQueryManager,
+    close_async_database,
+    get_async_database,
+    get_async_query_manager,
+)
+from mine_core.database.data_health import DataHealthEngine, LabelHealth, get_data_health_engine
 from mine_core.database.db import close_database, get_database
 
 # Legacy compatibility
@@ -26,6 +34,23 @@ from mine_core.database.queries import (  # Legacy function aliases
     get_root_cause_frequency,
     get_root_cause_intelligence_summary,
 )
+from mine_core.database.entity_statistics import EntityStatistics, get_entity_statistics
+from mine_core.database.fulltext_search import FullTextSearch, get_fulltext_search
+from mine_core.database.incident_chain import (
+    IncidentChainProjection,
+    get_incident_chain_projection,
+)
+from mine_core.database.index_planner import IndexPlanner, IndexSpec
+from mine_core.database.label_registry import DynamicLabelRegistry, get_label_registry
+from mine_core.database.parallel_executor import ParallelQueryExecutor, QueryOutcome, QueryTask
+from mine_core.database.query_cache import QueryResultCache, get_query_cache
+from mine_core.database.query_metrics import QueryMetrics, get_query_metrics
+from mine_core.database.record_stream import RecordStream
+from mine_core.database.query_templates import (
+    SEARCH_FILTER_CLAUSE,
+    QueryTemplateCompiler,
+    get_template_compiler,
+)
 from mine_core.database.query_manager import QueryManager, get_query_manager
 
 __all__ = [
@@ -34,6 +59,47 @@ __all__ = [
     "get_query_manager",
     "get_database",
     "close_database",
+    # Asyncio query layer
+    "AsyncDatabase",
+    "AsyncQueryManager",
+    "get_async_database",
+    "get_async_query_manager",
+    "close_async_database",
+    # Single-pass data health scans
+    "DataHealthEngine",
+    "LabelHealth",
+    "get_data_health_engine",
+    # Concurrent query fan-out
+    "ParallelQueryExecutor",
+    "QueryTask",
+    "QueryOutcome",
+    # Count-store entity statistics
+    "EntityStatistics",
+    "get_entity_statistics",
+    # Full-text index search
+    "FullTextSearch",
+    "get_fulltext_search",
+    # Materialised incident chains
+    "IncidentChainProjection",
+    "get_incident_chain_projection",
+    # Schema and query driven index planning
+    "IndexPlanner",
+    "IndexSpec",
+    # Bounded dynamic label dictionary
+    "DynamicLabelRegistry",
+    "get_label_registry",
+    # Load-once parameterised cypher templates
+    "QueryTemplateCompiler",
+    "get_template_compiler",
+    "SEARCH_FILTER_CLAUSE",
+    # Read-through result cache
+    "QueryResultCache",
+    "get_query_cache",
+    # Constant-memory result streaming
+    "RecordStream",
+    # Query latency instrumentation
+    "QueryMetrics",
+    "get_query_metrics",
     # Core Query Functions
     "get_facilities",
     "get_facility",
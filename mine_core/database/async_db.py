@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Async Database Interface - Asyncio Twin of SimplifiedDatabase and QueryManager
+Runs many concurrent queries from one event loop on the async Neo4j driver.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncGraphDatabase, Query, unit_of_work
+from neo4j.exceptions import ServiceUnavailable, SessionExpired
+
+from configs.environment import (
+    get_connection_pool_config,
+    get_connection_timeout,
+    get_db_config,
+    get_max_retries,
+    get_routing_config,
+    get_streaming_config,
+)
+from mine_core.database.db import driver_pool_options
+from mine_core.database.parallel_executor import (
+    DEFAULT_QUERY_TIMEOUT_SECONDS,
+    DEFAULT_SEARCH_DEADLINE_SECONDS,
+    QueryOutcome,
+    QueryTask,
+)
+from mine_core.database.query_cache import get_query_cache, is_read_only_summary
+from mine_core.database.query_manager import QueryResult
+from mine_core.database.query_metrics import failure_kind, get_query_metrics
+from mine_core.shared.common import handle_error
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabase:
+    """Async Neo4j access sharing the sync layer's pool settings, cache and metrics"""
+
+    def __init__(self, uri=None, user=None, password=None, max_concurrency: int = None):
+        self._uri = uri
+        self._user = user
+        self._password = password
+        self._driver = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._query_cache = get_query_cache()
+        self._query_metrics = get_query_metrics()
+        self._pool_config = get_connection_pool_config()
+        self._streaming_config = get_streaming_config()
+        # In-flight queries beyond the pool size would only queue for a connection
+        self.max_concurrency = max_concurrency or self._pool_config["max_pool_size"]
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._bookmark_manager = (
+            AsyncGraphDatabase.bookmark_manager()
+            if get_routing_config()["causal_consistency"]
+            else None
+        )
+
+    async def driver(self):
+        """Get async driver, connecting on first use"""
+        if self._driver is None:
+            if self._connect_lock is None:
+                self._connect_lock = asyncio.Lock()
+            async with self._connect_lock:
+                if self._driver is None:
+                    await self._connect()
+        return self._driver
+
+    async def _connect(self):
+        """Establish async Neo4j connection using unified configuration"""
+        if not all([self._uri, self._user, self._password]):
+            config = get_db_config()
+            self._uri = config["uri"]
+            self._user = config["user"]
+            self._password = config["password"]
+
+        logger.info(f"Connecting async driver to Neo4j at {self._uri}")
+
+        max_retries = get_max_retries()
+        for attempt in range(1, max_retries + 1):
+            driver = AsyncGraphDatabase.driver(
+                self._uri,
+                auth=(self._user, self._password),
+                connection_timeout=get_connection_timeout(),
+                **driver_pool_options(self._pool_config),
+            )
+            try:
+                await driver.verify_connectivity()
+                self._driver = driver
+                logger.info("Async Neo4j connection verified")
+                return
+            except (ServiceUnavailable, SessionExpired) as e:
+                await driver.close()
+                if attempt == max_retries:
+                    handle_error(logger, e, "Async Neo4j connection")
+                    raise
+                logger.warning(f"Neo4j unavailable (attempt {attempt}/{max_retries}), retrying")
+                await asyncio.sleep(2 ** (attempt - 1))
+            except Exception as e:
+                await driver.close()
+                handle_error(logger, e, "Async Neo4j connection")
+                raise
+
+    async def close(self):
+        """Close async database connection"""
+        if self._driver is not None:
+            await self._driver.close()
+            self._driver = None
+            logger.info("Async Neo4j connection closed")
+
+    @asynccontextmanager
+    async def session(self, access_mode: Optional[str] = None, **config):
+        """Async session bounded by the concurrency limit, optionally pinned to an access mode"""
+        if access_mode:
+            config["default_access_mode"] = access_mode
+        if self._bookmark_manager is not None:
+            config.setdefault("bookmark_manager", self._bookmark_manager)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        driver = await self.driver()
+        async with self._semaphore:
+            async with driver.session(**config) as session:
+                yield session
+
+    async def execute_read(self, work: Callable, *args, **kwargs):
+        """Run an async transaction function in a managed read transaction routed to readers"""
+        async with self.session(READ_ACCESS) as session:
+            return await session.execute_read(work, *args, **kwargs)
+
+    async def execute_write(self, work: Callable, *args, **kwargs):
+        """Run an async transaction function in a managed write transaction routed to the leader"""
+        async with self.session(WRITE_ACCESS) as session:
+            return await session.execute_write(work, *args, **kwargs)
+
+    async def read_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Execute a query known to be read-only on a reader, skipping write detection"""
+        return await self.execute_query(
+            query, params, timeout=timeout, use_cache=use_cache, access_mode=READ_ACCESS
+        )
+
+    async def execute_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        access_mode: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute query with parameters and optional server-side timeout in seconds"""
+        # Cypher parameters travel as a dict so none can collide with these keyword options
+        params = params or {}
+        # Untagged statements run on the leader until the server has reported them read-only;
+        # only results it classified as reads are ever stored, so any stored key is safe to serve
+        if access_mode is None:
+            read_only = self._query_cache.is_known_read_only(query)
+        else:
+            read_only = access_mode == READ_ACCESS
+        cacheable = use_cache and access_mode != WRITE_ACCESS
+        if cacheable:
+            cache_key = self._query_cache.make_key(query, params)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                self._query_metrics.record_cache_hit(query)
+                return cached
+
+        @unit_of_work(timeout=timeout)
+        async def run_query(tx):
+            result = await tx.run(query, params)
+            records = await result.data()
+            return records, await result.consume()
+
+        data, summary, error = [], None, None
+        started = time.perf_counter()
+        try:
+            data, summary = await (
+                self.execute_read(run_query) if read_only else self.execute_write(run_query)
+            )
+        except Exception as e:
+            error = failure_kind(e)
+            handle_error(logger, e, f"Async query execution: {query[:100]}...")
+            raise
+        finally:
+            self._query_metrics.record(
+                query,
+                params,
+                wall_ms=(time.perf_counter() - started) * 1000,
+                rows=len(data),
+                server_available_ms=getattr(summary, "result_available_after", None),
+                server_consumed_ms=getattr(summary, "result_consumed_after", None),
+                error=error,
+            )
+
+        if access_mode == READ_ACCESS or is_read_only_summary(summary):
+            if access_mode is None:
+                self._query_cache.remember_read_only(query)
+            if cacheable:
+                self._query_cache.put(cache_key, data)
+        else:
+            self._query_cache.invalidate()
+        return data
+
+    async def gather(
+        self,
+        queries: Iterable[Tuple[str, Dict[str, Any]]],
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run read-only (query, params) pairs concurrently and return results in input order"""
+        return await asyncio.gather(
+            *(
+                self.read_query(query, params, timeout=timeout)
+                for query, params in queries
+            ),
+            return_exceptions=return_exceptions,
+        )
+
+    async def stream_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        fetch_size: Optional[int] = None,
+        as_tuples: bool = False,
+        max_rows: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Any]:
+        """Async-iterate a read query's records without materialising the full result"""
+        # READ_ACCESS sessions make the server reject any write in the streamed statement
+        max_rows = self._streaming_config["max_rows"] if max_rows is None else max_rows
+        fetch_size = fetch_size or self._streaming_config["fetch_size"]
+        rows = 0
+
+        async with self.session(READ_ACCESS, fetch_size=fetch_size) as session:
+            result = await session.run(Query(query, timeout=timeout), params)
+            try:
+                async for record in result:
+                    if max_rows and rows >= max_rows:
+                        break
+                    rows += 1
+                    yield tuple(record.values()) if as_tuples else record.data()
+            finally:
+                await result.consume()
+
+
+class AsyncQueryManager:
+    """QueryManager-shaped async facade with deadline-bounded fan-out"""
+
+    def __init__(self, db: AsyncDatabase = None):
+        self.db = db or get_async_database()
+
+    async def read_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> QueryResult:
+        """Execute a read-only query on a reader with standardized result handling"""
+        return await self.execute_query(query, params, timeout, use_cache, access_mode=READ_ACCESS)
+
+    async def execute_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        access_mode: Optional[str] = None,
+    ) -> QueryResult:
+        """Execute raw query with standardized result handling"""
+        started = time.perf_counter()
+        try:
+            results = await self.db.execute_query(
+                query, params, timeout=timeout, use_cache=use_cache, access_mode=access_mode
+            )
+            return QueryResult(
+                data=results,
+                count=len(results),
+                success=True,
+                metadata={
+                    "query_type": "raw",
+                    "params": params,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            )
+        except Exception as e:
+            handle_error(logger, e, "async query execution")
+            return QueryResult(
+                data=[],
+                count=0,
+                success=False,
+                metadata={
+                    "error": str(e),
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            )
+
+    async def execute_many(
+        self,
+        tasks: List[QueryTask],
+        query_timeout: float = DEFAULT_QUERY_TIMEOUT_SECONDS,
+        overall_timeout: float = DEFAULT_SEARCH_DEADLINE_SECONDS,
+    ) -> List[QueryOutcome]:
+        """Run tasks concurrently; outcomes match ParallelQueryExecutor.execute in submission order"""
+        if not tasks:
+            return []
+
+        async def run_task(task: QueryTask) -> QueryOutcome:
+            started = time.perf_counter()
+            result = await self.read_query(task.query, task.params, timeout=query_timeout)
+            error = None if result.success else result.metadata.get("error")
+            return QueryOutcome(
+                task=task,
+                data=result.data if result.success else [],
+                success=result.success,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                error=error,
+                timed_out=bool(error and "timeout" in error.lower()),
+            )
+
+        pending = [asyncio.ensure_future(run_task(task)) for task in tasks]
+        done, not_done = await asyncio.wait(pending, timeout=overall_timeout)
+
+        if not_done:
+            logger.warning(
+                f"Async execution deadline of {overall_timeout}s reached "
+                f"with {len(not_done)} queries outstanding"
+            )
+            for future in not_done:
+                future.cancel()
+
+        return [
+            future.result()
+            if future in done
+            else QueryOutcome(
+                task=task,
+                data=[],
+                success=False,
+                elapsed_ms=overall_timeout * 1000,
+                error="Overall search deadline exceeded",
+                timed_out=True,
+            )
+            for task, future in zip(tasks, pending)
+        ]
+
+
+# Singleton instances; the async driver belongs to the event loop that first used it
+_async_db_instance = None
+_async_query_manager = None
+
+
+def get_async_database(uri=None, user=None, password=None) -> AsyncDatabase:
+    """Get singleton async database instance"""
+    global _async_db_instance
+    if _async_db_instance is None:
+        _async_db_instance = AsyncDatabase(uri, user, password)
+    return _async_db_instance
+
+
+def get_async_query_manager() -> AsyncQueryManager:
+    """Get singleton async query manager"""
+    global _async_query_manager
+    if _async_query_manager is None:
+        _async_query_manager = AsyncQueryManager()
+    return _async_query_manager
+
+
+async def close_async_database():
+    """Close singleton async database connection"""
+    global _async_db_instance, _async_query_manager
+    if _async_db_instance is not None:
+        await _async_db_instance.close()
+        _async_db_instance = None
+        _async_query_manager = None
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Data Health Engine - Single-Pass, Schema-Driven Completeness Scans
+One aggregation per label, run concurrently, behind validate_data_integrity and completion rates.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from configs.environment import get_data_health_config, get_schema
+from mine_core.shared.common import handle_error
+from mine_core.shared.field_utils import MISSING_DATA_CONTEXT
+
+logger = logging.getLogger(__name__)
+
+WORKFLOW_LABELS = ["ActionRequest", "Problem", "RootCause", "ActionPlan", "Verification"]
+INTEGRITY_COUNT_LABELS = ["Facility", "ActionRequest", "Problem", "RootCause", "ActionPlan"]
+
+_STRING_TYPES = {"string", "text"}
+
+
+@dataclass
+class LabelHealth:
+    """Node total and per-property fill counts for one label"""
+
+    label: str
+    total: int
+    present: Dict[str, int] = field(default_factory=dict)  # non-null, non-empty
+    informative: Dict[str, int] = field(default_factory=dict)  # present and not a placeholder
+
+    @property
+    def completed_fields(self) -> int:
+        """Filled property slots across all nodes"""
+        return sum(self.present.values())
+
+    @property
+    def total_fields(self) -> int:
+        """Property slots across all nodes"""
+        return self.total * len(self.present)
+
+
+class DataHealthEngine:
+    """Computes counts and field completeness with one round trip per label"""
+
+    def __init__(self, db=None, schema: Dict[str, Any] = None, max_workers: int = None):
+        if db is None:
+            # Import here to avoid circular dependency
+            from mine_core.database.db import get_database
+
+            db = get_database()
+
+        config = get_data_health_config()
+        self.db = db
+        self.schema = schema or get_schema()
+        self.max_workers = max_workers or config["max_parallel_scans"]
+        self.scan_timeout = config["scan_timeout_seconds"]
+
+        self.entities = {entity["name"]: entity for entity in self.schema.get("entities", [])}
+        self._identifiers = {
+            prop
+            for entity in self.entities.values()
+            for prop, definition in entity.get("properties", {}).items()
+            if definition.get("primary_key")
+        }
+
+    def descriptive_properties(self, label: str) -> Dict[str, str]:
+        """Declared non-identifier properties of a label with their schema types"""
+        properties = self.entities.get(label, {}).get("properties", {})
+        return {
+            prop: definition.get("type", "string")
+            for prop, definition in properties.items()
+            if prop not in self._identifiers
+        }
+
+    def scan(self, plan: Dict[str, Optional[Iterable[str]]]) -> Dict[str, LabelHealth]:
+        """Scan labels concurrently; a label mapped to None only needs its count"""
+        jobs = [(label, list(props) if props is not None else None) for label, props in plan.items()]
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(jobs))), thread_name_prefix="data-health"
+        ) as pool:
+            return dict(zip(plan, pool.map(lambda job: self._scan_label(*job), jobs)))
+
+    def integrity_report(self) -> Dict[str, Any]:
+        """Entity counts, workflow linkage and causal completeness (validate_data_integrity shape)"""
+        integrity_checks: Dict[str, Any] = {}
+
+        try:
+            plan: Dict[str, Optional[List[str]]] = {
+                label: None for label in INTEGRITY_COUNT_LABELS
+            }
+            plan["RootCause"] = ["root_cause", "root_cause_tail_extraction"]
+
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="data-health-chain") as pool:
+                workflow = pool.submit(self._workflow_integrity)
+                health = self.scan(plan)
+                workflow_integrity = workflow.result()
+
+            for label in INTEGRITY_COUNT_LABELS:
+                integrity_checks[f"{label}_count"] = health[label].total
+            integrity_checks["workflow_integrity"] = workflow_integrity
+
+            causes = health["RootCause"]
+            with_data = causes.informative.get("root_cause", 0)
+            with_tail = causes.informative.get("root_cause_tail_extraction", 0)
+            integrity_checks["causal_intelligence"] = {
+                "total_causes": causes.total,
+                "causes_with_data": with_data,
+                "causes_with_tail": with_tail,
+                "primary_completeness": with_data / causes.total if causes.total else 0.0,
+                "causal_intelligence_ratio": with_tail / causes.total if causes.total else 0.0,
+            }
+        except Exception as e:
+            handle_error(logger, e, "integrity validation")
+            integrity_checks["validation_error"] = str(e)
+
+        return integrity_checks
+
+    def completion_rates(self, labels: List[str] = None) -> Dict[str, Any]:
+        """Completion over each label's declared properties (get_entity_completion_rates shape)"""
+        labels = labels or WORKFLOW_LABELS
+        health = self.scan({label: self.descriptive_properties(label) for label in labels})
+
+        entity_rates = {}
+        for label in labels:
+            label_health = health[label]
+            total_fields = label_health.total_fields
+            entity_rates[label] = {
+                "total_count": label_health.total,
+                "completed_fields": label_health.completed_fields,
+                "total_fields": total_fields,
+                "completion_rate": round(label_health.completed_fields * 100.0 / total_fields, 1)
+                if total_fields > 0
+                else 0.0,
+            }
+        return entity_rates
+
+    def _scan_label(self, label: str, properties: Optional[List[str]]) -> LabelHealth:
+        """Run the single aggregation for one label"""
+        query, columns = self._label_query(label, properties)
+        rows = self.db.read_query(
+            query,
+            {"indicators": list(MISSING_DATA_CONTEXT)},
+            timeout=self.scan_timeout,
+            use_cache=False,
+        )
+        row = rows[0] if rows else {}
+
+        health = LabelHealth(label=label, total=row.get("total", 0))
+        for index, prop in columns:
+            health.present[prop] = row.get(f"present_{index}", 0)
+            health.informative[prop] = row.get(f"informative_{index}", 0)
+        return health
+
+    def _label_query(
+        self, label: str, properties: Optional[List[str]]
+    ) -> Tuple[str, List[Tuple[int, str]]]:
+        """Count-only queries are answered from the count store; others aggregate in one pass"""
+        if not properties:
+            return f"MATCH (n:{label}) RETURN count(n) AS total", []
+
+        types = self.descriptive_properties(label)
+        columns = list(enumerate(properties))
+        aggregates = ["count(n) AS total"]
+        for index, prop in columns:
+            if types.get(prop, "string") in _STRING_TYPES:
+                present = f"n.{prop} IS NOT NULL AND n.{prop} <> ''"
+                informative = f"{present} AND NOT n.{prop} IN $indicators"
+            else:
+                present = informative = f"n.{prop} IS NOT NULL"
+            aggregates.append(f"count(CASE WHEN {present} THEN 1 END) AS present_{index}")
+            aggregates.append(f"count(CASE WHEN {informative} THEN 1 END) AS informative_{index}")
+
+        return f"MATCH (n:{label})\nRETURN " + ",\n       ".join(aggregates), columns
+
+    def _workflow_integrity(self) -> Dict[str, Any]:
+        """Request-to-plan linkage counts"""
+        result = self.db.read_query(
+            """
+            MATCH (ar:ActionRequest)-[:BELONGS_TO]->(f:Facility)
+            OPTIONAL MATCH (ar)<-[:IDENTIFIED_IN]-(p:Problem)
+            OPTIONAL MATCH (p)<-[:ANALYZES]-(rc:RootCause)
+            OPTIONAL MATCH (rc)<-[:RESOLVES]-(ap:ActionPlan)
+            RETURN count(ar) AS total_requests,
+                   count(p) AS problems_identified,
+                   count(rc) AS causes_analyzed,
+                   count(ap) AS plans_created
+            """,
+            timeout=self.scan_timeout,
+            use_cache=False,
+        )
+        return result[0] if result else {}
+
+
+# Singleton instance
+_data_health_engine = None
+
+
+def get_data_health_engine() -> DataHealthEngine:
+    """Get singleton data health engine bound to the shared database"""
+    global _data_health_engine
+    if _data_health_engine is None:
+        _data_health_engine = DataHealthEngine()
+    return _data_health_engine
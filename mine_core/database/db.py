@@ -5,22 +5,57 @@ Clean implementation without backwards compatibility pollution.
 """
 
 import logging
-from contextlib import contextmanager
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from neo4j import GraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS, GraphDatabase, unit_of_work
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
 
 from configs.environment import (
+    get_batch_size,
+    get_connection_pool_config,
     get_connection_timeout,
     get_db_config,
+    get_entity_names,
     get_entity_primary_key,
     get_max_retries,
+    get_routing_config,
+    get_schema_registry,
+    get_streaming_config,
 )
+from mine_core.database.incident_chain import CHAIN_ENTITIES, get_incident_chain_projection
+from mine_core.database.index_planner import IndexPlanner
+from mine_core.database.label_registry import get_label_registry
+from mine_core.database.query_cache import get_query_cache, is_read_only_summary
+from mine_core.database.query_metrics import failure_kind, get_query_metrics
+from mine_core.database.record_stream import RecordStream
 from mine_core.shared.common import handle_error
-from mine_core.shared.field_utils import clean_label, has_real_value
+from mine_core.shared.field_utils import MISSING_DATA_CONTEXT, has_real_value
 
 logger = logging.getLogger(__name__)
 
+# Deadlocks surface as TransientError once the driver's own transaction retries run out
+RETRYABLE_ERRORS = (TransientError, ServiceUnavailable, SessionExpired)
+
+
+def driver_pool_options(pool: Dict[str, Any]) -> Dict[str, Any]:
+    """Driver keyword arguments for a connection_pooling config, shared by sync and async drivers"""
+    options = {
+        "connection_acquisition_timeout": pool["acquisition_timeout"],
+        "max_transaction_retry_time": pool["max_transaction_retry_time"],
+        "fetch_size": pool["fetch_size"],
+    }
+    if pool["enabled"]:
+        options.update(
+            max_connection_pool_size=pool["max_pool_size"],
+            max_connection_lifetime=pool["max_connection_lifetime"],
+            # Connections idle longer than this are health-checked before reuse
+            liveness_check_timeout=pool["idle_timeout"],
+        )
+    return options
+
 
 class SimplifiedDatabase:
     """Streamlined database interface for clean dataset processing"""
@@ -31,6 +66,21 @@ class SimplifiedDatabase:
         self._user = user
         self._password = password
         self._driver = None
+        self._ingestion_stats: Dict[str, Dict[str, Any]] = {}
+        # Parallel imports record throughput from several writer threads
+        self._ingestion_lock = threading.Lock()
+        self._query_cache = get_query_cache()
+        self._label_registry = get_label_registry()
+        self._query_metrics = get_query_metrics()
+        self._pool_config = get_connection_pool_config()
+        self._streaming_config = get_streaming_config()
+        # Shared bookmarks let a read routed to a follower observe this process's earlier writes
+        self._bookmark_manager = (
+            GraphDatabase.bookmark_manager() if get_routing_config()["causal_consistency"] else None
+        )
+        self._pool_lock = threading.Lock()
+        self._pool_stats = {"in_use": 0, "peak_in_use": 0, "acquired": 0, "warmed": 0}
+        self._chain_maintenance_deferred = False
 
     @property
     def driver(self):
@@ -49,18 +99,59 @@ class SimplifiedDatabase:
 
         logger.info(f"Connecting to Neo4j at {self._uri}")
 
+        max_retries = get_max_retries()
+        for attempt in range(1, max_retries + 1):
+            try:
+                self._driver = GraphDatabase.driver(
+                    self._uri,
+                    auth=(self._user, self._password),
+                    connection_timeout=get_connection_timeout(),
+                    **self._driver_pool_options(),
+                )
+                self._driver.verify_connectivity()
+                logger.info("Neo4j connection verified")
+                break
+            except (ServiceUnavailable, SessionExpired) as e:
+                self._discard_driver()
+                if attempt == max_retries:
+                    handle_error(logger, e, "Neo4j connection")
+                    raise
+                logger.warning(f"Neo4j unavailable (attempt {attempt}/{max_retries}), retrying")
+                time.sleep(2 ** (attempt - 1))
+            except Exception as e:
+                handle_error(logger, e, "Neo4j connection")
+                self._discard_driver()
+                raise
+
+        self._warm_up_pool()
+
+    def _driver_pool_options(self) -> Dict[str, Any]:
+        """Translate connection_pooling constants into driver keyword arguments"""
+        return driver_pool_options(self._pool_config)
+
+    def _warm_up_pool(self):
+        """Open min_pool_size connections up front so first requests skip the handshake"""
+        target = self._pool_config["min_pool_size"] if self._pool_config["enabled"] else 0
+        if target <= 0:
+            return
+
         try:
-            self._driver = GraphDatabase.driver(
-                self._uri,
-                auth=(self._user, self._password),
-                connection_timeout=get_connection_timeout(),
-            )
-            self._driver.verify_connectivity()
-            logger.info("Neo4j connection verified")
+            # Concurrently open transactions each pin a distinct pooled connection
+            with ExitStack() as stack:
+                for _ in range(target):
+                    session = stack.enter_context(self._driver.session())
+                    tx = stack.enter_context(session.begin_transaction())
+                    tx.run("RETURN 1").consume()
+            self._pool_stats["warmed"] = target
+            logger.info(f"Warmed up {target} pooled Neo4j connections")
         except Exception as e:
-            handle_error(logger, e, "Neo4j connection")
+            handle_error(logger, e, "connection pool warm-up")
+
+    def _discard_driver(self):
+        """Close and forget a driver that failed to connect"""
+        if self._driver is not None:
+            self._driver.close()
             self._driver = None
-            raise
 
     def close(self):
         """Close database connection"""
@@ -70,23 +161,148 @@ class SimplifiedDatabase:
             logger.info("Neo4j connection closed")
 
     @contextmanager
-    def session(self):
-        """Session context manager"""
-        session = self.driver.session()
+    def session(self, access_mode: Optional[str] = None, **config):
+        """Session context manager tracking pool utilisation, optionally pinned to an access mode"""
+        if access_mode:
+            config["default_access_mode"] = access_mode
+        if self._bookmark_manager is not None:
+            config.setdefault("bookmark_manager", self._bookmark_manager)
+        session = self.driver.session(**config)
+        with self._pool_lock:
+            self._pool_stats["in_use"] += 1
+            self._pool_stats["acquired"] += 1
+            self._pool_stats["peak_in_use"] = max(
+                self._pool_stats["peak_in_use"], self._pool_stats["in_use"]
+            )
         try:
             yield session
         finally:
             session.close()
+            with self._pool_lock:
+                self._pool_stats["in_use"] -= 1
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Sessions in use against the configured pool size"""
+        with self._pool_lock:
+            stats = dict(self._pool_stats)
+        max_pool_size = self._pool_config["max_pool_size"]
+        stats["max_pool_size"] = max_pool_size
+        stats["utilisation"] = round(stats["in_use"] / max_pool_size, 3) if max_pool_size else 0.0
+        return stats
+
+    def execute_read(self, work: Callable, *args, **kwargs):
+        """Run a transaction function in a managed read transaction routed to readers"""
+        with self.session(READ_ACCESS) as session:
+            return session.execute_read(work, *args, **kwargs)
+
+    def execute_write(self, work: Callable, *args, **kwargs):
+        """Run a transaction function in a managed write transaction routed to the leader"""
+        with self.session(WRITE_ACCESS) as session:
+            return session.execute_write(work, *args, **kwargs)
+
+    def read_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ):
+        """Execute a query known to be read-only on a reader, skipping write detection"""
+        return self.execute_query(
+            query, params, timeout=timeout, use_cache=use_cache, access_mode=READ_ACCESS
+        )
 
-    def execute_query(self, query: str, **params):
-        """Execute query with parameters"""
+    def execute_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        access_mode: Optional[str] = None,
+    ):
+        """Execute query with parameters and optional server-side timeout in seconds"""
+        # Cypher parameters travel as a dict so none can collide with these keyword options
+        params = params or {}
+        # Untagged statements run on the leader until the server has reported them read-only;
+        # only results it classified as reads are ever stored, so any stored key is safe to serve
+        if access_mode is None:
+            read_only = self._query_cache.is_known_read_only(query)
+        else:
+            read_only = access_mode == READ_ACCESS
+        cacheable = use_cache and access_mode != WRITE_ACCESS
+        if cacheable:
+            cache_key = self._query_cache.make_key(query, params)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                self._query_metrics.record_cache_hit(query)
+                return cached
+
+        @unit_of_work(timeout=timeout)
+        def run_query(tx):
+            result = tx.run(query, params)
+            records = result.data()
+            return records, result.consume()
+
+        data, summary, error = [], None, None
+        started = time.perf_counter()
         try:
-            with self.session() as session:
-                result = session.run(query, **params)
-                return result.data()
+            data, summary = (
+                self.execute_read(run_query) if read_only else self.execute_write(run_query)
+            )
         except Exception as e:
+            error = failure_kind(e)
             handle_error(logger, e, f"Query execution: {query[:100]}...")
             raise
+        finally:
+            self._query_metrics.record(
+                query,
+                params,
+                wall_ms=(time.perf_counter() - started) * 1000,
+                rows=len(data),
+                server_available_ms=getattr(summary, "result_available_after", None),
+                server_consumed_ms=getattr(summary, "result_consumed_after", None),
+                error=error,
+            )
+
+        if access_mode == READ_ACCESS or is_read_only_summary(summary):
+            if access_mode is None:
+                self._query_cache.remember_read_only(query)
+            if cacheable:
+                self._query_cache.put(cache_key, data)
+        else:
+            self._query_cache.invalidate()
+        return data
+
+    def stream_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        fetch_size: Optional[int] = None,
+        as_tuples: bool = False,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> RecordStream:
+        """Iterate a read query's records without materialising the full result"""
+        defaults = self._streaming_config
+        return RecordStream(
+            self,
+            query,
+            params or {},
+            fetch_size=fetch_size or defaults["fetch_size"],
+            as_tuples=as_tuples,
+            max_rows=defaults["max_rows"] if max_rows is None else max_rows,
+            max_bytes=defaults["max_bytes"] if max_bytes is None else max_bytes,
+            timeout=timeout,
+        )
+
+    def get_query_stats(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Latency percentiles per query fingerprint, slowest in aggregate first"""
+        return self._query_metrics.get_report(top)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Query result cache hit/miss/eviction counters"""
+        return self._query_cache.get_stats()
 
     def create_entity_with_dynamic_label(
         self, entity_type: str, properties: Dict[str, Any], dynamic_label: str = None
@@ -103,11 +319,7 @@ class SimplifiedDatabase:
             return False
 
         # Determine labels to apply
-        labels = [entity_type]  # Always include entity type
-        if dynamic_label and dynamic_label != entity_type:
-            clean_dynamic = clean_label(dynamic_label)
-            if clean_dynamic and clean_dynamic != entity_type:
-                labels.append(clean_dynamic)
+        labels, label_value = self._resolve_entity_labels(entity_type, dynamic_label)
 
         # Filter out None values and missing indicators
         valid_props = {
@@ -115,126 +327,345 @@ class SimplifiedDatabase:
             for k, v in properties.items()
             if v is not None and not self._is_missing_indicator(v)
         }
+        if label_value:
+            valid_props[self._label_registry.fallback_property] = label_value
 
-        # Build label string and SET clause
-        label_string = ":".join(labels)
-        set_props = [f"n.{k} = ${k}" for k in valid_props.keys()]
+        # Build SET clause
+        set_props = [f"n.{k} = $props.{k}" for k in valid_props.keys()]
         set_clause = f"SET {', '.join(set_props)}" if set_props else ""
 
-        query = f"MERGE (n:{label_string} {{{primary_key}: ${primary_key}}}) {set_clause}"
+        query = self._merge_entity_query(
+            entity_type, primary_key, f"$props.{primary_key}", set_clause, labels
+        )
 
         try:
-            with self.session() as session:
-                session.run(query, **valid_props)
-            return True
+            with self.session(WRITE_ACCESS) as session:
+                session.run(query, props=valid_props)
+            self._query_cache.invalidate()
         except Exception as e:
             handle_error(
                 logger, e, f"Creating entity {entity_type} with dynamic label {dynamic_label}"
             )
             return False
 
+        self._refresh_incident_chains(entity_type, [id_value])
+        return True
+
     def batch_create_entities_with_labels(
         self, entity_type: str, entities_list: List[Dict[str, Any]]
     ) -> bool:
         """Batch create entities with dynamic labeling"""
+        return self.bulk_create_entities(entity_type, entities_list)["success"]
+
+    def bulk_create_entities(
+        self,
+        entity_type: str,
+        entities_list: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Bulk MERGE entities with one UNWIND statement per label group and chunk"""
+        stats = {"entity_type": entity_type, "rows": 0, "batches": 0, "success": True}
         if not entities_list:
-            return True
+            return stats
 
         primary_key = get_entity_primary_key(entity_type)
         if not primary_key:
             logger.error(f"No primary key found for {entity_type}")
-            return False
+            return {**stats, "success": False}
 
         # Validate all entities have primary key
         for entity in entities_list:
             if primary_key not in entity:
                 logger.error(f"Missing primary key {primary_key} in entity")
-                return False
+                return {**stats, "success": False}
+
+        # Group rows by label set; SET n += row absorbs differing property keys
+        label_groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        fallback_property = self._label_registry.fallback_property
+        for entity in entities_list:
+            dynamic_label = entity.get("_dynamic_label")
+            labels, label_value = self._resolve_entity_labels(entity_type, dynamic_label)
+            row = {
+                k: v
+                for k, v in entity.items()
+                if k != "_dynamic_label" and v is not None and not self._is_missing_indicator(v)
+            }
+            if label_value:
+                row[fallback_property] = label_value
+            label_groups.setdefault(labels, []).append(row)
+
+        batch_size = batch_size or get_batch_size()
+        started = time.perf_counter()
 
         try:
-            with self.session() as session:
-                for entity in entities_list:
-                    dynamic_label = entity.pop("_dynamic_label", None)
-                    self._create_single_entity_with_label(
-                        session, entity_type, entity, primary_key, dynamic_label
+            with self.session(WRITE_ACCESS) as session:
+                for labels, rows in label_groups.items():
+                    query = "UNWIND $rows AS row " + self._merge_entity_query(
+                        entity_type, primary_key, f"row.{primary_key}", "SET n += row", labels
                     )
-            return True
+                    for offset in range(0, len(rows), batch_size):
+                        chunk = rows[offset : offset + batch_size]
+                        session.execute_write(self._merge_chunk, query, chunk)
+                        stats["rows"] += len(chunk)
+                        stats["batches"] += 1
         except Exception as e:
-            handle_error(logger, e, f"Batch creating {entity_type}")
-            return False
+            handle_error(logger, e, f"Bulk creating {entity_type}")
+            stats["success"] = False
+            stats["error"] = str(e)
+            stats["retryable"] = isinstance(e, RETRYABLE_ERRORS)
+
+        if stats["batches"]:
+            self._query_cache.invalidate()
+            self._refresh_incident_chains(
+                entity_type, [row[primary_key] for rows in label_groups.values() for row in rows]
+            )
 
-    def _create_single_entity_with_label(
+        elapsed = time.perf_counter() - started
+        stats["elapsed_seconds"] = round(elapsed, 3)
+        stats["rows_per_second"] = round(stats["rows"] / elapsed, 1) if elapsed else 0.0
+        self._record_ingestion_stats(entity_type, stats["rows"], stats["batches"], elapsed)
+        logger.info(
+            f"Bulk loaded {stats['rows']} {entity_type} rows in {stats['batches']} batches "
+            f"({stats['rows_per_second']} rows/s)"
+        )
+        return stats
+
+    @staticmethod
+    def _merge_chunk(tx, query: str, chunk: List[Dict[str, Any]]):
+        """Transaction function for one UNWIND MERGE chunk"""
+        tx.run(query, rows=chunk).consume()
+
+    def _merge_entity_query(
         self,
-        session,
         entity_type: str,
-        entity: Dict[str, Any],
         primary_key: str,
-        dynamic_label: str = None,
-    ):
-        """Create single entity with optional dynamic label"""
-        # Determine labels
-        labels = [entity_type]
-        if dynamic_label and dynamic_label != entity_type:
-            clean_dynamic = clean_label(dynamic_label)
-            if clean_dynamic and clean_dynamic != entity_type:
-                labels.append(clean_dynamic)
-
-        # Filter meaningful properties
-        meaningful_props = {
-            k: v for k, v in entity.items() if v is not None and not self._is_missing_indicator(v)
-        }
-
-        # Build query
-        label_string = ":".join(labels)
-        properties = list(meaningful_props.keys())
-        other_props = [p for p in properties if p != primary_key]
-
-        set_clause = ""
-        if other_props:
-            set_props = [f"n.{p} = $entity.{p}" for p in other_props]
-            set_clause = f"SET {', '.join(set_props)}"
-
-        query = f"""
-        MERGE (n:{label_string} {{{primary_key}: $entity.{primary_key}}})
-        {set_clause}
+        key_expression: str,
+        set_clause: str,
+        labels: Tuple[str, ...],
+    ) -> str:
+        """MERGE on the constrained (type, primary key) alone, then replace dynamic labels
+
+        Matching on the full label set would miss a node whose cascade label changed or fell
+        back to the label property, and the uniqueness constraint would reject the CREATE.
         """
+        query = f"MERGE (n:{entity_type} {{{primary_key}: {key_expression}}}) {set_clause}"
+        if entity_type not in get_schema_registry().cascade_priorities:
+            return query
+        if self._label_registry.needs_seed(entity_type):
+            self._seed_dynamic_labels(entity_type)
+
+        # Registry-cleaned labels are plain identifiers, safe to write into the statement;
+        # removing every other known dynamic label drops one left by an earlier import
+        dynamic = [label for label in labels if label != entity_type]
+        stale = sorted(self._label_registry.known_labels(entity_type) - set(dynamic))
+        if dynamic:
+            query += " SET n" + "".join(f":`{label}`" for label in dynamic)
+        if stale:
+            query += " REMOVE n" + "".join(f":`{label}`" for label in stale)
+        return query
+
+    def _resolve_entity_labels(
+        self, entity_type: str, dynamic_label: str = None
+    ) -> Tuple[Tuple[str, ...], Optional[str]]:
+        """Entity type plus the dynamic label if within budget, and the fallback property value"""
+        if dynamic_label and self._label_registry.needs_seed(entity_type):
+            self._seed_dynamic_labels(entity_type)
+        return self._label_registry.resolve(entity_type, dynamic_label)
+
+    def _seed_dynamic_labels(self, entity_type: str):
+        """Load the dynamic labels already in the graph into the label registry"""
+        labels: List[str] = []
+        try:
+            rows = self.read_query(
+                f"""
+                MATCH (n:{entity_type})
+                UNWIND labels(n) AS label
+                WITH DISTINCT label WHERE label <> $entity_type
+                RETURN label
+                """,
+                {"entity_type": entity_type},
+                use_cache=False,
+            )
+            labels = [row["label"] for row in rows]
+        except Exception as e:
+            handle_error(logger, e, f"Loading existing {entity_type} dynamic labels")
+        self._label_registry.seed(entity_type, labels)
+
+    def get_label_cardinality(self) -> Dict[str, Any]:
+        """Distinct dynamic labels per entity type in the graph against the label budget"""
+        fallback_property = self._label_registry.fallback_property
+        report: Dict[str, Any] = {}
+        for entity_type in get_entity_names():
+            try:
+                rows = self.read_query(
+                    f"""
+                    MATCH (n:{entity_type})
+                    WITH [label IN labels(n) WHERE label <> $entity_type] AS extra,
+                         n.{fallback_property} AS value
+                    RETURN count(*) AS nodes,
+                           size(collect(DISTINCT extra[0])) AS labels,
+                           sum(CASE WHEN size(extra) > 0 THEN 1 ELSE 0 END) AS labelled,
+                           sum(CASE WHEN size(extra) = 0 AND value IS NOT NULL THEN 1 ELSE 0 END)
+                               AS fallback
+                    """,
+                    {"entity_type": entity_type},
+                    use_cache=False,
+                )
+            except Exception as e:
+                handle_error(logger, e, f"Counting {entity_type} dynamic labels")
+                continue
+            row = rows[0] if rows else {}
+            budget = self._label_registry.budget(entity_type)
+            report[entity_type] = {
+                "nodes": row.get("nodes", 0),
+                "labels": row.get("labels", 0),
+                "labelled_nodes": row.get("labelled", 0),
+                "fallback_nodes": row.get("fallback", 0),
+                "budget": budget,
+                "over_budget": row.get("labels", 0) > budget,
+            }
+        return {"entities": report, "process": self._label_registry.report()}
+
+    def _record_ingestion_stats(self, entity_type: str, rows: int, batches: int, elapsed: float):
+        """Accumulate per-entity ingestion throughput"""
+        with self._ingestion_lock:
+            totals = self._ingestion_stats.setdefault(
+                entity_type, {"rows": 0, "batches": 0, "elapsed_seconds": 0.0}
+            )
+            totals["rows"] += rows
+            totals["batches"] += batches
+            totals["elapsed_seconds"] += elapsed
 
-        session.run(query, entity=meaningful_props)
+    def get_ingestion_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Rows per second per entity type across bulk loads in this process"""
+        return {
+            entity_type: {
+                **totals,
+                "elapsed_seconds": round(totals["elapsed_seconds"], 3),
+                "rows_per_second": round(totals["rows"] / totals["elapsed_seconds"], 1)
+                if totals["elapsed_seconds"]
+                else 0.0,
+            }
+            for entity_type, totals in self._ingestion_stats.items()
+        }
 
     def create_relationship(
         self, from_type: str, from_id: str, rel_type: str, to_type: str, to_id: str
     ) -> bool:
         """Create relationship using schema primary keys with validation"""
-        from_pk = get_entity_primary_key(from_type)
-        to_pk = get_entity_primary_key(to_type)
+        stats = self.bulk_create_relationships({(from_type, rel_type, to_type): [(from_id, to_id)]})
+        if stats["success"] and stats["linked"] > 0:
+            return True
 
-        if not from_pk or not to_pk:
-            logger.error(f"Missing primary keys for {from_type}-{to_type}")
-            return False
+        logger.warning(
+            f"No relationship created: {from_type}({from_id}) -[{rel_type}]-> {to_type}({to_id})"
+        )
+        return False
 
-        query = f"""
-        MATCH (from:{from_type} {{{from_pk}: $from_id}})
-        MATCH (to:{to_type} {{{to_pk}: $to_id}})
-        MERGE (from)-[r:{rel_type}]->(to)
-        RETURN count(r) AS relationships_created
-        """
+    def bulk_create_relationships(
+        self,
+        relationship_batches: Dict[Tuple[str, str, str], List[Tuple[Any, Any]]],
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Link (from_id, to_id) pairs per (from_type, rel_type, to_type) with UNWIND chunks"""
+        totals = {"pairs": 0, "linked": 0, "created": 0, "missing": 0, "success": True}
+        by_type: Dict[str, Dict[str, int]] = {}
+        chain_endpoints: Dict[str, List[Any]] = {}
+        batch_size = batch_size or get_batch_size()
 
         try:
-            with self.session() as session:
-                result = session.run(query, from_id=from_id, to_id=to_id)
-                record = result.single()
-
-                if record and record["relationships_created"] > 0:
-                    return True
-                else:
-                    logger.warning(
-                        f"No relationship created: {from_type}({from_id}) -[{rel_type}]-> {to_type}({to_id})"
-                    )
-                    return False
+            with self.session(WRITE_ACCESS) as session:
+                for (from_type, rel_type, to_type), pairs in relationship_batches.items():
+                    if not pairs:
+                        continue
+
+                    from_pk = get_entity_primary_key(from_type)
+                    to_pk = get_entity_primary_key(to_type)
+                    if not from_pk or not to_pk:
+                        logger.error(f"Missing primary keys for {from_type}-{to_type}")
+                        totals["success"] = False
+                        continue
+
+                    query = f"""
+                    UNWIND $pairs AS pair
+                    MATCH (from:{from_type} {{{from_pk}: pair.from_id}})
+                    MATCH (to:{to_type} {{{to_pk}: pair.to_id}})
+                    MERGE (from)-[r:{rel_type}]->(to)
+                    RETURN count(r) AS linked
+                    """
+
+                    counts = {"pairs": 0, "linked": 0, "created": 0, "missing": 0}
+                    for offset in range(0, len(pairs), batch_size):
+                        chunk = [
+                            {"from_id": from_id, "to_id": to_id}
+                            for from_id, to_id in pairs[offset : offset + batch_size]
+                        ]
+                        linked, created = session.execute_write(self._link_chunk, query, chunk)
+                        counts["pairs"] += len(chunk)
+                        counts["linked"] += linked
+                        counts["created"] += created
+                        counts["missing"] += max(len(chunk) - linked, 0)
+
+                    by_type[f"{from_type}-[{rel_type}]->{to_type}"] = counts
+                    chain_relationships = get_incident_chain_projection().chain_relationships
+                    if counts["created"] and rel_type in chain_relationships:
+                        chain_endpoints.setdefault(from_type, []).extend(
+                            from_id for from_id, _ in pairs
+                        )
+                    for key, value in counts.items():
+                        totals[key] += value
 
         except Exception as e:
-            handle_error(logger, e, f"Creating relationship {from_type}-[{rel_type}]->{to_type}")
-            return False
+            handle_error(logger, e, "Bulk creating relationships")
+            totals["success"] = False
+            totals["error"] = str(e)
+            totals["retryable"] = isinstance(e, RETRYABLE_ERRORS)
+
+        if totals["created"]:
+            self._query_cache.invalidate()
+            for from_type, from_ids in chain_endpoints.items():
+                self._refresh_incident_chains(from_type, from_ids)
+
+        if totals["missing"]:
+            logger.warning(
+                f"{totals['missing']} of {totals['pairs']} relationships skipped "
+                f"because an endpoint node was not found"
+            )
+
+        return {**totals, "by_type": by_type}
+
+    @staticmethod
+    def _link_chunk(tx, query: str, chunk: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Transaction function for one UNWIND relationship chunk"""
+        result = tx.run(query, pairs=chunk)
+        record = result.single()
+        summary = result.consume()
+        return (record["linked"] if record else 0), summary.counters.relationships_created
+
+    def rebuild_incident_chains(self) -> Dict[str, Any]:
+        """Materialise the IncidentChain projection for every ActionRequest"""
+        return get_incident_chain_projection().rebuild()
+
+    @contextmanager
+    def deferred_chain_maintenance(self):
+        """Suspend per-write chain refreshes during an import and rebuild once afterwards"""
+        previous = self._chain_maintenance_deferred
+        self._chain_maintenance_deferred = True
+        try:
+            yield self
+        finally:
+            self._chain_maintenance_deferred = previous
+        if not previous and get_incident_chain_projection().enabled:
+            self.rebuild_incident_chains()
+
+    def _refresh_incident_chains(self, entity_type: str, entity_ids: List[Any]):
+        """Keep IncidentChain nodes current after writes to workflow entities"""
+        if self._chain_maintenance_deferred or entity_type not in CHAIN_ENTITIES:
+            return
+        try:
+            get_incident_chain_projection().refresh_from(entity_type, entity_ids)
+        except Exception as e:
+            handle_error(logger, e, f"Refreshing incident chains for {entity_type}")
 
     def get_causal_intelligence_summary(self, facility_id: str = None) -> Dict[str, Any]:
         """Get summary of causal intelligence data for operational insights"""
@@ -252,7 +683,7 @@ class SimplifiedDatabase:
         LIMIT 20
         """
 
-        results = self.execute_query(query, **params)
+        results = self.execute_query(query, params)
 
         return {
             "causal_patterns": results,
@@ -262,70 +693,27 @@ class SimplifiedDatabase:
 
     def validate_data_integrity(self) -> Dict[str, Any]:
         """Validate overall database integrity"""
-        integrity_checks = {}
+        # Import here to avoid circular dependency
+        from mine_core.database.data_health import DataHealthEngine
 
-        try:
-            # Check entity counts
-            for entity_type in ["Facility", "ActionRequest", "Problem", "RootCause", "ActionPlan"]:
-                count_query = f"MATCH (n:{entity_type}) RETURN count(n) AS count"
-                result = self.execute_query(count_query)
-                integrity_checks[f"{entity_type}_count"] = result[0]["count"]
-
-            # Check relationship integrity
-            relationship_query = """
-            MATCH (ar:ActionRequest)-[:BELONGS_TO]->(f:Facility)
-            OPTIONAL MATCH (ar)<-[:IDENTIFIED_IN]-(p:Problem)
-            OPTIONAL MATCH (p)<-[:ANALYZES]-(rc:RootCause)
-            OPTIONAL MATCH (rc)<-[:RESOLVES]-(ap:ActionPlan)
-            RETURN count(ar) AS total_requests,
-                   count(p) AS problems_identified,
-                   count(rc) AS causes_analyzed,
-                   count(ap) AS plans_created
-            """
-            result = self.execute_query(relationship_query)
-            integrity_checks["workflow_integrity"] = result[0]
-
-            # Check causal intelligence completeness
-            causal_query = """
-            MATCH (rc:RootCause)
-            WITH count(rc) AS total_causes,
-                 count(CASE WHEN rc.root_cause IS NOT NULL AND rc.root_cause <> 'DATA_NOT_AVAILABLE' THEN 1 END) AS causes_with_data,
-                 count(CASE WHEN rc.root_cause_tail IS NOT NULL AND rc.root_cause_tail <> 'NOT_SPECIFIED' THEN 1 END) AS causes_with_tail
-            RETURN total_causes, causes_with_data, causes_with_tail,
-                   toFloat(causes_with_data) / total_causes AS primary_completeness,
-                   toFloat(causes_with_tail) / total_causes AS causal_intelligence_ratio
-            """
-            result = self.execute_query(causal_query)
-            integrity_checks["causal_intelligence"] = result[0] if result else {}
-
-        except Exception as e:
-            handle_error(logger, e, "integrity validation")
-            integrity_checks["validation_error"] = str(e)
-
-        return integrity_checks
+        return DataHealthEngine(self).integrity_report()
 
     def _is_missing_indicator(self, value: Any) -> bool:
         """Check if value is a missing data indicator"""
-        if isinstance(value, str):
-            return value in {"DATA_NOT_AVAILABLE", "NOT_SPECIFIED", "NOT_APPLICABLE"}
-        return False
+        return isinstance(value, str) and value in MISSING_DATA_CONTEXT
 
-    def optimize_performance(self) -> bool:
-        """Create performance optimization indexes"""
-        optimization_queries = [
-            "CREATE INDEX facility_id_index IF NOT EXISTS FOR (f:Facility) ON (f.facility_id)",
-            "CREATE INDEX action_request_number_index IF NOT EXISTS FOR (ar:ActionRequest) ON (ar.action_request_number)",
-            "CREATE INDEX root_cause_index IF NOT EXISTS FOR (rc:RootCause) ON (rc.root_cause)",
-            "CREATE INDEX categories_index IF NOT EXISTS FOR (ar:ActionRequest) ON (ar.categories)",
-            "CREATE INDEX stage_index IF NOT EXISTS FOR (ar:ActionRequest) ON (ar.stage)",
-        ]
+    def plan_indexes(self, await_timeout: Optional[int] = None) -> Dict[str, Any]:
+        """Apply the schema and query driven index plan and report what each index serves"""
+        return IndexPlanner().apply(self, await_timeout)
 
+    def optimize_performance(self) -> bool:
+        """Create planned constraints and indexes and wait for them to come online"""
         try:
-            with self.session() as session:
-                for query in optimization_queries:
-                    session.run(query)
-            logger.info("Performance optimization indexes created")
-            return True
+            report = self.plan_indexes()
+            logger.info(
+                f"Performance optimization: {len(report['indexes'])} constraints and indexes planned"
+            )
+            return report["success"]
         except Exception as e:
             handle_error(logger, e, "performance optimization")
             return False
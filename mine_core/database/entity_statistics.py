@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Entity Statistics - Count-Store Backed Label and Relationship Totals
+Exact counts, one count-store query each, cached until the next write generation.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from configs.environment import get_entity_statistics_config, get_schema
+from mine_core.database.query_cache import get_query_cache
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_TEMPLATE_LABEL = "_SchemaTemplate"
+
+
+class EntityStatistics:
+    """Label and relationship-type counts served from the Neo4j count store"""
+
+    def __init__(self, db=None, schema: Dict[str, Any] = None, max_age_seconds: float = None):
+        if db is None:
+            # Import here to avoid circular dependency
+            from mine_core.database.db import get_database
+
+            db = get_database()
+
+        self.db = db
+        self.schema = schema or get_schema()
+        self.max_age_seconds = (
+            max_age_seconds
+            if max_age_seconds is not None
+            else get_entity_statistics_config()["max_age_seconds"]
+        )
+        self.labels = [entity["name"] for entity in self.schema.get("entities", [])]
+        self.relationship_types = list(
+            dict.fromkeys(rel["type"] for rel in self.schema.get("relationships", []))
+        )
+
+        self._query_cache = get_query_cache()
+        self._lock = threading.Lock()
+        self._nodes: Dict[str, int] = {}
+        self._relationships: Dict[str, int] = {}
+        self._generation: Optional[int] = None
+        self._loaded_at = 0.0
+
+    def entity_count(self, label: str) -> int:
+        """Nodes carrying a label, excluding schema-template nodes"""
+        self._ensure_fresh()
+        if label not in self._nodes:
+            self._load(labels=[label], relationship_types=[])
+        return self._nodes.get(label, 0)
+
+    def relationship_count(self, rel_type: str) -> int:
+        """Relationships of one type"""
+        self._ensure_fresh()
+        if rel_type not in self._relationships:
+            self._load(labels=[], relationship_types=[rel_type])
+        return self._relationships.get(rel_type, 0)
+
+    def entity_counts(self, labels: Iterable[str] = None) -> Dict[str, int]:
+        """Counts for the given labels, or every entity in model_schema.json"""
+        labels = list(labels) if labels is not None else self.labels
+        self._ensure_fresh()
+        missing = [label for label in labels if label not in self._nodes]
+        if missing:
+            self._load(labels=missing, relationship_types=[])
+        return {label: self._nodes.get(label, 0) for label in labels}
+
+    def relationship_counts(self, relationship_types: Iterable[str] = None) -> Dict[str, int]:
+        """Counts for the given relationship types, or every schema relationship type"""
+        rel_types = (
+            list(relationship_types) if relationship_types is not None else self.relationship_types
+        )
+        self._ensure_fresh()
+        missing = [rel_type for rel_type in rel_types if rel_type not in self._relationships]
+        if missing:
+            self._load(labels=[], relationship_types=missing)
+        return {rel_type: self._relationships.get(rel_type, 0) for rel_type in rel_types}
+
+    def invalidate(self):
+        """Forget cached counts so the next call reloads them"""
+        with self._lock:
+            self._generation = None
+
+    def _ensure_fresh(self):
+        """Reload all schema counts after a write or once they exceed max age"""
+        with self._lock:
+            stale = (
+                self._generation != self._query_cache.generation
+                or time.monotonic() - self._loaded_at > self.max_age_seconds
+            )
+            if stale:
+                self._nodes.clear()
+                self._relationships.clear()
+        if stale:
+            self._load(self.labels, self.relationship_types, reset=True)
+
+    def _load(self, labels: List[str], relationship_types: List[str], reset: bool = False):
+        """Fetch counts with one statement per label and relationship type"""
+        generation = self._query_cache.generation
+        # A lone MATCH ... RETURN count() per statement is the shape the planner answers from
+        # the count store (NodeCountFromCountStore / RelationshipCountFromCountStore)
+        nodes = {
+            label: self._count(f"MATCH (n:`{label}`) RETURN count(n) AS count") for label in labels
+        }
+        relationships = {
+            rel_type: self._count(f"MATCH ()-[r:`{rel_type}`]->() RETURN count(r) AS count")
+            for rel_type in relationship_types
+        }
+
+        templates: Dict[str, int] = {}
+        if labels:
+            # Template nodes are few; subtracting them keeps the label counts on the count store
+            rows = self.db.read_query(
+                f"MATCH (t:{SCHEMA_TEMPLATE_LABEL}) UNWIND labels(t) AS name "
+                f"RETURN name, count(*) AS count",
+                use_cache=False,
+            )
+            templates = {row["name"]: row["count"] for row in rows}
+
+        with self._lock:
+            for label, count in nodes.items():
+                self._nodes[label] = max(count - templates.get(label, 0), 0)
+            self._relationships.update(relationships)
+            if reset:
+                self._generation = generation
+                self._loaded_at = time.monotonic()
+
+    def _count(self, query: str) -> int:
+        """Run a single-count statement"""
+        rows = self.db.read_query(query, use_cache=False)
+        return rows[0]["count"] if rows else 0
+
+
+# Singleton instance
+_entity_statistics = None
+
+
+def get_entity_statistics() -> EntityStatistics:
+    """Get singleton entity statistics bound to the shared database"""
+    global _entity_statistics
+    if _entity_statistics is None:
+        _entity_statistics = EntityStatistics()
+    return _entity_statistics
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Full-Text Search - Index-Backed Rewriting of CONTAINS Search Predicates
+Replaces toLower(x.prop) CONTAINS toLower($search_term) with db.index.fulltext.queryNodes.
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from configs.environment import get_graph_search_config
+
+logger = logging.getLogger(__name__)
+
+_SEARCH_PREDICATE_PATTERN = re.compile(
+    r"toLower\(\s*(\w+)\.(\w+)\s*\)\s+CONTAINS\s+toLower\(\s*\$search_term\s*\)", re.IGNORECASE
+)
+_CLAUSE_PATTERN = re.compile(
+    r"\b(OPTIONAL\s+MATCH|MATCH|WHERE|(?<!STARTS )(?<!ENDS )WITH|RETURN|ORDER\s+BY|UNWIND|CALL|SKIP|LIMIT|UNION)\b",
+    re.IGNORECASE,
+)
+_LABELED_NODE_PATTERN = re.compile(r"\((\w+):(\w+)")
+_AGGREGATE_PATTERN = re.compile(
+    r"\b(count|collect|sum|avg|min|max|percentileCont|percentileDisc|stDev)\s*\(", re.IGNORECASE
+)
+_COMMENT_PATTERN = re.compile(r"//[^\n]*")
+_CONJUNCT_TOKEN_PATTERN = re.compile(
+    r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|[()]|\bAND\b", re.IGNORECASE
+)
+_ANONYMOUS_ELEMENT_PATTERN = re.compile(r"\((?=\s*[:){])|\[(?=\s*[:*\]{])|(?<=\))\s*(<?)--(>?)")
+_PATTERN_VARIABLE_PATTERN = re.compile(
+    r"\b(\w+)\s*=\s*(?=(?:\w+\s*\()?\()|\(\s*(\w+)\s*[:){]|\[\s*(\w+)\s*[:*\]{]"
+)
+
+# Availability checks are repeated at most this often while indexes are missing
+_AVAILABILITY_RECHECK_SECONDS = 60
+
+
+def _top_level_conjuncts(text: str, start: int, end: int) -> List[Tuple[int, int]]:
+    """Spans of the AND-separated parts of text[start:end] outside parentheses and literals"""
+    conjuncts, depth, left = [], 0, start
+    for token in _CONJUNCT_TOKEN_PATTERN.finditer(text, start, end):
+        value = token.group(0)
+        if value == "(":
+            depth += 1
+        elif value == ")":
+            depth -= 1
+        elif value.upper() == "AND" and depth == 0:
+            conjuncts.append((left, token.start()))
+            left = token.end()
+    conjuncts.append((left, end))
+    return conjuncts
+
+
+def _match_segments(text: str) -> List[Tuple[int, int]]:
+    """Spans of the pattern part of every MATCH clause"""
+    clauses = [(m.start(), m.end(), m.group(1).upper()) for m in _CLAUSE_PATTERN.finditer(text)]
+    return [
+        (clause_end, clauses[i + 1][0] if i + 1 < len(clauses) else len(text))
+        for i, (_, clause_end, keyword) in enumerate(clauses)
+        if keyword.endswith("MATCH")
+    ]
+
+
+def _name_pattern_elements(text: str) -> Tuple[str, List[str]]:
+    """Name anonymous nodes and relationships in MATCH patterns; returns the added names"""
+    named: List[str] = []
+
+    def name(match: "re.Match") -> str:
+        element = match.group(0)
+        named.append(f"ft_{'node' if element == '(' else 'rel'}_{len(named)}")
+        if element in ("(", "["):
+            return element + named[-1]
+        # Bare arrows such as --> become -[name]->
+        return f"{match.group(1)}-[{named[-1]}]-{match.group(2)}"
+
+    parts, position = [], 0
+    for start, end in _match_segments(text):
+        parts.append(text[position:start])
+        parts.append(_ANONYMOUS_ELEMENT_PATTERN.sub(name, text[start:end]))
+        position = end
+    parts.append(text[position:])
+    return "".join(parts), named
+
+
+def _pattern_variables(text: str) -> List[str]:
+    """Path, node and relationship variables bound by MATCH patterns, in order of appearance"""
+    variables: List[str] = []
+    for start, end in _match_segments(text):
+        for match in _PATTERN_VARIABLE_PATTERN.finditer(text, start, end):
+            var = next(group for group in match.groups() if group)
+            if var not in variables:
+                variables.append(var)
+    return variables
+
+
+@dataclass
+class RewrittenQuery:
+    """Index-backed query text plus the Lucene parameters it expects"""
+
+    text: str
+    lucene_fields: Dict[str, str] = field(default_factory=dict)
+    scored: bool = False
+    limited: bool = True
+
+
+class FullTextSearch:
+    """Full-text index definitions and CONTAINS-to-queryNodes query rewriting"""
+
+    def __init__(self, config: Dict[str, Any] = None):
+        config = config or get_graph_search_config().get("fulltext_search", {})
+        self.enabled = config.get("enabled", False)
+        self.default_mode = config.get("default_mode", "contains") if self.enabled else "contains"
+        self.hits_per_predicate = config.get("hits_per_predicate", 500)
+        self.indexes = config.get("indexes", {})
+
+        self._index_by_property = {
+            (definition["label"], prop): name
+            for name, definition in self.indexes.items()
+            for prop in definition.get("properties", [])
+        }
+        self._rewrite_cache: Dict[str, Optional[RewrittenQuery]] = {}
+        self._available: Optional[bool] = None
+        self._checked_at = 0.0
+
+    def is_available(self, query_manager) -> bool:
+        """Check that every configured full-text index exists and is online"""
+        if not self.enabled or not self.indexes:
+            return False
+        if self._available or time.monotonic() - self._checked_at < _AVAILABILITY_RECHECK_SECONDS:
+            return bool(self._available)
+
+        result = query_manager.read_query(
+            "SHOW FULLTEXT INDEXES YIELD name, state RETURN name, state", use_cache=False
+        )
+        online = {row["name"] for row in result.data if row.get("state") == "ONLINE"}
+        self._available = result.success and set(self.indexes) <= online
+        self._checked_at = time.monotonic()
+
+        if not self._available:
+            logger.warning("Full-text indexes not online; falling back to CONTAINS search")
+        return self._available
+
+    def reset_availability(self):
+        """Re-check the indexes on the next is_available call, e.g. after an index error"""
+        self._available = None
+        self._checked_at = 0.0
+
+    def rewrite(self, query: str) -> Optional[RewrittenQuery]:
+        """Rewrite indexed search predicates, or None to keep the original CONTAINS query"""
+        if query not in self._rewrite_cache:
+            self._rewrite_cache[query] = self._rewrite(query)
+        return self._rewrite_cache[query]
+
+    def build_params(self, rewritten: RewrittenQuery, search_term: str) -> Optional[Dict[str, Any]]:
+        """Lucene prefix queries per rewritten predicate, or None for an untokenisable term"""
+        tokens = re.findall(r"\w+", search_term.lower())
+        if not tokens:
+            return None
+
+        terms = " AND ".join(f"{token}*" for token in tokens)
+        params: Dict[str, Any] = {
+            param: f"{prop}:({terms})" for param, prop in rewritten.lucene_fields.items()
+        }
+        if rewritten.limited:
+            params["fulltext_limit"] = self.hits_per_predicate
+        return params
+
+    def _rewrite(self, query: str) -> Optional[RewrittenQuery]:
+        """Build the index-anchored query text, or None when the predicates cannot all be anchored"""
+        text = _COMMENT_PATTERN.sub("", query).strip()
+        clauses = [(m.start(), m.group(1).upper().split()[0]) for m in _CLAUSE_PATTERN.finditer(text)]
+        if any(keyword == "UNION" for _, keyword in clauses):
+            return None
+
+        anchor = self._find_anchor(text, clauses)
+        if anchor is None:
+            return None
+        head_end, units = anchor
+        head, tail = text[:head_end], text[head_end:]
+
+        # Counts and rates must see every hit, and without a LIMIT so must plain listings
+        keywords = [keyword for _, keyword in clauses]
+        limited = "LIMIT" in keywords and not _AGGREGATE_PATTERN.search(text)
+        options = ", {limit: $fulltext_limit}" if limited else ""
+
+        calls, lucene_fields = [], {}
+        for (var, prop), unit in units.items():
+            name = f"ft_{var}_{prop}"
+            lucene_fields[f"{name}_query"] = prop
+            calls.append(
+                f"CALL db.index.fulltext.queryNodes('{unit['index']}', ${name}_query{options}) "
+                f"YIELD node AS {var}, score AS ft_score"
+            )
+
+        tail, scored = self._append_relevance_score(tail, ["ft_score"])
+        if len(units) == 1:
+            spans = next(iter(units.values()))["spans"]
+            text = f"{calls[0]}\n{self._replace_spans(head, spans, 'true')} {tail.lstrip()}"
+        else:
+            text = self._union_anchored(head, tail, list(units.values()), calls)
+        return RewrittenQuery(
+            text=text.strip(),
+            lucene_fields=lucene_fields,
+            scored=scored,
+            limited=limited,
+        )
+
+    def _find_anchor(
+        self, text: str, clauses: List[Tuple[int, str]]
+    ) -> Optional[Tuple[int, Dict[Tuple[str, str], Dict[str, Any]]]]:
+        """First leading WHERE with a conjunct made only of indexed search predicates
+
+        Returns where that WHERE ends and its predicates grouped by variable and property.
+        Every row the conjunct accepts matches at least one of them, so a union of index
+        lookups over those predicates finds every row the original query returns.
+        """
+        labels = dict(_LABELED_NODE_PATTERN.findall(text))
+        for index, (position, keyword) in enumerate(clauses):
+            # Only required MATCH clauses may precede, so every predicate variable is anchorable
+            if keyword not in ("MATCH", "WHERE"):
+                return None
+            if keyword != "WHERE" or not index or clauses[index - 1][1] != "MATCH":
+                continue
+
+            where_end = clauses[index + 1][0] if index + 1 < len(clauses) else len(text)
+            for start, end in _top_level_conjuncts(text, position + len("WHERE"), where_end):
+                matches = list(_SEARCH_PREDICATE_PATTERN.finditer(text, start, end))
+                residue = "".join(
+                    text[left:right]
+                    for left, right in zip(
+                        [start] + [m.end() for m in matches], [m.start() for m in matches] + [end]
+                    )
+                )
+                if not matches or re.sub(r"\b(?:AND|OR)\b|[\s()]", "", residue, flags=re.I):
+                    continue
+
+                units: Dict[Tuple[str, str], Dict[str, Any]] = {}
+                for match in matches:
+                    var, prop = match.group(1), match.group(2)
+                    index_name = self._index_by_property.get((labels.get(var), prop))
+                    if not index_name:
+                        break
+                    unit = units.setdefault((var, prop), {"index": index_name, "spans": []})
+                    unit["spans"].append(match.span())
+                else:
+                    return where_end, units
+        return None
+
+    @classmethod
+    def _union_anchored(
+        cls, head: str, tail: str, units: List[Dict[str, Any]], calls: List[str]
+    ) -> str:
+        """One index-anchored branch per predicate, merged back into one row per binding"""
+        markers = [f"\x00{i}\x00" for i in range(len(units))]
+        template = head
+        for marker, unit in sorted(
+            zip(markers, units), key=lambda item: item[1]["spans"][0], reverse=True
+        ):
+            template = cls._replace_spans(template, unit["spans"], marker)
+        originals = {marker: head[slice(*unit["spans"][0])] for marker, unit in zip(markers, units)}
+
+        # Anonymous pattern elements get names so that merging the branches only collapses
+        # rows that are the very same binding, e.g. not parallel relationships
+        template, named = _name_pattern_elements(template)
+        variables = _pattern_variables(template)
+        projection = ", ".join(variables)
+
+        branches = []
+        for marker, call in zip(markers, calls):
+            branch = template
+            for other, original in originals.items():
+                branch = branch.replace(other, "true" if other == marker else original)
+            branches.append(f"  {call}\n  {branch}\n  RETURN {projection}, ft_score")
+
+        text = "CALL {\n" + "\n  UNION ALL\n".join(branches) + "\n}\n"
+        text += f"WITH {projection}, max(ft_score) AS ft_score\n"
+        if named:
+            kept = ", ".join(var for var in variables if var not in named)
+            text += f"WITH {kept}, ft_score\n"
+        return text + tail.lstrip()
+
+    @staticmethod
+    def _replace_spans(text: str, spans: List[Tuple[int, int]], replacement: str) -> str:
+        """Replace each (start, end) span of text, last first so earlier offsets stay valid"""
+        for start, end in sorted(spans, reverse=True):
+            text = text[:start] + replacement + text[end:]
+        return text
+
+    @staticmethod
+    def _append_relevance_score(text: str, score_terms: List[str]) -> Tuple[str, bool]:
+        """Add relevance_score to a plain, non-aggregating RETURN"""
+        clauses = [(m.start(), m.group(1).upper()) for m in _CLAUSE_PATTERN.finditer(text)]
+        keywords = [keyword.split()[0] for _, keyword in clauses]
+        if "WITH" in keywords or keywords.count("RETURN") != 1:
+            return text, False
+
+        return_index = keywords.index("RETURN")
+        return_start = clauses[return_index][0]
+        return_end = clauses[return_index + 1][0] if return_index + 1 < len(clauses) else len(text)
+        if _AGGREGATE_PATTERN.search(text[return_start:return_end]):
+            return text, False
+
+        score_expr = " + ".join(score_terms)
+        projection = text[return_start:return_end].rstrip()
+        tail = text[return_end:]
+
+        if "ORDER" in keywords[return_index + 1 :]:
+            tail = re.sub(r"ORDER\s+BY\s+", "ORDER BY relevance_score DESC, ", tail, count=1, flags=re.I)
+        else:
+            tail = f" ORDER BY relevance_score DESC {tail.lstrip()}"
+
+        rewritten = f"{text[:return_start]}{projection}, ({score_expr}) AS relevance_score {tail.lstrip()}"
+        return rewritten, True
+
+
+# Singleton instance
+_fulltext_search = None
+
+
+def get_fulltext_search() -> FullTextSearch:
+    """Get singleton full-text search helper configured from graph_search_config.json"""
+    global _fulltext_search
+    if _fulltext_search is None:
+        _fulltext_search = FullTextSearch()
+    return _fulltext_search
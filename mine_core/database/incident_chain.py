@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Incident Chain Projection - Materialised Five-Hop Workflow Chains
+One denormalised IncidentChain node per ActionRequest, rebuilt after import and refreshed on writes.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from configs.environment import (
+    get_entity_primary_key,
+    get_incident_chain_config,
+    get_schema_registry,
+)
+from mine_core.shared.common import handle_error
+
+logger = logging.getLogger(__name__)
+
+CHAIN_LABEL = "IncidentChain"
+CHAIN_RELATIONSHIP = "HAS_INCIDENT_CHAIN"
+
+# Workflow order from the request back through to its verification
+CHAIN_ENTITIES = ["ActionRequest", "Problem", "RootCause", "ActionPlan", "Verification"]
+
+# Properties returned by get_incident_chain, in its column order
+CHAIN_FIELDS = [
+    "request_id",
+    "request_number",
+    "title",
+    "date",
+    "stage",
+    "facility_id",
+    "problem_id",
+    "what_happened",
+    "requirement",
+    "cause_id",
+    "primary_cause",
+    "secondary_cause",
+    "objective_evidence",
+    "plan_id",
+    "action_plan",
+    "recommended_action",
+    "due_date",
+    "complete",
+    "completion_date",
+    "verification_id",
+    "is_effective",
+    "eval_comment",
+    "verification_date",
+]
+
+# Projection state is re-read at most this often while it is missing
+_BUILT_RECHECK_SECONDS = 60
+
+
+class IncidentChainProjection:
+    """Builds and incrementally maintains the IncidentChain projection"""
+
+    def __init__(self, db=None):
+        if db is None:
+            # Import here to avoid circular dependency
+            from mine_core.database.db import get_database
+
+            db = get_database()
+
+        config = get_incident_chain_config()
+        self.db = db
+        self.enabled = config["enabled"]
+        self.maintain_on_write = config["maintain_on_write"]
+        self.batch_size = config["batch_size"]
+
+        registry = get_schema_registry()
+        self.belongs_to = registry.relationship_type("ActionRequest", "Facility", "BELONGS_TO")
+        self.chain_rels = [
+            registry.relationship_type(child, parent)
+            for parent, child in zip(CHAIN_ENTITIES, CHAIN_ENTITIES[1:])
+        ]
+
+        self.chain_relationships = set(self.chain_rels) | {self.belongs_to}
+
+        self._built: Optional[bool] = None
+        self._checked_at = 0.0
+
+    def rebuild(self) -> Dict[str, Any]:
+        """Project every ActionRequest and drop chains whose request no longer exists"""
+        started = time.perf_counter()
+        self.db.execute_query(
+            f"CREATE CONSTRAINT incident_chain_request_id_unique IF NOT EXISTS "
+            f"FOR (ic:{CHAIN_LABEL}) REQUIRE ic.request_id IS UNIQUE",
+            use_cache=False,
+        )
+
+        request_ids = [
+            row["request_id"]
+            for row in self.db.execute_query(
+                "MATCH (ar:ActionRequest) RETURN ar.actionrequest_id AS request_id", use_cache=False
+            )
+        ]
+        refreshed = self.refresh(request_ids)
+
+        removed = self.db.execute_query(
+            f"""
+            MATCH (ic:{CHAIN_LABEL})
+            WHERE NOT EXISTS {{ MATCH (:ActionRequest {{actionrequest_id: ic.request_id}}) }}
+            DETACH DELETE ic
+            RETURN count(*) AS removed
+            """
+        )
+
+        self._built = True
+        stats = {
+            "chains": refreshed,
+            "removed": removed[0]["removed"] if removed else 0,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        }
+        logger.info(f"Incident chain projection rebuilt: {stats}")
+        return stats
+
+    def refresh(self, request_ids: Iterable[str]) -> int:
+        """Recompute the projection for the given ActionRequest ids"""
+        request_ids = [request_id for request_id in dict.fromkeys(request_ids) if request_id]
+        refreshed = 0
+        for offset in range(0, len(request_ids), self.batch_size):
+            result = self.db.execute_query(
+                self._projection_query(), {"ids": request_ids[offset : offset + self.batch_size]}
+            )
+            refreshed += result[0]["refreshed"] if result else 0
+        return refreshed
+
+    def refresh_from(self, entity_type: str, entity_ids: List[Any]) -> int:
+        """Refresh chains reachable from written chain entities"""
+        if not (self.enabled and self.maintain_on_write and entity_ids):
+            return 0
+        if entity_type not in CHAIN_ENTITIES or not self.is_built():
+            return 0
+
+        primary_key = get_entity_primary_key(entity_type)
+        hops = CHAIN_ENTITIES.index(entity_type)
+        rows = self.db.execute_query(
+            f"""
+            MATCH (n:{entity_type}) WHERE n.{primary_key} IN $ids
+            MATCH (n)-[:{'|'.join(self.chain_rels)}*{hops}]->(ar:ActionRequest)
+            RETURN DISTINCT ar.actionrequest_id AS request_id
+            """,
+            {"ids": entity_ids},
+            use_cache=False,
+        )
+        return self.refresh(row["request_id"] for row in rows)
+
+    def is_built(self) -> bool:
+        """Whether the projection has been materialised in this database"""
+        if self._built or time.monotonic() - self._checked_at < _BUILT_RECHECK_SECONDS:
+            return bool(self._built)
+
+        try:
+            rows = self.db.execute_query(
+                f"RETURN EXISTS {{ MATCH (:{CHAIN_LABEL}) }} AS built", use_cache=False
+            )
+            self._built = bool(rows and rows[0]["built"])
+        except Exception as e:
+            handle_error(logger, e, "incident chain projection check")
+            self._built = False
+        self._checked_at = time.monotonic()
+        return self._built
+
+    def _projection_query(self) -> str:
+        """MERGE one IncidentChain per request from its most complete workflow path"""
+        identified, analyzes, resolves, validates = self.chain_rels
+        return f"""
+        MATCH (ar:ActionRequest) WHERE ar.actionrequest_id IN $ids
+        OPTIONAL MATCH (ar)-[:{self.belongs_to}]->(f:Facility)
+        OPTIONAL MATCH (ar)<-[:{identified}]-(p:Problem)
+        OPTIONAL MATCH (p)<-[:{analyzes}]-(rc:RootCause)
+        OPTIONAL MATCH (rc)<-[:{resolves}]-(ap:ActionPlan)
+        OPTIONAL MATCH (ap)<-[:{validates}]-(v:Verification)
+        WITH ar, f, p, rc, ap, v,
+             CASE
+                WHEN v IS NOT NULL THEN 4
+                WHEN ap IS NOT NULL THEN 3
+                WHEN rc IS NOT NULL THEN 2
+                WHEN p IS NOT NULL THEN 1
+                ELSE 0
+             END AS depth
+        ORDER BY depth DESC
+        WITH ar,
+             head(collect(f)) AS f,
+             head(collect({{p: p, rc: rc, ap: ap, v: v, depth: depth}})) AS chain,
+             count(DISTINCT p) AS problem_count,
+             count(DISTINCT rc) AS cause_count,
+             count(DISTINCT ap) AS plan_count,
+             count(DISTINCT v) AS verification_count,
+             count(DISTINCT CASE WHEN toLower(toString(v.is_action_plan_effective)) IN ['true', 'yes']
+                                 THEN v END) AS effective_count
+        MERGE (ic:{CHAIN_LABEL} {{request_id: ar.actionrequest_id}})
+        SET ic += {{
+            request_number: ar.action_request_number,
+            title: ar.title,
+            date: ar.initiation_date,
+            stage: ar.stage,
+            categories: ar.categories,
+            facility_id: f.facility_id,
+            facility_name: f.facility_name,
+            problem_id: chain.p.problem_id,
+            what_happened: chain.p.what_happened,
+            requirement: chain.p.requirement,
+            cause_id: chain.rc.rootcause_id,
+            primary_cause: chain.rc.root_cause,
+            secondary_cause: chain.rc.root_cause_tail_extraction,
+            objective_evidence: chain.rc.objective_evidence,
+            plan_id: chain.ap.actionplan_id,
+            action_plan: chain.ap.action_plan,
+            recommended_action: chain.ap.recommended_action,
+            due_date: chain.ap.due_date,
+            complete: chain.ap.complete,
+            completion_date: chain.ap.completion_date,
+            verification_id: chain.v.verification_id,
+            is_effective: chain.v.is_action_plan_effective,
+            eval_comment: chain.v.action_plan_eval_comment,
+            verification_date: chain.v.action_plan_verification_date,
+            chain_depth: chain.depth,
+            chain_complete: chain.depth = 4,
+            problem_count: problem_count,
+            cause_count: cause_count,
+            plan_count: plan_count,
+            verification_count: verification_count,
+            effective_count: effective_count,
+            refreshed_at: datetime()
+        }}
+        MERGE (ar)-[:{CHAIN_RELATIONSHIP}]->(ic)
+        RETURN count(ic) AS refreshed
+        """
+
+
+# Singleton instance
+_incident_chain_projection = None
+
+
+def get_incident_chain_projection() -> IncidentChainProjection:
+    """Get singleton incident chain projection bound to the shared database"""
+    global _incident_chain_projection
+    if _incident_chain_projection is None:
+        _incident_chain_projection = IncidentChainProjection()
+    return _incident_chain_projection
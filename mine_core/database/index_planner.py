@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Index Planner - Schema and Query Driven Constraints and Indexes
+Derives uniqueness constraints from model_schema.json and indexes from search queries.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from configs.environment import get_dynamic_label_config, get_graph_search_config, get_schema
+from mine_core.database.query_templates import get_template_compiler
+from mine_core.shared.common import handle_error
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AWAIT_TIMEOUT_SECONDS = 300
+
+_WHERE_SEGMENT_PATTERN = re.compile(
+    r"\bWHERE\b(.*?)(?=\b(?:OPTIONAL\s+MATCH|MATCH|(?<!STARTS )(?<!ENDS )WITH|RETURN|ORDER\s+BY|UNWIND|CALL|UNION)\b|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_LABELED_NODE_PATTERN = re.compile(r"\((\w+):(\w+)")
+_INLINE_PROPERTY_PATTERN = re.compile(r"\((\w+):(\w+)\s*\{\s*(\w+)\s*:")
+_RANGE_PREDICATE_PATTERN = re.compile(
+    r"\b(\w+)\.(\w+)\s*(?:=|<>|<=|>=|<|>|IN\b|STARTS\s+WITH\b)", re.IGNORECASE
+)
+_EXISTENCE_PREDICATE_PATTERN = re.compile(r"\b(\w+)\.(\w+)\s+IS\s+(?:NOT\s+)?NULL\b", re.IGNORECASE)
+_TEXT_PREDICATE_PATTERN = re.compile(r"\b(\w+)\.(\w+)\s+(?:CONTAINS|ENDS\s+WITH)\b", re.IGNORECASE)
+_LOWERED_CONTAINS_PATTERN = re.compile(
+    r"toLower\(\s*(\w+)\.(\w+)\s*\)\s+CONTAINS\b", re.IGNORECASE
+)
+
+
+@dataclass
+class IndexSpec:
+    """Planned constraint or index and the queries that filter on it"""
+
+    name: str
+    kind: str  # uniqueness | range | text | fulltext
+    label: str
+    properties: Tuple[str, ...]
+    serves: List[str] = field(default_factory=list)
+
+    @property
+    def statement(self) -> str:
+        """Idempotent DDL statement for this spec"""
+        if self.kind == "uniqueness":
+            return (
+                f"CREATE CONSTRAINT {self.name} IF NOT EXISTS "
+                f"FOR (n:{self.label}) REQUIRE n.{self.properties[0]} IS UNIQUE"
+            )
+        if self.kind == "fulltext":
+            properties = ", ".join(f"n.{prop}" for prop in self.properties)
+            return (
+                f"CREATE FULLTEXT INDEX {self.name} IF NOT EXISTS "
+                f"FOR (n:{self.label}) ON EACH [{properties}]"
+            )
+        index_type = "TEXT INDEX" if self.kind == "text" else "INDEX"
+        return (
+            f"CREATE {index_type} {self.name} IF NOT EXISTS "
+            f"FOR (n:{self.label}) ON (n.{self.properties[0]})"
+        )
+
+
+class IndexPlanner:
+    """Plans constraints from primary keys and indexes from filtered query properties"""
+
+    def __init__(
+        self,
+        schema: Dict[str, Any] = None,
+        search_config: Dict[str, Any] = None,
+        label_config: Dict[str, Any] = None,
+    ):
+        self.schema = schema or get_schema()
+        self.search_config = search_config or get_graph_search_config()
+        self.label_config = label_config or get_dynamic_label_config()
+
+    def plan(self) -> List[IndexSpec]:
+        """Build the full plan: constraints, range/text indexes, then full-text indexes"""
+        specs: Dict[Tuple[str, str, Tuple[str, ...]], IndexSpec] = {}
+        primary_keys = set()
+        property_types = {}
+
+        for entity in self.schema.get("entities", []):
+            for prop, definition in entity.get("properties", {}).items():
+                property_types[(entity["name"], prop)] = definition.get("type")
+                if definition.get("primary_key"):
+                    primary_keys.add((entity["name"], prop))
+                    self._add_spec(specs, "uniqueness", entity["name"], (prop,))
+
+            # Dynamic labels over the budget are looked up through this property instead
+            if self.label_config["enabled"] and entity.get("dynamic_labeling", {}).get("enabled"):
+                self._add_spec(
+                    specs, "range", entity["name"], (self.label_config["fallback_property"],)
+                )
+
+        fulltext_indexes = self.search_config.get("fulltext_search", {}).get("indexes", {})
+        fulltext_by_property = {
+            (definition["label"], prop): name
+            for name, definition in fulltext_indexes.items()
+            for prop in definition.get("properties", [])
+        }
+        for name, definition in fulltext_indexes.items():
+            specs[("fulltext", definition["label"], tuple(definition["properties"]))] = IndexSpec(
+                name=name,
+                kind="fulltext",
+                label=definition["label"],
+                properties=tuple(definition["properties"]),
+            )
+
+        for query_id, query in self._iter_queries():
+            for kind, label, prop in self._filtered_properties(query):
+                if kind == "fulltext":
+                    index_name = fulltext_by_property.get((label, prop))
+                    if index_name:
+                        spec = specs[("fulltext", label, tuple(fulltext_indexes[index_name]["properties"]))]
+                        self._record_use(spec, query_id)
+                    continue
+
+                if (label, prop) in primary_keys:
+                    kind = "uniqueness"
+                elif property_types.get((label, prop)) == "text":
+                    # Free-text values can exceed the range index key limit
+                    if kind == "existence":
+                        continue
+                    kind = "text"
+                elif kind == "existence":
+                    kind = "range"
+                spec = self._add_spec(specs, kind, label, (prop,))
+                self._record_use(spec, query_id)
+
+        order = {"uniqueness": 0, "range": 1, "text": 2, "fulltext": 3}
+        return sorted(specs.values(), key=lambda spec: (order[spec.kind], spec.name))
+
+    def apply(self, db, await_timeout: Optional[int] = None) -> Dict[str, Any]:
+        """Create planned schema objects, wait for them to come online and report usage"""
+        plan = self.plan()
+        report: Dict[str, Any] = {"created": [], "dropped": [], "failed": [], "indexes": []}
+
+        try:
+            existing = db.execute_query(
+                "SHOW INDEXES YIELD name, type, labelsOrTypes, properties, owningConstraint "
+                "RETURN name, type, labelsOrTypes, properties, owningConstraint",
+                use_cache=False,
+            )
+        except Exception as e:
+            handle_error(logger, e, "listing existing indexes")
+            existing = []
+
+        for spec in plan:
+            if spec.kind == "uniqueness":
+                # A plain index on the key blocks constraint creation; the constraint replaces it
+                for index in existing:
+                    if (
+                        index.get("type") == "RANGE"
+                        and not index.get("owningConstraint")
+                        and index.get("labelsOrTypes") == [spec.label]
+                        and tuple(index.get("properties") or ()) == spec.properties
+                    ):
+                        try:
+                            db.execute_query(f"DROP INDEX {index['name']} IF EXISTS", use_cache=False)
+                            report["dropped"].append(index["name"])
+                        except Exception as e:
+                            handle_error(logger, e, f"dropping index {index['name']}")
+
+            try:
+                db.execute_query(spec.statement, use_cache=False)
+                report["created"].append(spec.name)
+            except Exception as e:
+                handle_error(logger, e, f"creating {spec.kind} index {spec.name}")
+                report["failed"].append({"name": spec.name, "error": str(e)})
+
+        states = self._await_online(db, await_timeout or DEFAULT_AWAIT_TIMEOUT_SECONDS)
+        for spec in plan:
+            report["indexes"].append(
+                {
+                    "name": spec.name,
+                    "kind": spec.kind,
+                    "label": spec.label,
+                    "properties": list(spec.properties),
+                    "state": states.get(spec.name, "UNKNOWN"),
+                    "serves": spec.serves,
+                }
+            )
+
+        report["success"] = not report["failed"] and all(
+            entry["state"] == "ONLINE" for entry in report["indexes"]
+        )
+        logger.info(
+            f"Index plan applied: {len(report['created'])} statements, "
+            f"{len(report['failed'])} failed, {len(report['dropped'])} superseded indexes dropped"
+        )
+        return report
+
+    def _await_online(self, db, timeout: int) -> Dict[str, str]:
+        """Block until indexes finish populating, then return their states by name"""
+        try:
+            db.execute_query(f"CALL db.awaitIndexes({int(timeout)})", use_cache=False)
+        except Exception as e:
+            handle_error(logger, e, "waiting for indexes")
+
+        try:
+            rows = db.execute_query(
+                "SHOW INDEXES YIELD name, state, owningConstraint RETURN name, state, owningConstraint",
+                use_cache=False,
+            )
+        except Exception as e:
+            handle_error(logger, e, "reading index states")
+            return {}
+
+        states = {}
+        for row in rows:
+            states[row["name"]] = row["state"]
+            # Uniqueness constraints are reported under their backing index
+            if row.get("owningConstraint"):
+                states[row["owningConstraint"]] = row["state"]
+        return states
+
+    def _iter_queries(self) -> Iterator[Tuple[str, str]]:
+        """Yield (query id, query text) for graph search queries and cypher templates"""
+        for key, value in self.search_config.get("search_queries", {}).items():
+            if isinstance(value, str):
+                yield f"graph_search:{key}", value
+            elif isinstance(value, dict):
+                for sub_key, query in value.items():
+                    if sub_key != "description" and isinstance(query, str):
+                        yield f"graph_search:{key}.{sub_key}", query
+
+        compiler = get_template_compiler()
+        for template_name in compiler.template_names():
+            yield f"template:{template_name[:-len('.cypher')]}", compiler.compile(template_name)
+
+    @staticmethod
+    def _filtered_properties(query: str) -> List[Tuple[str, str, str]]:
+        """(kind, label, property) for each property the query filters on"""
+        labels = dict(_LABELED_NODE_PATTERN.findall(query))
+        found = []
+
+        for var, label, prop in _INLINE_PROPERTY_PATTERN.findall(query):
+            found.append(("range", label, prop))
+
+        for segment in _WHERE_SEGMENT_PATTERN.findall(query):
+            for pattern, kind in (
+                (_LOWERED_CONTAINS_PATTERN, "fulltext"),
+                (_TEXT_PREDICATE_PATTERN, "text"),
+                (_RANGE_PREDICATE_PATTERN, "range"),
+                (_EXISTENCE_PREDICATE_PATTERN, "existence"),
+            ):
+                for var, prop in pattern.findall(segment):
+                    if var in labels:
+                        found.append((kind, labels[var], prop))
+
+        return list(dict.fromkeys(found))
+
+    @staticmethod
+    def _add_spec(specs, kind: str, label: str, properties: Tuple[str, ...]) -> IndexSpec:
+        """Get or create the spec for a label/property combination"""
+        key = (kind, label, properties)
+        if key not in specs:
+            specs[key] = IndexSpec(
+                name=f"{label.lower()}_{'_'.join(properties)}_{'unique' if kind == 'uniqueness' else kind}",
+                kind=kind,
+                label=label,
+                properties=properties,
+            )
+        return specs[key]
+
+    @staticmethod
+    def _record_use(spec: IndexSpec, query_id: str):
+        """Note that a query filters through this spec"""
+        if query_id not in spec.serves:
+            spec.serves.append(query_id)
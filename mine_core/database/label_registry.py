@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Dynamic Label Registry - Bounded Per-Entity Label Dictionary
+Caps distinct dynamic labels per entity type; the long tail is stored as an indexed property.
+"""
+
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from configs.environment import get_dynamic_label_config
+from mine_core.shared.field_utils import clean_label
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicLabelRegistry:
+    """Admits cleaned dynamic labels until an entity type's cardinality budget is spent"""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_labels_per_entity: int = 100,
+        entity_budgets: Dict[str, int] = None,
+        fallback_property: str = "label_value",
+        clean_cache_size: int = 10000,
+        seed_from_database: bool = True,
+    ):
+        self.enabled = enabled
+        self.max_labels_per_entity = max_labels_per_entity
+        self.entity_budgets = dict(entity_budgets or {})
+        self.fallback_property = fallback_property
+        self.seed_from_database = seed_from_database
+        # Free-text cascade values repeat heavily across records
+        self.clean = lru_cache(maxsize=clean_cache_size)(clean_label)
+
+        self._labels: Dict[str, Set[str]] = {}
+        self._seeded: Set[str] = set()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def budget(self, entity_type: str) -> int:
+        """Maximum distinct dynamic labels for an entity type"""
+        return int(self.entity_budgets.get(entity_type, self.max_labels_per_entity))
+
+    def resolve(
+        self, entity_type: str, dynamic_label: Optional[str]
+    ) -> Tuple[Tuple[str, ...], Optional[str]]:
+        """Node labels for a row and the cleaned value to store in the fallback property"""
+        if not dynamic_label or dynamic_label == entity_type:
+            return (entity_type,), None
+        cleaned = self.clean(dynamic_label)
+        if not cleaned or cleaned == entity_type:
+            return (entity_type,), None
+        if not self.enabled:
+            return (entity_type, cleaned), None
+        if self.admit(entity_type, cleaned):
+            return (entity_type, cleaned), cleaned
+        return (entity_type,), cleaned
+
+    def admit(self, entity_type: str, label: str) -> bool:
+        """Whether a label may be applied, registering it while the budget allows"""
+        with self._lock:
+            labels = self._labels.setdefault(entity_type, set())
+            counters = self._counters.setdefault(entity_type, {"labelled": 0, "fallback": 0})
+            if label in labels or len(labels) < self.budget(entity_type):
+                labels.add(label)
+                counters["labelled"] += 1
+                return True
+            counters["fallback"] += 1
+            return False
+
+    def known_labels(self, entity_type: str) -> Set[str]:
+        """Dynamic labels registered for an entity type"""
+        with self._lock:
+            return set(self._labels.get(entity_type, ()))
+
+    def needs_seed(self, entity_type: str) -> bool:
+        """Whether the labels already in the graph still have to be loaded for this type"""
+        return self.enabled and self.seed_from_database and entity_type not in self._seeded
+
+    def seed(self, entity_type: str, labels: Iterable[str]):
+        """Register labels that already exist in the graph, so restarts keep the same dictionary"""
+        with self._lock:
+            existing = self._labels.setdefault(entity_type, set())
+            existing.update(labels)
+            self._seeded.add(entity_type)
+            if len(existing) > self.budget(entity_type):
+                logger.warning(
+                    f"{entity_type} already has {len(existing)} dynamic labels in the graph, "
+                    f"over its budget of {self.budget(entity_type)}; no new labels will be added"
+                )
+
+    def report(self) -> Dict[str, Any]:
+        """Per-entity label counts and fallback rows seen by this process"""
+        with self._lock:
+            entities = {
+                entity_type: {
+                    "labels": len(labels),
+                    "budget": self.budget(entity_type),
+                    "labelled_rows": self._counters.get(entity_type, {}).get("labelled", 0),
+                    "fallback_rows": self._counters.get(entity_type, {}).get("fallback", 0),
+                }
+                for entity_type, labels in sorted(self._labels.items())
+            }
+        cache = self.clean.cache_info()
+        return {
+            "enabled": self.enabled,
+            "fallback_property": self.fallback_property,
+            "entities": entities,
+            "clean_cache": {"hits": cache.hits, "misses": cache.misses, "size": cache.currsize},
+        }
+
+
+# Singleton instance
+_label_registry = None
+
+
+def get_label_registry() -> DynamicLabelRegistry:
+    """Get singleton dynamic label registry configured from system constants"""
+    global _label_registry
+    if _label_registry is None:
+        _label_registry = DynamicLabelRegistry(**get_dynamic_label_config())
+    return _label_registry
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Parallel Query Executor - Concurrent Fan-Out for Independent Read Queries
+Runs batches of independent Cypher queries over a bounded thread pool with deadlines.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from configs.environment import get_graph_search_config
+from mine_core.shared.common import handle_error
+
+logger = logging.getLogger(__name__)
+
+# Fallbacks when graph_search_config.json has no performance_settings block
+DEFAULT_MAX_PARALLEL_QUERIES = 8
+DEFAULT_QUERY_TIMEOUT_SECONDS = 30.0
+DEFAULT_SEARCH_DEADLINE_SECONDS = 45.0
+
+
+@dataclass
+class QueryTask:
+    """Single unit of work submitted to the parallel executor"""
+
+    key: str
+    query: str
+    category: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class QueryOutcome:
+    """Result of a single task, reported in submission order"""
+
+    task: QueryTask
+    data: List[Dict[str, Any]]
+    success: bool
+    elapsed_ms: float
+    error: Optional[str] = None
+    timed_out: bool = False
+
+
+class ParallelQueryExecutor:
+    """Bounded thread-pool fan-out with per-query and overall deadlines"""
+
+    def __init__(
+        self,
+        query_manager=None,
+        max_workers: int = None,
+        query_timeout: float = None,
+        overall_timeout: float = None,
+    ):
+        if query_manager is None:
+            # Import here to avoid circular dependency
+            from mine_core.database.query_manager import get_query_manager
+
+            query_manager = get_query_manager()
+
+        settings = get_graph_search_config().get("performance_settings", {})
+
+        self.query_manager = query_manager
+        self.max_workers = max_workers or settings.get(
+            "max_parallel_queries", DEFAULT_MAX_PARALLEL_QUERIES
+        )
+        self.query_timeout = query_timeout or settings.get(
+            "query_timeout_seconds", DEFAULT_QUERY_TIMEOUT_SECONDS
+        )
+        self.overall_timeout = overall_timeout or settings.get(
+            "search_deadline_seconds", DEFAULT_SEARCH_DEADLINE_SECONDS
+        )
+
+    def execute(self, tasks: List[QueryTask]) -> List[QueryOutcome]:
+        """Run all tasks concurrently and return outcomes in submission order"""
+        if not tasks:
+            return []
+
+        outcomes: List[Optional[QueryOutcome]] = [None] * len(tasks)
+        deadline = time.monotonic() + self.overall_timeout
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(tasks)), thread_name_prefix="query-fanout"
+        )
+
+        try:
+            futures = {pool.submit(self._run_task, task): index for index, task in enumerate(tasks)}
+            pending = set(futures)
+
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outcomes[futures[future]] = future.result()
+
+            if pending:
+                logger.warning(
+                    f"Parallel execution deadline of {self.overall_timeout}s reached "
+                    f"with {len(pending)} queries outstanding"
+                )
+                for future in pending:
+                    future.cancel()
+                    index = futures[future]
+                    outcomes[index] = QueryOutcome(
+                        task=tasks[index],
+                        data=[],
+                        success=False,
+                        elapsed_ms=self.overall_timeout * 1000,
+                        error="Overall search deadline exceeded",
+                        timed_out=True,
+                    )
+        finally:
+            # Do not block on stragglers; the server-side timeout bounds them
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return outcomes
+
+    def _run_task(self, task: QueryTask) -> QueryOutcome:
+        """Execute a single task through the query manager"""
+        started = time.perf_counter()
+        try:
+            result = self.query_manager.read_query(
+                task.query, task.params, timeout=self.query_timeout
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            error = None if result.success else result.metadata.get("error")
+            return QueryOutcome(
+                task=task,
+                data=result.data if result.success else [],
+                success=result.success,
+                elapsed_ms=elapsed_ms,
+                error=error,
+                timed_out=bool(error and "timeout" in error.lower()),
+            )
+        except Exception as e:
+            handle_error(logger, e, f"parallel query {task.category}.{task.key}")
+            return QueryOutcome(
+                task=task,
+                data=[],
+                success=False,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                error=str(e),
+            )
+
+    @staticmethod
+    def summarize_by_category(outcomes: List[QueryOutcome]) -> Dict[str, Dict[str, Any]]:
+        """Aggregate timing and row counts per category, preserving first-seen order"""
+        summary: Dict[str, Dict[str, Any]] = {}
+        for outcome in outcomes:
+            stats = summary.setdefault(
+                outcome.task.category,
+                {"queries": 0, "rows": 0, "failed": 0, "timed_out": 0, "elapsed_ms": 0.0},
+            )
+            stats["queries"] += 1
+            stats["rows"] += len(outcome.data)
+            stats["failed"] += 0 if outcome.success else 1
+            stats["timed_out"] += 1 if outcome.timed_out else 0
+            # Queries in a category run concurrently, so its wall time is the slowest member
+            stats["elapsed_ms"] = round(max(stats["elapsed_ms"], outcome.elapsed_ms), 1)
+        return summary
@@ -7,7 +7,13 @@ Streamlined analytics with enhanced causal intelligence capabilities.
 import logging
 from typing import Any, Dict, List, Optional
 
+from mine_core.database.data_health import get_data_health_engine
 from mine_core.database.db import get_database
+from mine_core.database.incident_chain import (
+    CHAIN_FIELDS,
+    CHAIN_LABEL,
+    get_incident_chain_projection,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +33,7 @@ def get_facilities() -> List[Dict[str, Any]]:
            incident_count
     ORDER BY f.facility_name
     """
-    return get_database().execute_query(query)
+    return get_database().read_query(query)
 
 
 def get_facility(facility_id: str) -> Optional[Dict[str, Any]]:
@@ -45,7 +51,7 @@ def get_facility(facility_id: str) -> Optional[Dict[str, Any]]:
            total_incidents,
            analyzed_causes
     """
-    results = get_database().execute_query(query, facility_id=facility_id)
+    results = get_database().read_query(query, {"facility_id": facility_id})
     return results[0] if results else None
 
 
@@ -88,7 +94,7 @@ def get_action_requests(facility_id: str = None, limit: int = 100) -> List[Dict[
         LIMIT $limit
         """
 
-    return get_database().execute_query(query, **params)
+    return get_database().read_query(query, params)
 
 
 # Enhanced causal intelligence queries
@@ -129,8 +135,8 @@ def get_root_cause_intelligence_summary(facility_id: str = None) -> Dict[str, An
     ORDER BY total_resolutions DESC, effectiveness_percentage DESC
     """
 
-    causal_patterns = get_database().execute_query(causal_analysis_query, **params)
-    effectiveness_data = get_database().execute_query(effectiveness_query, **params)
+    causal_patterns = get_database().read_query(causal_analysis_query, params)
+    effectiveness_data = get_database().read_query(effectiveness_query, params)
 
     return {
         "causal_patterns": causal_patterns,
@@ -199,10 +205,10 @@ def get_operational_performance_dashboard(facility_id: str = None) -> Dict[str,
     """
 
     return {
-        "temporal_trends": get_database().execute_query(performance_query, **params),
-        "category_performance": get_database().execute_query(category_query, **params),
-        "workflow_efficiency": get_database().execute_query(workflow_query, **params)[0]
-        if get_database().execute_query(workflow_query, **params)
+        "temporal_trends": get_database().read_query(performance_query, params),
+        "category_performance": get_database().read_query(category_query, params),
+        "workflow_efficiency": get_database().read_query(workflow_query, params)[0]
+        if get_database().read_query(workflow_query, params)
         else {},
         "facility_scope": facility_id or "enterprise_wide",
     }
@@ -236,7 +242,7 @@ def get_predictive_intelligence_indicators() -> List[Dict[str, Any]]:
            END AS risk_classification
     ORDER BY pattern_frequency DESC, success_probability ASC
     """
-    return get_database().execute_query(query)
+    return get_database().read_query(query)
 
 
 def get_missing_data_quality_intelligence() -> Dict[str, Any]:
@@ -267,7 +273,7 @@ def get_missing_data_quality_intelligence() -> Dict[str, Any]:
            toFloat(missing_root_causes) / incidents_with_causes * 100 AS root_cause_missing_rate
     """
 
-    results = get_database().execute_query(query)
+    results = get_database().read_query(query)
     return results[0] if results else {}
 
 
@@ -291,7 +297,7 @@ def get_causal_correlation_matrix() -> List[Dict[str, Any]]:
     ORDER BY correlation_strength DESC
     LIMIT 25
     """
-    return get_database().execute_query(query)
+    return get_database().read_query(query)
 
 
 def get_field_completion_statistics() -> Dict[str, Any]:
@@ -322,7 +328,7 @@ def get_field_completion_statistics() -> Dict[str, Any]:
     ORDER BY completion_rate ASC, field_name ASC
     """
 
-    results = get_database().execute_query(query)
+    results = get_database().read_query(query)
 
     field_completion = {}
     total_fields = 0
@@ -342,127 +348,9 @@ def get_field_completion_statistics() -> Dict[str, Any]:
 
 
 def get_entity_completion_rates() -> Dict[str, Any]:
-    """Get completion rates for all workflow entities using separate simple queries"""
-
+    """Get completion rates for all workflow entities from one scan per label"""
     try:
-        db = get_database()
-        entity_rates = {}
-
-        # ActionRequest completion rates
-        ar_query = """
-        MATCH (ar:ActionRequest)
-        RETURN count(ar) AS total_count,
-               count(CASE WHEN ar.title IS NOT NULL AND ar.title <> '' THEN 1 END) AS title_complete,
-               count(CASE WHEN ar.initiation_date IS NOT NULL THEN 1 END) AS date_complete,
-               count(CASE WHEN ar.stage IS NOT NULL AND ar.stage <> '' THEN 1 END) AS stage_complete
-        """
-        ar_results = db.execute_query(ar_query)
-        if ar_results:
-            ar_data = ar_results[0]
-            total = ar_data["total_count"]
-            completed = (
-                ar_data["title_complete"] + ar_data["date_complete"] + ar_data["stage_complete"]
-            )
-            total_fields = total * 3
-            entity_rates["ActionRequest"] = {
-                "total_count": total,
-                "completed_fields": completed,
-                "total_fields": total_fields,
-                "completion_rate": round(completed * 100.0 / total_fields, 1)
-                if total_fields > 0
-                else 0.0,
-            }
-
-        # Problem completion rates
-        p_query = """
-        MATCH (p:Problem)
-        RETURN count(p) AS total_count,
-               count(CASE WHEN p.what_happened IS NOT NULL AND p.what_happened <> '' THEN 1 END) AS what_complete,
-               count(CASE WHEN p.requirement IS NOT NULL AND p.requirement <> '' THEN 1 END) AS req_complete
-        """
-        p_results = db.execute_query(p_query)
-        if p_results:
-            p_data = p_results[0]
-            total = p_data["total_count"]
-            completed = p_data["what_complete"] + p_data["req_complete"]
-            total_fields = total * 2
-            entity_rates["Problem"] = {
-                "total_count": total,
-                "completed_fields": completed,
-                "total_fields": total_fields,
-                "completion_rate": round(completed * 100.0 / total_fields, 1)
-                if total_fields > 0
-                else 0.0,
-            }
-
-        # RootCause completion rates
-        rc_query = """
-        MATCH (rc:RootCause)
-        RETURN count(rc) AS total_count,
-               count(CASE WHEN rc.root_cause IS NOT NULL AND rc.root_cause <> '' THEN 1 END) AS cause_complete,
-               count(CASE WHEN rc.objective_evidence IS NOT NULL AND rc.objective_evidence <> '' THEN 1 END) AS evidence_complete
-        """
-        rc_results = db.execute_query(rc_query)
-        if rc_results:
-            rc_data = rc_results[0]
-            total = rc_data["total_count"]
-            completed = rc_data["cause_complete"] + rc_data["evidence_complete"]
-            total_fields = total * 2
-            entity_rates["RootCause"] = {
-                "total_count": total,
-                "completed_fields": completed,
-                "total_fields": total_fields,
-                "completion_rate": round(completed * 100.0 / total_fields, 1)
-                if total_fields > 0
-                else 0.0,
-            }
-
-        # ActionPlan completion rates
-        ap_query = """
-        MATCH (ap:ActionPlan)
-        RETURN count(ap) AS total_count,
-               count(CASE WHEN ap.action_plan IS NOT NULL AND ap.action_plan <> '' THEN 1 END) AS plan_complete,
-               count(CASE WHEN ap.due_date IS NOT NULL THEN 1 END) AS date_complete
-        """
-        ap_results = db.execute_query(ap_query)
-        if ap_results:
-            ap_data = ap_results[0]
-            total = ap_data["total_count"]
-            completed = ap_data["plan_complete"] + ap_data["date_complete"]
-            total_fields = total * 2
-            entity_rates["ActionPlan"] = {
-                "total_count": total,
-                "completed_fields": completed,
-                "total_fields": total_fields,
-                "completion_rate": round(completed * 100.0 / total_fields, 1)
-                if total_fields > 0
-                else 0.0,
-            }
-
-        # Verification completion rates
-        v_query = """
-        MATCH (v:Verification)
-        RETURN count(v) AS total_count,
-               count(CASE WHEN v.is_action_plan_effective IS NOT NULL THEN 1 END) AS effective_complete,
-               count(CASE WHEN v.action_plan_verification_date IS NOT NULL THEN 1 END) AS date_complete
-        """
-        v_results = db.execute_query(v_query)
-        if v_results:
-            v_data = v_results[0]
-            total = v_data["total_count"]
-            completed = v_data["effective_complete"] + v_data["date_complete"]
-            total_fields = total * 2
-            entity_rates["Verification"] = {
-                "total_count": total,
-                "completed_fields": completed,
-                "total_fields": total_fields,
-                "completion_rate": round(completed * 100.0 / total_fields, 1)
-                if total_fields > 0
-                else 0.0,
-            }
-
-        return entity_rates
-
+        return get_data_health_engine().completion_rates()
     except Exception as e:
         logger.error(f"Error getting entity completion rates: {e}")
         return {}
@@ -583,7 +471,7 @@ def get_facility_action_statistics(facility_id: str = None) -> Dict[str, Any]:
         params = {}
 
     try:
-        results = get_database().execute_query(query, **params)
+        results = get_database().read_query(query, params)
         if results and len(results) > 0:
             return (
                 results[0].get("facility_statistics", {})
@@ -635,7 +523,17 @@ def get_incident_chain(action_request_id: str) -> Dict[str, Any]:
            v.action_plan_eval_comment AS eval_comment,
            v.action_plan_verification_date AS verification_date
     """
-    results = get_database().execute_query(query, action_request_id=action_request_id)
+    projection = get_incident_chain_projection()
+    if projection.enabled and projection.is_built():
+        chain_query = f"""
+        MATCH (ic:{CHAIN_LABEL} {{request_id: $action_request_id}})
+        RETURN ic {{.{', .'.join(CHAIN_FIELDS)}}} AS chain
+        """
+        results = get_database().read_query(chain_query, {"action_request_id": action_request_id})
+        if results:
+            return results[0]["chain"]
+
+    results = get_database().read_query(query, {"action_request_id": action_request_id})
     return results[0] if results else {}
 
 
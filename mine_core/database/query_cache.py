@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Query Result Cache - Read-Through Cache for Neo4j Read Queries
+Bounded LRU with TTL expiry, keyed on normalised query text plus parameters.
+"""
+
+import copy
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from configs.environment import get_query_cache_config
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so formatting differences share one cache entry"""
+    return _WHITESPACE_PATTERN.sub(" ", query).strip()
+
+
+def is_read_only_summary(summary: Any) -> bool:
+    """Whether the server classified an executed statement as read-only"""
+    # query_type is "r" only for pure reads; "rw", "w" and "s" also cover write procedures
+    # such as apoc.create.* and schema changes, which no keyword scan can recognise reliably
+    return getattr(summary, "query_type", None) == "r"
+
+
+class QueryResultCache:
+    """Thread-safe LRU cache bounded by entry count and approximate byte size"""
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float = 300,
+        enabled: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        # key -> (expires_at, size_bytes, rows)
+        self._entries: "OrderedDict[str, Tuple[float, int, List[Dict[str, Any]]]]" = OrderedDict()
+        self._total_bytes = 0
+        self._generation = 0
+        # Normalised texts of untagged statements the server has reported as read-only
+        self._read_only_queries: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    def make_key(self, query: str, params: Dict[str, Any]) -> str:
+        """Build cache key from normalised query text and sorted parameters"""
+        return normalize_query(query) + "\x00" + json.dumps(params, sort_keys=True, default=str)
+
+    def is_known_read_only(self, query: str) -> bool:
+        """Whether an untagged statement was classified read-only by an earlier execution"""
+        return normalize_query(query) in self._read_only_queries
+
+    def remember_read_only(self, query: str) -> None:
+        """Record that the server classified a statement as read-only"""
+        with self._lock:
+            if len(self._read_only_queries) >= self.max_entries:
+                self._read_only_queries.clear()
+            self._read_only_queries[normalize_query(query)] = True
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached rows or None on miss/expiry"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+
+            expires_at, size_bytes, rows = entry
+            if expires_at <= time.monotonic():
+                self._remove(key, size_bytes)
+                self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+
+        # Callers annotate records, nested values included, so hand out independent copies
+        return copy.deepcopy(rows)
+
+    def put(self, key: str, rows: List[Dict[str, Any]]) -> None:
+        """Store rows, evicting least-recently-used entries beyond the bounds"""
+        if not self.enabled:
+            return
+
+        size_bytes = self._estimate_size(key, rows)
+        if size_bytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key, self._entries[key][1])
+
+            self._entries[key] = (
+                time.monotonic() + self.ttl_seconds,
+                size_bytes,
+                copy.deepcopy(rows),
+            )
+            self._total_bytes += size_bytes
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                oldest_key, (_, oldest_size, _) = next(iter(self._entries.items()))
+                self._remove(oldest_key, oldest_size)
+                self._counters["evictions"] += 1
+
+    @property
+    def generation(self) -> int:
+        """Number of graph writes seen; derived caches compare it to detect staleness"""
+        return self._generation
+
+    def invalidate(self) -> None:
+        """Drop every entry after a write to the graph"""
+        with self._lock:
+            self._generation += 1
+            if self._entries:
+                self._entries.clear()
+                self._total_bytes = 0
+                self._counters["invalidations"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current occupancy"""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hit_rate": round(self._counters["hits"] / lookups, 3) if lookups else 0.0,
+                "enabled": self.enabled,
+            }
+
+    def _remove(self, key: str, size_bytes: int) -> None:
+        """Remove entry and adjust byte total (caller holds the lock)"""
+        del self._entries[key]
+        self._total_bytes -= size_bytes
+
+    @staticmethod
+    def _estimate_size(key: str, rows: List[Dict[str, Any]]) -> int:
+        """Approximate memory footprint from serialised length"""
+        try:
+            return len(key) + len(json.dumps(rows, default=str))
+        except (TypeError, ValueError):
+            return len(key) + 1024 * len(rows)
+
+
+# Singleton instance
+_query_cache = None
+
+
+def get_query_cache() -> QueryResultCache:
+    """Get singleton query result cache configured from system constants"""
+    global _query_cache
+    if _query_cache is None:
+        _query_cache = QueryResultCache(**get_query_cache_config())
+    return _query_cache
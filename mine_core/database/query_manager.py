@@ -6,19 +6,25 @@ Single authority for all Neo4j database interactions with schema-driven design.
 
 import logging
 import os # Added for file path operations
-import re
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from neo4j import READ_ACCESS
+
 from configs.environment import (
     get_case_study_config,
     get_entity_connections,
     get_entity_primary_key,
     get_mappings,
     get_schema,
+    get_schema_registry,
 )
 from mine_core.database.db import get_database
+from mine_core.database.entity_statistics import get_entity_statistics
+from mine_core.database.query_templates import QueryTemplateCompiler, get_template_compiler
+from mine_core.database.record_stream import RecordStream
 from mine_core.shared.common import handle_error
 
 logger = logging.getLogger(__name__)
@@ -40,36 +46,95 @@ class QueryManager:
     def __init__(self):
         self.db = get_database()
         self.schema = get_schema()
-        self._entity_cache = {}
 
-    def execute_query(self, query: str, params: Dict[str, Any] = None) -> QueryResult:
+    def read_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> QueryResult:
+        """Execute a read-only query on a reader with standardized result handling"""
+        return self.execute_query(query, params, timeout, use_cache, access_mode=READ_ACCESS)
+
+    def execute_query(
+        self,
+        query: str,
+        params: Dict[str, Any] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        access_mode: Optional[str] = None,
+    ) -> QueryResult:
         """Execute raw query with standardized result handling"""
+        started = time.perf_counter()
         try:
-            results = self.db.execute_query(query, **(params or {}))
+            results = self.db.execute_query(
+                query, params, timeout=timeout, use_cache=use_cache, access_mode=access_mode
+            )
             return QueryResult(
                 data=results,
                 count=len(results),
                 success=True,
-                metadata={"query_type": "raw", "params": params},
+                metadata={
+                    "query_type": "raw",
+                    "params": params,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
             )
         except Exception as e:
             handle_error(logger, e, "query execution")
-            return QueryResult(data=[], count=0, success=False, metadata={"error": str(e)})
+            return QueryResult(
+                data=[],
+                count=0,
+                success=False,
+                metadata={
+                    "error": str(e),
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            )
+
+    def stream_query(self, query: str, params: Dict[str, Any] = None, **options) -> RecordStream:
+        """Stream records of a read query (fetch_size, as_tuples, max_rows, max_bytes, timeout)"""
+        return self.db.stream_query(query, params, **options)
+
+    def execute_cypher_query(
+        self, query: str, parameters: Dict[str, Any] = None, max_rows: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Run an ad-hoc read query, stopping after max_rows instead of loading every record"""
+        with self.db.stream_query(query, parameters, max_rows=max_rows) as stream:
+            rows = list(stream)
+        if stream.truncated:
+            logger.warning(f"Cypher query results truncated at {stream.rows} rows ({stream.truncated})")
+        return rows
+
+    def get_query_stats(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Per-fingerprint latency histograms recorded by the database layer"""
+        return self.db.get_query_stats(top)
 
     def get_entity_count(self, entity_type: str) -> int:
         """Return integer count, not QueryResult object"""
         try:
-            filter_clause = "WHERE NOT '_SchemaTemplate' IN labels(n)"
-            query = f"MATCH (n:{entity_type}) {filter_clause} RETURN count(n) AS count"
-
-            result = self.execute_query(query)
-            if result.success and result.data:
-                return result.data[0]["count"]  # Extract integer from QueryResult
-            return 0
+            return get_entity_statistics().entity_count(entity_type)
         except Exception as e:
             handle_error(logger, e, f"entity count for {entity_type}")
             return 0
 
+    def get_entity_counts(self) -> Dict[str, int]:
+        """Counts for every entity in model_schema.json from the count store"""
+        try:
+            return get_entity_statistics().entity_counts()
+        except Exception as e:
+            handle_error(logger, e, "entity counts")
+            return {}
+
+    def get_relationship_counts(self) -> Dict[str, int]:
+        """Counts for every relationship type in model_schema.json"""
+        try:
+            return get_entity_statistics().relationship_counts()
+        except Exception as e:
+            handle_error(logger, e, "relationship counts")
+            return {}
+
     def get_entities_by_type(
         self, entity_type: str, limit: int = 1000, filters: Dict[str, Any] = None
     ) -> QueryResult:
@@ -100,7 +165,7 @@ class QueryManager:
             if filters:
                 params.update(filters)
 
-            return self.execute_query(query, params)
+            return self.read_query(query, params)
 
         except Exception as e:
             handle_error(logger, e, f"entities retrieval for {entity_type}")
@@ -126,7 +191,7 @@ class QueryManager:
             LIMIT $limit
             """
 
-            return self.execute_query(query, {"limit": limit})
+            return self.read_query(query, {"limit": limit})
 
         except Exception as e:
             handle_error(logger, e, f"relationship data {from_type}-{rel_type}-{to_type}")
@@ -150,7 +215,7 @@ class QueryManager:
             ORDER BY f.facility_name
             """
 
-            return self.execute_query(query, params)
+            return self.read_query(query, params)
 
         except Exception as e:
             handle_error(logger, e, "facility metrics retrieval")
@@ -174,7 +239,7 @@ class QueryManager:
                    count(v) AS plans_verified
             """
 
-            result = self.execute_query(query)
+            result = self.read_query(query)
             if result.success and result.data:
                 logger.info(f"Workflow completion query successful: {result.data[0]}")
                 return result
@@ -219,7 +284,7 @@ class QueryManager:
             LIMIT 20
             """
 
-            return self.execute_query(query, params)
+            return self.read_query(query, params)
 
         except Exception as e:
             handle_error(logger, e, "causal intelligence data")
@@ -261,7 +326,7 @@ class QueryManager:
             ORDER BY year, facility_id
             """
 
-            return self.execute_query(query)
+            return self.read_query(query)
 
         except Exception as e:
             handle_error(logger, e, f"temporal analysis for {entity_type}")
@@ -302,7 +367,7 @@ class QueryManager:
             LIMIT 3
             """
 
-            return self.execute_query(structure_query)
+            return self.read_query(structure_query)
 
         except Exception as e:
             handle_error(logger, e, "search data structure discovery")
@@ -326,7 +391,7 @@ class QueryManager:
                 END
             """
 
-            return self.execute_query(core_labels_query)
+            return self.read_query(core_labels_query)
 
         except Exception as e:
             handle_error(logger, e, "core workflow labels discovery")
@@ -355,7 +420,7 @@ class QueryManager:
             """
 
             # Correct parameter syntax
-            return self.execute_query(corrected_query, {"search_text": search_text})
+            return self.read_query(corrected_query, {"search_text": search_text})
 
         except Exception as e:
             handle_error(logger, e, f"search execution for '{search_text}'")
@@ -402,7 +467,7 @@ class QueryManager:
             LIMIT 20
             """
 
-            query_result = self.execute_query(
+            query_result = self.read_query(
                 query=schema_query, params={"search_text": search_text}
             )
             logger.info(f"Raw schema search results: {query_result.data}")
@@ -428,13 +493,8 @@ class QueryManager:
         return default_relation
 
     def _get_entity_definition(self, entity_type: str) -> Dict[str, Any]:
-        """Get entity definition from schema with caching"""
-        if entity_type not in self._entity_cache:
-            entities = self.schema.get("entities", [])
-            entity_def = next((e for e in entities if e["name"] == entity_type), {})
-            self._entity_cache[entity_type] = entity_def
-
-        return self._entity_cache[entity_type]
+        """Get entity definition from the compiled schema registry"""
+        return get_schema_registry().entity(entity_type)
 
     def _build_filter_clause(self, filters: Dict[str, Any]) -> str:
         """Build WHERE clause from filters"""
@@ -475,9 +535,9 @@ class QueryManager:
         """Tests the existence and count of core workflow entities in Neo4j."""
         entities = ["ActionRequest", "Problem", "RootCause", "ActionPlan", "Verification"]
         logger.info("--- Testing Workflow Entities --- ")
+        counts = get_entity_statistics().entity_counts(entities)
         for entity in entities:
-            count = self.get_entity_count(entity)
-            logger.info(f"{entity}: {count} records")
+            logger.info(f"{entity}: {counts[entity]} records")
         logger.info("--- Workflow Entity Test Complete ---")
 
     def get_case_study_solution_sequence(
@@ -556,7 +616,7 @@ class QueryManager:
 
             params = {"action_number": action_request_number, "facility_name": facility_name}
 
-            return self.execute_query(query=query, params=params)
+            return self.read_query(query=query, params=params)
 
         except Exception as e:
             handle_error(
@@ -569,19 +629,12 @@ class QueryManager:
     def execute_stakeholder_essential_query(self, query_file_path: str, filter_clause: str) -> QueryResult:
         """Execute stakeholder query with syntax fixes"""
         try:
-            # Read query file
-            with open(query_file_path, 'r') as f:
-                query_template = f.read()
-
-            # Apply filter
-            query = query_template.replace("{filter_clause}", filter_clause)
-
-            # Fix Neo4j syntax
-            query = query.replace("SUBSTRING_BEFORE(", "head(split(")
-            query = query.replace("apoc.text.split(", "split(")
+            compiler = get_template_compiler()
+            clause, params = compiler.parameterize_filter(filter_clause)
+            query = compiler.compile_file(query_file_path, clause)
 
             logger.info(f"Executing fixed stakeholder query: {query_file_path}")
-            return self.execute_query(query)
+            return self.read_query(query, params)
 
         except Exception as e:
             logger.error(f"Stakeholder query failed: {str(e)}")
@@ -594,19 +647,12 @@ class QueryManager:
             debug_info = self._validate_query_components(query_template, filter_clause)
             logger.info(f"Query validation: {debug_info}")
 
-            # Process query with syntax fixes
-            formatted_query = query_template.replace("{filter_clause}", filter_clause)
-            original_query = formatted_query  # Preserve for debugging
+            # Compile once per template/clause shape; literals travel as parameters
+            compiler = get_template_compiler()
+            clause, params = compiler.parameterize_filter(filter_clause)
+            formatted_query = compiler.compile(query_template, clause)
 
-            formatted_query = self._fix_neo4j_syntax(formatted_query)
-
-            # Log query transformation if changes made
-            if formatted_query != original_query:
-                logger.info(f"Query syntax transformation applied")
-                logger.debug(f"Original: {original_query[:200]}...")
-                logger.debug(f"Fixed: {formatted_query[:200]}...")
-
-            return self.execute_query(formatted_query)
+            return self.read_query(formatted_query, params)
 
         except Exception as e:
             # Enhanced error context
@@ -660,25 +706,9 @@ class QueryManager:
 
     def _fix_neo4j_syntax(self, query: str) -> str:
         """Fix Neo4j syntax with detailed logging"""
-        fixes_applied = []
-
-        # Fix SUBSTRING_BEFORE
-        if "SUBSTRING_BEFORE" in query:
-            original_matches = re.findall(r"SUBSTRING_BEFORE\([^)]+\)", query)
-            pattern = r"SUBSTRING_BEFORE\(([^,]+),\s*\'([^\']+)\'\)"
-            replacement = r"head(split(\1, '\2'))"
-            query = re.sub(pattern, replacement, query)
-            fixes_applied.append(f"SUBSTRING_BEFORE -> head(split): {len(original_matches)} replacements")
-
-        # Fix apoc.text.split
-        if "apoc.text.split" in query:
-            apoc_count = query.count("apoc.text.split")
-            query = query.replace("apoc.text.split(", "split(")
-            fixes_applied.append(f"apoc.text.split -> split: {apoc_count} replacements")
-
+        query, fixes_applied = QueryTemplateCompiler.fix_syntax(query)
         if fixes_applied:
             logger.info(f"Neo4j syntax fixes applied: {fixes_applied}")
-
         return query
 
     def validate_date_string(self, date_string: str) -> str:
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Query Metrics - Slow-Query Log and Per-Fingerprint Latency Histograms
+Tracks wall time, server timings and row counts for every executed query.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from configs.environment import get_query_monitoring_config
+from mine_core.database.query_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("mine_core.database.slow_queries")
+
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+
+def fingerprint_query(query: str) -> str:
+    """Reduce a query to its template by stripping literals and formatting"""
+    template = _STRING_LITERAL_PATTERN.sub("?", normalize_query(query))
+    return _NUMBER_LITERAL_PATTERN.sub("?", template)
+
+
+def _percentile(sorted_samples: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of pre-sorted samples"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(math.ceil(percentile / 100 * len(sorted_samples)) - 1, 0)
+    return sorted_samples[rank]
+
+
+def failure_kind(error: Exception) -> str:
+    """Label a failed execution as a server-side timeout or a plain error"""
+    return "timeout" if "TransactionTimedOut" in (getattr(error, "code", None) or "") else "error"
+
+
+class _FingerprintStats:
+    """Rolling latency window and cumulative totals for one query template"""
+
+    def __init__(self, template: str, window: int):
+        self.template = template
+        self.count = 0
+        self.total_ms = 0.0
+        self.total_rows = 0
+        self.server_available_ms = 0.0
+        self.server_consumed_ms = 0.0
+        self.slow_count = 0
+        self.error_count = 0
+        self.timeout_count = 0
+        self.cache_hits = 0
+        self.latencies: Deque[float] = deque(maxlen=window)
+
+
+class QueryMetrics:
+    """Thread-safe collector for query latency histograms and slow-query logging"""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        log_slow_queries: bool = True,
+        slow_query_threshold_ms: float = 1000,
+        histogram_window: int = 1000,
+        slow_query_log_file: Optional[str] = None,
+    ):
+        self.enabled = enabled
+        self.log_slow_queries = log_slow_queries
+        self.slow_query_threshold_ms = slow_query_threshold_ms
+        self.histogram_window = histogram_window
+        self._stats: Dict[str, _FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+        if slow_query_log_file and not slow_query_logger.handlers:
+            try:
+                handler = logging.FileHandler(slow_query_log_file)
+                handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+                slow_query_logger.addHandler(handler)
+            except OSError as e:
+                logger.warning(f"Could not open slow query log {slow_query_log_file}: {e}")
+
+    def record(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        wall_ms: float,
+        rows: int,
+        server_available_ms: Optional[float] = None,
+        server_consumed_ms: Optional[float] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record one execution, failed ones included, and log it if it crossed the slow threshold
+
+        error is "timeout" or "error" for executions that raised, see failure_kind.
+        """
+        is_slow = self.log_slow_queries and wall_ms >= self.slow_query_threshold_ms
+        if is_slow:
+            outcome = f" {error}" if error else ""
+            slow_query_logger.warning(
+                f"Slow query{outcome} {wall_ms:.1f}ms rows={rows} "
+                f"server_available={server_available_ms}ms server_consumed={server_consumed_ms}ms "
+                f"query={normalize_query(query)[:500]} params={params}"
+            )
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            stats = self._get_stats(query)
+            stats.count += 1
+            stats.total_ms += wall_ms
+            stats.total_rows += rows
+            stats.server_available_ms += server_available_ms or 0.0
+            stats.server_consumed_ms += server_consumed_ms or 0.0
+            stats.slow_count += 1 if is_slow else 0
+            stats.error_count += 1 if error == "error" else 0
+            stats.timeout_count += 1 if error == "timeout" else 0
+            stats.latencies.append(wall_ms)
+
+    def record_cache_hit(self, query: str) -> None:
+        """Count a result served from the query cache, kept out of the latency histogram"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._get_stats(query).cache_hits += 1
+
+    def _get_stats(self, query: str) -> _FingerprintStats:
+        """Stats for a query's fingerprint, created on first sight; caller holds the lock"""
+        template = fingerprint_query(query)
+        key = hashlib.sha1(template.encode("utf-8")).hexdigest()[:12]
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _FingerprintStats(template, self.histogram_window)
+        return stats
+
+    def get_report(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Per-fingerprint latency percentiles, ordered by total time spent"""
+        with self._lock:
+            snapshot = [
+                (key, stats, sorted(stats.latencies)) for key, stats in self._stats.items()
+            ]
+
+        report = []
+        for key, stats, samples in snapshot:
+            # Fingerprints only ever served from the cache have no executions to average
+            executed = max(stats.count, 1)
+            report.append(
+                {
+                    "fingerprint": key,
+                    "template": stats.template[:300],
+                    "count": stats.count,
+                    "total_ms": round(stats.total_ms, 1),
+                    "p50_ms": round(_percentile(samples, 50), 1),
+                    "p95_ms": round(_percentile(samples, 95), 1),
+                    "p99_ms": round(_percentile(samples, 99), 1),
+                    "max_ms": round(samples[-1], 1) if samples else 0.0,
+                    "avg_rows": round(stats.total_rows / executed, 1),
+                    "avg_server_available_ms": round(stats.server_available_ms / executed, 1),
+                    "avg_server_consumed_ms": round(stats.server_consumed_ms / executed, 1),
+                    "slow_count": stats.slow_count,
+                    "error_count": stats.error_count,
+                    "timeout_count": stats.timeout_count,
+                    "cache_hits": stats.cache_hits,
+                }
+            )
+        report.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return report[:top] if top else report
+
+    def reset(self) -> None:
+        """Discard collected histograms"""
+        with self._lock:
+            self._stats.clear()
+
+
+# Singleton instance
+_query_metrics = None
+
+
+def get_query_metrics() -> QueryMetrics:
+    """Get singleton query metrics collector configured from system constants"""
+    global _query_metrics
+    if _query_metrics is None:
+        _query_metrics = QueryMetrics(**get_query_monitoring_config())
+    return _query_metrics
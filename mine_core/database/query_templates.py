@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Query Template Compiler - Load-Once, Parameterised Cypher Templates
+Compiles configs/queries/*.cypher with syntax fixes applied once and stable query text.
+"""
+
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from configs.environment import get_project_root
+
+logger = logging.getLogger(__name__)
+
+# Search filter spliced into {filter_clause}; the term travels as $search_term
+SEARCH_FILTER_CLAUSE = """toLower(p.what_happened) CONTAINS toLower($search_term)
+           OR toLower(ar.categories) CONTAINS toLower($search_term)
+           OR toLower(rc.root_cause) CONTAINS toLower($search_term)
+           OR toLower(ap.action_plan) CONTAINS toLower($search_term) """
+
+_STRING_LITERAL_PATTERN = re.compile(r"'((?:[^'\\]|\\.)*)'|\"((?:[^\"\\]|\\.)*)\"")
+_SUBSTRING_BEFORE_PATTERN = re.compile(r"SUBSTRING_BEFORE\(([^,]+),\s*\'([^\']+)\'\)")
+
+
+class QueryTemplateCompiler:
+    """Loads cypher templates once and caches their compiled, parameterised text"""
+
+    def __init__(self, queries_dir: Path = None):
+        self.queries_dir = Path(queries_dir or get_project_root() / "configs" / "queries")
+        self._sources: Dict[str, str] = {}
+        self._compiled: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        self.load_all()
+
+    def load_all(self) -> None:
+        """Read every template in the queries directory"""
+        sources = {}
+        if self.queries_dir.exists():
+            for path in sorted(self.queries_dir.glob("*.cypher")):
+                sources[path.name] = path.read_text()
+
+        with self._lock:
+            self._sources = sources
+            self._compiled.clear()
+        logger.info(f"Loaded {len(sources)} query templates from {self.queries_dir}")
+
+    def template_names(self) -> List[str]:
+        """Names of loaded templates in file order"""
+        return list(self._sources)
+
+    def compile(self, template: str, filter_clause: str = SEARCH_FILTER_CLAUSE) -> str:
+        """Compile a loaded template by name, or raw template text, with a filter clause"""
+        key = (template, filter_clause)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            source = self._sources.get(template, template)
+            compiled, fixes = self.fix_syntax(source.replace("{filter_clause}", filter_clause))
+            if fixes:
+                logger.info(f"Neo4j syntax fixes applied to {template[:60]!r}: {fixes}")
+            with self._lock:
+                self._compiled[key] = compiled
+        return compiled
+
+    def compile_file(self, path: str, filter_clause: str = SEARCH_FILTER_CLAUSE) -> str:
+        """Compile a template outside the queries directory, reading it only once"""
+        name = str(Path(path).resolve())
+        if name not in self._sources:
+            with self._lock:
+                self._sources.setdefault(name, Path(path).read_text())
+        return self.compile(name, filter_clause)
+
+    @staticmethod
+    def fix_syntax(query: str) -> Tuple[str, List[str]]:
+        """Rewrite unsupported functions to Neo4j built-ins"""
+        fixes_applied = []
+
+        if "SUBSTRING_BEFORE" in query:
+            query, count = _SUBSTRING_BEFORE_PATTERN.subn(r"head(split(\1, '\2'))", query)
+            fixes_applied.append(f"SUBSTRING_BEFORE -> head(split): {count} replacements")
+
+        if "apoc.text.split" in query:
+            fixes_applied.append(
+                f"apoc.text.split -> split: {query.count('apoc.text.split')} replacements"
+            )
+            query = query.replace("apoc.text.split(", "split(")
+
+        return query, fixes_applied
+
+    @staticmethod
+    def parameterize_filter(filter_clause: str) -> Tuple[str, Dict[str, Any]]:
+        """Lift string literals out of a filter clause into $filter_N parameters"""
+        params: Dict[str, Any] = {}
+
+        def to_param(match: re.Match) -> str:
+            literal = match.group(1) if match.group(1) is not None else match.group(2)
+            name = f"filter_{len(params)}"
+            params[name] = re.sub(r"\\(.)", r"\1", literal)
+            return f"${name}"
+
+        return _STRING_LITERAL_PATTERN.sub(to_param, filter_clause), params
+
+
+# Singleton instance
+_template_compiler = None
+
+
+def get_template_compiler() -> QueryTemplateCompiler:
+    """Get singleton template compiler, loading templates on first use"""
+    global _template_compiler
+    if _template_compiler is None:
+        _template_compiler = QueryTemplateCompiler()
+    return _template_compiler
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Record Stream - Constant-Memory Iteration Over Query Results
+Pulls records from Neo4j in fetch-size batches with optional tuple projection and row/byte caps.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from neo4j import READ_ACCESS, Query
+
+from mine_core.database.query_metrics import failure_kind, get_query_metrics
+
+logger = logging.getLogger(__name__)
+
+Row = Union[Dict[str, Any], Tuple[Any, ...]]
+
+
+def estimate_row_bytes(row: Row) -> int:
+    """Approximate serialised size of one row"""
+    try:
+        return len(json.dumps(row, default=str))
+    except (TypeError, ValueError):
+        return 1024
+
+
+class RecordStream:
+    """Single-pass iterator over a read query, holding one session open until exhausted or closed"""
+
+    def __init__(
+        self,
+        db,
+        query: str,
+        params: Dict[str, Any],
+        fetch_size: int,
+        as_tuples: bool = False,
+        max_rows: int = 0,
+        max_bytes: int = 0,
+        timeout: Optional[float] = None,
+    ):
+        # The READ_ACCESS session makes the server reject writes in the streamed statement
+        self.db = db
+        self.query = query
+        self.params = params
+        self.fetch_size = fetch_size
+        self.as_tuples = as_tuples
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+
+        self.keys: Tuple[str, ...] = ()
+        self.rows = 0
+        self.bytes = 0
+        self.truncated: Optional[str] = None  # "max_rows" | "max_bytes" when a cap stopped the stream
+        self._records = self._iterate()
+
+    def __iter__(self) -> Iterator[Row]:
+        return self
+
+    def __next__(self) -> Row:
+        return next(self._records)
+
+    def __enter__(self) -> "RecordStream":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop streaming and release the session; unread records are discarded server-side"""
+        self._records.close()
+
+    def _iterate(self) -> Iterator[Row]:
+        """Yield rows batch by batch, stopping at the configured caps"""
+        started = time.perf_counter()
+        summary, error = None, None
+
+        try:
+            with self.db.session(READ_ACCESS, fetch_size=self.fetch_size) as session:
+                result = session.run(Query(self.query, timeout=self.timeout), self.params)
+                self.keys = tuple(result.keys())
+                try:
+                    for record in result:
+                        if self.max_rows and self.rows >= self.max_rows:
+                            self.truncated = "max_rows"
+                            break
+
+                        row = tuple(record.values()) if self.as_tuples else record.data()
+                        if self.max_bytes:
+                            size = estimate_row_bytes(row)
+                            if self.bytes + size > self.max_bytes:
+                                self.truncated = "max_bytes"
+                                break
+                            self.bytes += size
+
+                        self.rows += 1
+                        yield row
+                finally:
+                    # Discards unread records server-side when the caller stopped early
+                    summary = result.consume()
+        except Exception as e:
+            error = failure_kind(e)
+            raise
+        finally:
+            get_query_metrics().record(
+                self.query,
+                self.params,
+                wall_ms=(time.perf_counter() - started) * 1000,
+                rows=self.rows,
+                server_available_ms=getattr(summary, "result_available_after", None),
+                server_consumed_ms=getattr(summary, "result_consumed_after", None),
+                error=error,
+            )
+            if self.truncated:
+                logger.info(
+                    f"Stream stopped at {self.truncated} after {self.rows} rows: {self.query[:100]}"
+                )
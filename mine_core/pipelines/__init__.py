@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Core Import Pipeline Package
+Streaming facility-data ingestion into the graph and bulk-load file export.
+"""
+
+from mine_core.pipelines.bulk_export import BulkExportResult, BulkLoadExporter, export_bulk_load
+from mine_core.pipelines.delta import CONTENT_HASH_PROPERTY, DeltaFilter, content_fingerprint
+from mine_core.pipelines.entity_graph import EntityDependencyGraph
+from mine_core.pipelines.ingestor import (
+    EntityBatch,
+    IngestionStats,
+    StreamingIngestor,
+    WriteTask,
+    ingest_facility_data,
+)
+from mine_core.pipelines.journal import ImportJournal
+from mine_core.pipelines.reader import (
+    iter_facility_records,
+    iter_json_records,
+    iter_jsonl_records,
+    iter_record_batches,
+)
+from mine_core.pipelines.scheduler import ImportScheduler, import_facilities
+from mine_core.pipelines.transformer import RecordTransformer
+
+__all__ = [
+    # Streaming ingestion
+    "StreamingIngestor",
+    "EntityBatch",
+    "IngestionStats",
+    "ingest_facility_data",
+    # Dependency-aware parallel import
+    "ImportScheduler",
+    "WriteTask",
+    "EntityDependencyGraph",
+    "import_facilities",
+    # Checkpointed, resumable runs
+    "ImportJournal",
+    # Content-hash delta imports
+    "DeltaFilter",
+    "content_fingerprint",
+    "CONTENT_HASH_PROPERTY",
+    # Offline bulk-load files
+    "BulkLoadExporter",
+    "BulkExportResult",
+    "export_bulk_load",
+    # Per-record mapping and normalisation
+    "RecordTransformer",
+    # Incremental file readers
+    "iter_facility_records",
+    "iter_json_records",
+    "iter_jsonl_records",
+    "iter_record_batches",
+]
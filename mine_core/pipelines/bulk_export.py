@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Bulk Export - Offline neo4j-admin and LOAD CSV Inputs
+Streams facility files through the record transformer into per-label CSV files.
+"""
+
+import csv
+import logging
+import shlex
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from configs.environment import (
+    get_bulk_export_config,
+    get_dynamic_label_config,
+    get_ingestion_config,
+)
+from mine_core.database.index_planner import IndexPlanner
+from mine_core.database.label_registry import DynamicLabelRegistry
+from mine_core.pipelines.delta import content_fingerprint
+from mine_core.pipelines.ingestor import facility_files
+from mine_core.pipelines.reader import iter_facility_records, iter_record_batches
+from mine_core.pipelines.transformer import FACILITY_ENTITY, RecordTransformer, RelationshipKey
+from mine_core.shared.field_utils import MISSING_DATA_CONTEXT
+
+logger = logging.getLogger(__name__)
+
+DYNAMIC_LABEL_COLUMN = "_dynamic_label"
+
+# neo4j-admin header suffixes; dates and text stay strings as in online imports
+_ADMIN_TYPES = {"boolean": "boolean", "integer": "long"}
+_CYPHER_CASTS = {"boolean": "toBoolean", "integer": "toInteger"}
+
+
+@dataclass
+class BulkExportResult:
+    """Files, row counts and load commands from one export"""
+
+    output_dir: Path
+    files: int = 0
+    records: int = 0
+    nodes: Dict[str, int] = field(default_factory=dict)
+    relationships: Dict[str, int] = field(default_factory=dict)
+    admin_script: Path = None
+    load_csv_script: Path = None
+    schema_script: Path = None
+    elapsed_seconds: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Export summary for logging"""
+        return {
+            "output_dir": str(self.output_dir),
+            "files": self.files,
+            "records": self.records,
+            "nodes": sum(self.nodes.values()),
+            "relationships": sum(self.relationships.values()),
+            "node_files": len(self.nodes),
+            "relationship_files": len(self.relationships),
+            "elapsed_seconds": self.elapsed_seconds,
+        }
+
+
+class BulkLoadExporter:
+    """Writes schema entities as headerless CSVs plus neo4j-admin and LOAD CSV scripts"""
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path] = None,
+        transformer: RecordTransformer = None,
+        batch_size: int = None,
+    ):
+        config = get_bulk_export_config()
+        ingestion = get_ingestion_config()
+        self.imports_dir = Path(config["imports_dir"])
+        self.output_dir = (
+            Path(output_dir) if output_dir else self.imports_dir / config["output_subdir"]
+        )
+        self.container_import_dir = config["container_import_dir"].rstrip("/")
+        self.database = config["database"]
+        self.batch_size = batch_size or config["load_csv_batch_size"]
+        self.array_delimiter = config["array_delimiter"]
+        self.records_key = ingestion["records_key"]
+        self.chunk_bytes = ingestion["read_chunk_bytes"]
+        self.hash_property = ingestion["content_hash_property"]
+        self.flush_every = ingestion["batch_size"]
+        if self.imports_dir.resolve() not in self.output_dir.resolve().parents:
+            logger.warning(
+                f"{self.output_dir} is outside {self.imports_dir}; "
+                f"load scripts assume its parent is mounted as the Neo4j import directory"
+            )
+
+        # Offline exports target an empty database, so there are no existing labels to seed
+        self.labels = DynamicLabelRegistry(
+            **{**get_dynamic_label_config(), "seed_from_database": False}
+        )
+        self.transformer = transformer or RecordTransformer()
+        self.primary_keys = self.transformer.primary_keys
+        self.columns = {name: self._columns(name) for name in self.transformer.load_order}
+
+    def export(
+        self, directory: Union[str, Path] = None, patterns: Iterable[str] = None
+    ) -> BulkExportResult:
+        """Export every facility file, then write the load scripts"""
+        started = time.perf_counter()
+        result = BulkExportResult(output_dir=self.output_dir)
+        node_dir = self.output_dir / "nodes"
+        rel_dir = self.output_dir / "relationships"
+        for subdir in (node_dir, rel_dir):
+            subdir.mkdir(parents=True, exist_ok=True)
+            # Stale files from an earlier export would be picked up by the load scripts
+            for stale in subdir.glob("*.csv"):
+                stale.unlink()
+
+        writers: Dict[Any, Tuple[Any, Any]] = {}
+
+        def writer(key, path: Path, header: List[str]):
+            if key not in writers:
+                handle = open(path, "w", encoding="utf-8", newline="")
+                writers[key] = (handle, csv.writer(handle))
+                header_path = path.with_suffix(".header.csv")
+                with open(header_path, "w", encoding="utf-8", newline="") as out:
+                    csv.writer(out).writerow(header)
+            return writers[key][1]
+
+        try:
+            for path in facility_files(directory, patterns):
+                facility_id = path.stem
+                result.files += 1
+                facility = {FACILITY_ENTITY: [self.transformer.facility(facility_id)]}
+                self._flush(facility, {}, writer, result)
+                records = iter_facility_records(path, self.records_key, self.chunk_bytes)
+                offset = 0
+                occurrences: Dict[str, int] = {}
+                for chunk in iter_record_batches(records, self.flush_every):
+                    rows, links = self.transformer.transform_batch(
+                        chunk, facility_id, offset, occurrences
+                    )
+                    self._flush(rows, links, writer, result)
+                    offset += len(chunk)
+                    result.records += len(chunk)
+        finally:
+            for handle, _ in writers.values():
+                handle.close()
+
+        specs = IndexPlanner(schema=self.transformer.schema).plan()
+        result.admin_script = self._write_admin_script(result)
+        result.load_csv_script = self._write_load_csv_script(result, specs)
+        result.schema_script = self._write_schema_script(specs)
+        result.elapsed_seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"Bulk export complete: {result.summary()}")
+        return result
+
+    def _flush(self, rows, links, writer, result: BulkExportResult):
+        """Append buffered entity rows and links to their CSV files"""
+        for entity_type, entity_rows in rows.items():
+            columns = self.columns[entity_type]
+            out = writer(
+                entity_type,
+                self.node_path(entity_type),
+                self.admin_node_header(entity_type),
+            )
+            for properties in entity_rows:
+                properties[self.hash_property] = content_fingerprint(properties, self.hash_property)
+                labels, label_value = self.labels.resolve(
+                    entity_type, properties.pop(DYNAMIC_LABEL_COLUMN, None)
+                )
+                if label_value:
+                    properties[self.labels.fallback_property] = label_value
+                if len(labels) > 1:
+                    properties[DYNAMIC_LABEL_COLUMN] = labels[1]
+                out.writerow([self._cell(properties.get(column)) for column, _ in columns])
+            result.nodes[entity_type] = result.nodes.get(entity_type, 0) + len(entity_rows)
+
+        for key, pairs in links.items():
+            name = self.relationship_name(key)
+            out = writer(key, self.relationship_path(key), self.admin_relationship_header(key))
+            out.writerows(pairs)
+            result.relationships[name] = result.relationships.get(name, 0) + len(pairs)
+
+    def _columns(self, entity_type: str) -> List[Tuple[str, str]]:
+        """(property, type) columns: primary key, schema properties, hash, label value and label"""
+        properties = self.transformer.entities[entity_type].get("properties", {})
+        primary_key = self.primary_keys[entity_type]
+        columns = [(primary_key, "string")]
+        columns += [
+            (name, spec.get("type", "string"))
+            for name, spec in properties.items()
+            if name != primary_key
+        ]
+        columns.append((self.hash_property, "string"))
+        if self.labels.enabled:
+            columns.append((self.labels.fallback_property, "string"))
+        columns.append((DYNAMIC_LABEL_COLUMN, "label"))
+        return columns
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        """CSV cell for a property value; missing values become empty (null) cells"""
+        # Same indicators SimplifiedDatabase drops, so both load paths store the same nodes
+        if value is None or (isinstance(value, str) and value in MISSING_DATA_CONTEXT):
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return value
+
+    @staticmethod
+    def relationship_name(key: RelationshipKey) -> str:
+        """File stem for one relationship type"""
+        return "-".join(key)
+
+    def node_path(self, entity_type: str) -> Path:
+        """Data file for one entity type"""
+        return self.output_dir / "nodes" / f"{entity_type}.csv"
+
+    def relationship_path(self, key: RelationshipKey) -> Path:
+        """Data file for one relationship type"""
+        return self.output_dir / "relationships" / f"{self.relationship_name(key)}.csv"
+
+    def admin_node_header(self, entity_type: str) -> List[str]:
+        """neo4j-admin header: id column in the label's id space, typed properties, extra label"""
+        header = []
+        for column, column_type in self.columns[entity_type]:
+            if column == self.primary_keys[entity_type]:
+                header.append(f"{column}:ID({entity_type})")
+            elif column_type == "label":
+                header.append(":LABEL")
+            elif column_type in _ADMIN_TYPES:
+                header.append(f"{column}:{_ADMIN_TYPES[column_type]}")
+            else:
+                header.append(column)
+        return header
+
+    @staticmethod
+    def admin_relationship_header(key: RelationshipKey) -> List[str]:
+        """neo4j-admin header for (child id, parent id) pairs"""
+        from_type, _, to_type = key
+        return [f":START_ID({from_type})", f":END_ID({to_type})"]
+
+    def container_path(self, path: Path) -> str:
+        """Path of an exported file as seen by the Neo4j container"""
+        return f"{self.container_import_dir}/{self._import_relative(path)}"
+
+    def _import_relative(self, path: Path) -> str:
+        """Path relative to the mounted import directory, as LOAD CSV file:/// URLs expect"""
+        try:
+            return path.resolve().relative_to(self.imports_dir.resolve()).as_posix()
+        except ValueError:
+            return path.relative_to(self.output_dir.parent).as_posix()
+
+    def _write_admin_script(self, result: BulkExportResult) -> Path:
+        """Offline full import into an empty, stopped database"""
+        arguments = [
+            "neo4j-admin database import full",
+            "--overwrite-destination=true",
+            "--id-type=string",
+            "--multiline-fields=true",
+            f"--array-delimiter={shlex.quote(self.array_delimiter)}",
+        ]
+        for entity_type in self.transformer.load_order:
+            if entity_type in result.nodes:
+                path = self.node_path(entity_type)
+                arguments.append(
+                    f"--nodes={entity_type}="
+                    f"{self.container_path(path.with_suffix('.header.csv'))},{self.container_path(path)}"
+                )
+        for key in self._exported_relationships(result):
+            path = self.relationship_path(key)
+            arguments.append(
+                f"--relationships={key[1]}="
+                f"{self.container_path(path.with_suffix('.header.csv'))},{self.container_path(path)}"
+            )
+        arguments.append(shlex.quote(self.database))
+
+        script = self.output_dir / "neo4j-admin-import.sh"
+        script.write_text(
+            "#!/bin/sh\n"
+            "# Run inside the Neo4j container with the database stopped, then apply schema.cypher\n"
+            "set -e\n" + " \\\n  ".join(arguments) + "\n",
+            encoding="utf-8",
+        )
+        script.chmod(0o755)
+        return script
+
+    def _write_load_csv_script(self, result: BulkExportResult, specs) -> Path:
+        """Online load into a running database: constraints, nodes, links, then indexes"""
+        statements = [spec.statement for spec in specs if spec.kind == "uniqueness"]
+
+        for entity_type in self.transformer.load_order:
+            if entity_type not in result.nodes:
+                continue
+            primary_key = self.primary_keys[entity_type]
+            assignments, label_index = [], None
+            for index, (column, column_type) in enumerate(self.columns[entity_type]):
+                if column == primary_key:
+                    continue
+                if column_type == "label":
+                    label_index = index
+                    continue
+                cast = _CYPHER_CASTS.get(column_type)
+                value = f"{cast}(row[{index}])" if cast else f"row[{index}]"
+                assignments.append(f"n.{column} = {value}")
+            statements.append(
+                f"LOAD CSV FROM 'file:///{self._import_relative(self.node_path(entity_type))}' AS row\n"
+                f"CALL {{\n"
+                f"  WITH row\n"
+                f"  MERGE (n:{entity_type} {{{primary_key}: row[0]}})\n"
+                f"  SET {', '.join(assignments)}\n"
+                f"  WITH n, row\n"
+                f"  CALL apoc.create.setLabels(n, ['{entity_type}'] + CASE WHEN row[{label_index}] "
+                f"IS NULL THEN [] ELSE [row[{label_index}]] END) YIELD node\n"
+                f"  RETURN count(node) AS rows\n"
+                f"}} IN TRANSACTIONS OF {self.batch_size} ROWS\n"
+                f"RETURN sum(rows) AS rows"
+            )
+
+        for key in self._exported_relationships(result):
+            from_type, rel_type, to_type = key
+            statements.append(
+                f"LOAD CSV FROM 'file:///{self._import_relative(self.relationship_path(key))}' AS row\n"
+                f"CALL {{\n"
+                f"  WITH row\n"
+                f"  MATCH (child:{from_type} {{{self.primary_keys[from_type]}: row[0]}})\n"
+                f"  MATCH (parent:{to_type} {{{self.primary_keys[to_type]}: row[1]}})\n"
+                f"  MERGE (child)-[:{rel_type}]->(parent)\n"
+                f"}} IN TRANSACTIONS OF {self.batch_size} ROWS"
+            )
+
+        # Secondary indexes build faster once, after the data is in
+        statements += [spec.statement for spec in specs if spec.kind != "uniqueness"]
+
+        script = self.output_dir / "load_csv.cypher"
+        script.write_text(
+            "// Run with cypher-shell against a running database; requires APOC for dynamic labels\n"
+            + ";\n\n".join(statements)
+            + ";\n",
+            encoding="utf-8",
+        )
+        return script
+
+    def _write_schema_script(self, specs) -> Path:
+        """Constraints and indexes to create after an offline neo4j-admin import"""
+        script = self.output_dir / "schema.cypher"
+        script.write_text(";\n".join(spec.statement for spec in specs) + ";\n", encoding="utf-8")
+        return script
+
+    def _exported_relationships(self, result: BulkExportResult) -> List[RelationshipKey]:
+        """Relationship types with exported links, in parent-before-child order"""
+        rank = {name: index for index, name in enumerate(self.transformer.load_order)}
+        keys = [
+            (child, rel_type, parent)
+            for child, (rel_type, parent) in self.transformer.parents.items()
+            if self.relationship_name((child, rel_type, parent)) in result.relationships
+        ]
+        return sorted(keys, key=lambda key: rank.get(key[0], len(rank)))
+
+
+def export_bulk_load(
+    directory: Union[str, Path] = None, output_dir: Union[str, Path] = None
+) -> BulkExportResult:
+    """Export all facility files under the data directory for offline bulk loading"""
+    return BulkLoadExporter(output_dir=output_dir).export(directory)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Delta Filter - Content Fingerprints for Incremental Imports
+Drops entities whose stored hash matches, so re-imports write only new or changed rows.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Set, Tuple
+
+from mine_core.pipelines.transformer import RelationshipKey
+
+logger = logging.getLogger(__name__)
+
+CONTENT_HASH_PROPERTY = "content_hash"
+
+
+def content_fingerprint(
+    properties: Dict[str, Any], hash_property: str = CONTENT_HASH_PROPERTY
+) -> str:
+    """Stable digest of normalised properties, dynamic label included, key order ignored"""
+    canonical = json.dumps(
+        {key: value for key, value in properties.items() if key != hash_property},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class DeltaFilter:
+    """Compares batch rows against the hashes stored on their nodes"""
+
+    def __init__(
+        self, db, primary_keys: Dict[str, str], hash_property: str = CONTENT_HASH_PROPERTY
+    ):
+        self.db = db
+        self.primary_keys = primary_keys
+        self.hash_property = hash_property
+
+    def stamp(self, entities: Dict[str, List[Dict[str, Any]]]):
+        """Set the content hash on every row, so full imports keep stored hashes current"""
+        for rows in entities.values():
+            for row in rows:
+                row[self.hash_property] = content_fingerprint(row, self.hash_property)
+
+    def apply(
+        self,
+        entities: Dict[str, List[Dict[str, Any]]],
+        relationships: Dict[RelationshipKey, List[Tuple[Any, Any]]],
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[RelationshipKey, List[Tuple[Any, Any]]], int]:
+        """Stamp hashes and keep changed rows plus the links of changed or unlinked children"""
+        changed: Dict[str, List[Dict[str, Any]]] = {}
+        relink_ids: Dict[str, Set[Any]] = {}
+        skipped = 0
+        # Schema relationships are many-to-one, so a child type has a single parent link
+        parent_links = {key[0]: key for key in relationships}
+
+        self.stamp(entities)
+        for entity_type, rows in entities.items():
+            primary_key = self.primary_keys[entity_type]
+            stored = self.stored_state(
+                entity_type, [row[primary_key] for row in rows], parent_links.get(entity_type)
+            )
+            kept = [
+                row
+                for row in rows
+                if stored.get(row[primary_key], (None,))[0] != row[self.hash_property]
+            ]
+            skipped += len(rows) - len(kept)
+            if kept:
+                changed[entity_type] = kept
+            # The hash is written with the node, before its link; a failed link write must
+            # not leave an unchanged child detached for good
+            relink_ids[entity_type] = {row[primary_key] for row in kept} | {
+                node_id for node_id, (_, linked) in stored.items() if not linked
+            }
+
+        links: Dict[RelationshipKey, List[Tuple[Any, Any]]] = {}
+        for key, pairs in relationships.items():
+            ids = relink_ids.get(key[0], set())
+            kept_pairs = [pair for pair in pairs if pair[0] in ids]
+            if kept_pairs:
+                links[key] = kept_pairs
+
+        return changed, links, skipped
+
+    def stored_state(
+        self, entity_type: str, ids: List[Any], parent_link: RelationshipKey = None
+    ) -> Dict[Any, Tuple[str, bool]]:
+        """Stored hash and whether the parent link exists for the nodes with these ids"""
+        if not ids:
+            return {}
+        primary_key = self.primary_keys[entity_type]
+        linked = "true"
+        if parent_link:
+            _, rel_type, parent_type = parent_link
+            linked = f"EXISTS {{ (n)-[:{rel_type}]->(:{parent_type}) }}"
+        rows = self.db.read_query(
+            f"""
+            UNWIND $ids AS id
+            MATCH (n:{entity_type} {{{primary_key}: id}})
+            RETURN id, n.{self.hash_property} AS hash, {linked} AS linked
+            """,
+            {"ids": ids},
+            use_cache=False,
+        )
+        return {row["id"]: (row["hash"], row["linked"]) for row in rows}
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Entity Dependency Graph - Parent-Before-Child Ordering of Entity Types
+DAG over schema relationships and entity connections for import scheduling.
+"""
+
+import logging
+from typing import Any, Dict, List, Set, Tuple
+
+from configs.environment import get_entity_connections, get_schema, get_system_constants
+
+logger = logging.getLogger(__name__)
+
+Edge = Tuple[str, str, str]  # (child, relationship, parent)
+
+
+class EntityDependencyGraph:
+    """Directed acyclic graph of entity types, edges pointing from child to parent"""
+
+    def __init__(
+        self,
+        schema: Dict[str, Any] = None,
+        connections: Dict[str, Any] = None,
+        load_order: List[str] = None,
+    ):
+        schema = schema or get_schema()
+        if connections is None:
+            try:
+                connections = get_entity_connections()
+            except FileNotFoundError:
+                connections = {}
+        if load_order is None:
+            load_order = get_system_constants().get("processing", {}).get("entity_load_order", [])
+
+        self.entities = [entity["name"] for entity in schema.get("entities", [])]
+        edges = [(rel["from"], rel["type"], rel["to"]) for rel in schema.get("relationships", [])]
+        edges += [
+            (conn["from"], conn.get("relationship", ""), conn["to"])
+            for conn in connections.get("workflow_connections", {}).get("primary_workflow_flow", [])
+            if conn.get("from") in self.entities and conn.get("to") in self.entities
+        ]
+
+        self.edges: List[Edge] = []
+        self.parents: Dict[str, List[Tuple[str, str]]] = {name: [] for name in self.entities}
+        seen: Set[Tuple[str, str]] = set()
+        for child, rel_type, parent in edges:
+            if (child, parent) in seen:
+                continue
+            seen.add((child, parent))
+            self.edges.append((child, rel_type, parent))
+            self.parents[child].append((rel_type, parent))
+
+        rank = {name: index for index, name in enumerate(load_order)}
+        self._rank = lambda name: rank.get(name, len(rank))
+        self.levels = self._levels()
+        self.order = [name for level in self.levels for name in level]
+
+    def dependencies(self, entity_type: str) -> List[str]:
+        """Parent entity types that must exist before this type can be linked"""
+        return [parent for _, parent in self.parents.get(entity_type, [])]
+
+    def _levels(self) -> List[List[str]]:
+        """Kahn layering: each level depends only on earlier levels"""
+        remaining = sorted(self.entities, key=self._rank)
+        placed: Set[str] = set()
+        levels: List[List[str]] = []
+        while remaining:
+            ready = [
+                name
+                for name in remaining
+                if all(parent in placed for parent in self.dependencies(name))
+            ]
+            if not ready:
+                raise ValueError(f"Cyclic entity relationships among {remaining}")
+            levels.append(ready)
+            placed.update(ready)
+            remaining = [name for name in remaining if name not in placed]
+        return levels
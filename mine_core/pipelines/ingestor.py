@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Streaming Ingestor - Bounded-Memory Facility Import
+Reads, maps and writes records in fixed-size batches through a bounded queue.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from configs.environment import get_data_directory, get_ingestion_config
+from mine_core.pipelines.delta import DeltaFilter
+from mine_core.pipelines.journal import BATCH_TASK, ImportJournal
+from mine_core.pipelines.reader import iter_facility_records, iter_record_batches
+from mine_core.pipelines.transformer import (
+    FACILITY_ENTITY,
+    RecordTransformer,
+    RelationshipKey,
+)
+from mine_core.shared.common import handle_error
+
+logger = logging.getLogger(__name__)
+
+_END_OF_FILE = object()
+
+
+def relationship_task(key: RelationshipKey) -> str:
+    """Write-task name for one relationship type"""
+    from_type, rel_type, to_type = key
+    return f"{from_type}-[{rel_type}]->{to_type}"
+
+
+@dataclass
+class EntityBatch:
+    """Entities and parent links mapped from a fixed number of consecutive records"""
+
+    facility_id: str
+    sequence: int
+    offset: int = 0  # index of the batch's first record in its source file
+    records: int = 0
+    unchanged: int = 0  # rows dropped by the delta filter
+    resumed: bool = False  # every write already committed by an earlier run
+    entities: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    relationships: Dict[RelationshipKey, List[Tuple[Any, Any]]] = field(default_factory=dict)
+
+    @property
+    def rows(self) -> int:
+        """Entity rows across all types"""
+        return sum(len(rows) for rows in self.entities.values())
+
+
+@dataclass
+class WriteTask:
+    """One write of a batch and the writes that must finish before it starts"""
+
+    name: str
+    run: Callable[[], Dict[str, Any]]
+    depends_on: Tuple[str, ...] = ()
+
+    @property
+    def is_relationship(self) -> bool:
+        return "-[" in self.name
+
+
+@dataclass
+class IngestionStats:
+    """Totals for one or more ingested files"""
+
+    files: int = 0
+    records: int = 0
+    batches: int = 0
+    entities: Dict[str, int] = field(default_factory=dict)
+    unchanged: int = 0
+    relationships: int = 0
+    resumed_batches: int = 0
+    resumed_writes: int = 0
+    failed_batches: int = 0
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.failed_batches == 0
+
+    @property
+    def records_per_second(self) -> float:
+        return round(self.records / self.elapsed_seconds, 1) if self.elapsed_seconds else 0.0
+
+    def add_batch(self, batch: "EntityBatch", result: Dict[str, Any]):
+        """Count one written batch"""
+        self.batches += 1
+        self.records += batch.records
+        self.unchanged += batch.unchanged
+        self.resumed_batches += int(batch.resumed)
+        self.resumed_writes += result["resumed"]
+        self.relationships += result["relationships"]
+        for entity_type, count in result["entities"].items():
+            self.entities[entity_type] = self.entities.get(entity_type, 0) + count
+        if not result["success"]:
+            self.failed_batches += 1
+            self.failures.extend(result["failures"])
+            logger.warning(f"Batch at record {batch.offset} of facility {batch.facility_id} failed")
+
+    def merge(self, other: "IngestionStats"):
+        """Fold another file's totals into these"""
+        self.files += other.files
+        self.records += other.records
+        self.unchanged += other.unchanged
+        self.batches += other.batches
+        self.relationships += other.relationships
+        self.resumed_batches += other.resumed_batches
+        self.resumed_writes += other.resumed_writes
+        self.failed_batches += other.failed_batches
+        self.failures.extend(other.failures)
+        self.elapsed_seconds += other.elapsed_seconds
+        for entity_type, count in other.entities.items():
+            self.entities[entity_type] = self.entities.get(entity_type, 0) + count
+
+    def summary(self) -> Dict[str, Any]:
+        """Run report: volumes, throughput, resumed work and failed batches"""
+        return {
+            "files": self.files,
+            "records": self.records,
+            "batches": self.batches,
+            "entities": dict(self.entities),
+            "relationships": self.relationships,
+            "unchanged_rows": self.unchanged,
+            "resumed_batches": self.resumed_batches,
+            "resumed_writes": self.resumed_writes,
+            "failed_batches": self.failed_batches,
+            "failures": list(self.failures),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "records_per_second": self.records_per_second,
+            "success": self.success,
+        }
+
+
+class StreamingIngestor:
+    """Parses on a reader thread while the caller's thread writes, one bounded queue between"""
+
+    def __init__(
+        self,
+        db=None,
+        transformer: RecordTransformer = None,
+        batch_size: int = None,
+        queue_depth: int = None,
+        delta: bool = None,
+        journal: Optional[ImportJournal] = None,
+    ):
+        if db is None:
+            # Import here to avoid circular dependency
+            from mine_core.database.db import get_database
+
+            db = get_database()
+
+        config = get_ingestion_config()
+        self.db = db
+        self.transformer = transformer or RecordTransformer()
+        self.batch_size = batch_size or config["batch_size"]
+        # Peak memory is about queue_depth + 2 batches: queued, being built, being written
+        self.queue_depth = queue_depth or config["queue_depth"]
+        self.read_chunk_bytes = config["read_chunk_bytes"]
+        self.records_key = config["records_key"]
+        self.file_patterns = config["file_patterns"]
+        self.delta = config["delta_mode"] if delta is None else delta
+        self.delta_filter = DeltaFilter(
+            db, self.transformer.primary_keys, config["content_hash_property"]
+        )
+        self.journal = journal
+
+    def batches(self, path: Union[str, Path], facility_id: str = None) -> Iterator[EntityBatch]:
+        """Map a facility file into fixed-size batches; the first also carries the Facility"""
+        path = Path(path)
+        facility_id = facility_id or path.stem
+        if self.journal is not None:
+            self.journal.begin_source(facility_id, path)
+        records = iter_facility_records(
+            path, records_key=self.records_key, chunk_bytes=self.read_chunk_bytes
+        )
+
+        sequence, offset = 0, 0
+        occurrences: Dict[str, int] = {}
+        for chunk in iter_record_batches(records, self.batch_size):
+            entities, relationships = self.transformer.transform_batch(
+                chunk, facility_id, offset, occurrences
+            )
+            batch = EntityBatch(
+                facility_id=facility_id,
+                sequence=sequence,
+                offset=offset,
+                records=len(chunk),
+                relationships=relationships,
+            )
+            if sequence == 0:
+                batch.entities[FACILITY_ENTITY] = [self.transformer.facility(facility_id)]
+            batch.entities.update(entities)
+            yield self._prepare(batch)
+            sequence += 1
+            offset += len(chunk)
+
+        if sequence == 0:
+            batch = EntityBatch(facility_id=facility_id, sequence=sequence)
+            batch.entities[FACILITY_ENTITY] = [self.transformer.facility(facility_id)]
+            yield self._prepare(batch)
+
+    def _prepare(self, batch: EntityBatch) -> EntityBatch:
+        """Drop fully journaled batches, then filter or stamp content hashes"""
+        if self.journal is not None and self.journal.is_committed(
+            batch.facility_id, batch.offset, batch.records, BATCH_TASK
+        ):
+            batch.entities, batch.relationships, batch.resumed = {}, {}, True
+            return batch
+
+        if self.delta:
+            batch.entities, batch.relationships, batch.unchanged = self.delta_filter.apply(
+                batch.entities, batch.relationships
+            )
+        else:
+            self.delta_filter.stamp(batch.entities)
+        return batch
+
+    def plan(self, batch: EntityBatch) -> Tuple[List[WriteTask], int]:
+        """Writes still to do for a batch, and how many the journal shows as committed"""
+        tasks: List[WriteTask] = []
+        resumed = 0
+
+        def committed(name: str) -> bool:
+            return self.journal is not None and self.journal.is_committed(
+                batch.facility_id, batch.offset, batch.records, name
+            )
+
+        for entity_type in self.transformer.load_order:
+            rows = batch.entities.get(entity_type)
+            if not rows:
+                continue
+            if committed(entity_type):
+                resumed += 1
+                continue
+            tasks.append(
+                WriteTask(
+                    name=entity_type,
+                    run=lambda entity_type=entity_type, rows=rows: self.db.bulk_create_entities(
+                        entity_type, rows, batch_size=len(rows)
+                    ),
+                )
+            )
+
+        written = {task.name for task in tasks}
+        for key, pairs in batch.relationships.items():
+            name = relationship_task(key)
+            if committed(name):
+                resumed += 1
+                continue
+            from_type, _, to_type = key
+            tasks.append(
+                WriteTask(
+                    name=name,
+                    run=lambda key=key, pairs=pairs: self.db.bulk_create_relationships(
+                        {key: pairs}, batch_size=len(pairs)
+                    ),
+                    # Endpoints written by earlier batches or runs, e.g. the Facility, already exist
+                    depends_on=tuple(t for t in (from_type, to_type) if t in written),
+                )
+            )
+        return tasks, resumed
+
+    @staticmethod
+    def new_result(resumed: int = 0) -> Dict[str, Any]:
+        """Empty per-batch write result"""
+        return {
+            "entities": {},
+            "relationships": 0,
+            "resumed": resumed,
+            "success": True,
+            "failures": [],
+        }
+
+    def record_write(
+        self, batch: EntityBatch, task: WriteTask, stats: Dict[str, Any], result: Dict[str, Any]
+    ):
+        """Fold one write's stats into the batch result and checkpoint it"""
+        if task.is_relationship:
+            count = stats.get("linked", 0)
+            result["relationships"] += count
+        else:
+            count = stats.get("rows", 0)
+            result["entities"][task.name] = count
+
+        if stats.get("success"):
+            if self.journal is not None:
+                self.journal.commit(batch.facility_id, batch.offset, batch.records, task.name, count)
+            return
+
+        result["success"] = False
+        error = stats.get("error")
+        result["failures"].append(
+            {
+                "facility": batch.facility_id,
+                "offset": batch.offset,
+                "records": batch.records,
+                "task": task.name,
+                "error": error,
+            }
+        )
+        if self.journal is not None:
+            self.journal.record_failure(batch.facility_id, batch.offset, task.name, error)
+
+    def finish_batch(self, batch: EntityBatch, result: Dict[str, Any]):
+        """Checkpoint the whole batch once all of its writes committed"""
+        if self.journal is not None and result["success"] and not batch.resumed:
+            self.journal.commit(batch.facility_id, batch.offset, batch.records, BATCH_TASK)
+
+    def write_batch(self, batch: EntityBatch) -> Dict[str, Any]:
+        """Write one batch, parents before children, then link it"""
+        tasks, resumed = self.plan(batch)
+        result = self.new_result(resumed)
+        failed = set()
+        for task in tasks:
+            stats = self.blocked(task, failed) or task.run()
+            if not stats.get("success"):
+                failed.add(task.name)
+            self.record_write(batch, task, stats, result)
+        self.finish_batch(batch, result)
+        return result
+
+    @staticmethod
+    def blocked(task: WriteTask, failed: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Failure stats for a link whose endpoint write failed, so it is retried on resume"""
+        failed_deps = [dep for dep in task.depends_on if dep in failed]
+        if failed_deps:
+            return {"success": False, "error": f"Skipped after failed {', '.join(failed_deps)}"}
+        return None
+
+    def prefetch(self, path: Union[str, Path], facility_id: str = None) -> Iterator[EntityBatch]:
+        """Yield batches mapped ahead on a reader thread, at most queue_depth waiting"""
+        path = Path(path)
+        batches: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_depth)
+        stop = threading.Event()
+
+        def offer(item) -> bool:
+            # Blocks while the writer is queue_depth batches behind, until it gives up
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for batch in self.batches(path, facility_id):
+                    if not offer(batch):
+                        return
+                offer(_END_OF_FILE)
+            except Exception as e:
+                offer(e)
+
+        reader = threading.Thread(target=produce, name=f"ingest-{path.stem}", daemon=True)
+        reader.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is _END_OF_FILE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            reader.join()
+
+    def ingest_file(self, path: Union[str, Path], facility_id: str = None) -> IngestionStats:
+        """Stream one facility file into the database with bounded memory"""
+        path = Path(path)
+        stats = IngestionStats(files=1)
+        started = time.perf_counter()
+
+        try:
+            with self.db.deferred_chain_maintenance():
+                for batch in self.prefetch(path, facility_id):
+                    stats.add_batch(batch, self.write_batch(batch))
+        except Exception as e:
+            handle_error(logger, e, f"Streaming ingestion of {path}")
+            stats.failed_batches += 1
+            stats.failures.append({"facility": facility_id or path.stem, "error": str(e)})
+
+        stats.elapsed_seconds = round(time.perf_counter() - started, 3)
+        logger.info(
+            f"Ingested {stats.records} records from {path.name} in {stats.batches} batches "
+            f"({stats.records_per_second} records/s)"
+        )
+        return stats
+
+    def ingest_directory(
+        self, directory: Union[str, Path] = None, patterns: Iterable[str] = None
+    ) -> IngestionStats:
+        """Stream every facility file in a directory, one file at a time"""
+        totals = IngestionStats()
+        with self.db.deferred_chain_maintenance():
+            for path in self.facility_files(directory, patterns):
+                totals.merge(self.ingest_file(path))
+        self.end_run(totals)
+        return totals
+
+    def end_run(self, totals: IngestionStats):
+        """Log the run summary; a clean run leaves no checkpoints to resume from"""
+        logger.info(
+            f"Import finished: {totals.records} records ({totals.records_per_second} records/s), "
+            f"{totals.resumed_batches} batches resumed, {totals.failed_batches} failed"
+        )
+        for failure in totals.failures:
+            logger.warning(f"Failed import write: {failure}")
+        if self.journal is not None:
+            if totals.success:
+                self.journal.reset()
+            else:
+                self.journal.close()
+                logger.info(f"Checkpoints kept in {self.journal.path}; rerun to resume")
+
+    def facility_files(
+        self, directory: Union[str, Path] = None, patterns: Iterable[str] = None
+    ) -> List[Path]:
+        """Facility files matching the configured patterns, in name order"""
+        return facility_files(directory, patterns or self.file_patterns)
+
+
+def facility_files(
+    directory: Union[str, Path] = None, patterns: Iterable[str] = None
+) -> List[Path]:
+    """Facility files under a directory (default data/facility_data), in name order"""
+    directory = Path(directory) if directory else get_data_directory()
+    files = {
+        path
+        for pattern in (patterns or get_ingestion_config()["file_patterns"])
+        for path in directory.glob(pattern)
+        if path.is_file()
+    }
+    return sorted(files)
+
+
+def default_journal(resume: bool = True) -> Optional[ImportJournal]:
+    """Journal from configuration, emptied first unless resuming"""
+    if not get_ingestion_config()["journal_enabled"]:
+        return None
+    journal = ImportJournal()
+    if not resume:
+        journal.reset()
+    return journal
+
+
+def ingest_facility_data(
+    directory: Union[str, Path] = None, db=None, delta: bool = None, resume: bool = True
+) -> IngestionStats:
+    """Stream all facility files under the data directory into the database"""
+    return StreamingIngestor(
+        db=db, delta=delta, journal=default_journal(resume)
+    ).ingest_directory(directory)
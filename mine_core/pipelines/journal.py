@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Import Journal - Local Checkpoints for Resumable Imports
+Append-only log of committed batch writes keyed by facility, write and record offset.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from configs.environment import get_ingestion_config
+
+logger = logging.getLogger(__name__)
+
+# Task name recorded once every write of a batch has committed
+BATCH_TASK = "*"
+
+
+def source_fingerprint(path: Union[str, Path]) -> str:
+    """Cheap identity of a source file version: size and modification time"""
+    stat = Path(path).stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class ImportJournal:
+    """Records committed writes so a restarted import skips them"""
+
+    def __init__(self, path: Union[str, Path] = None):
+        self.path = Path(path or get_ingestion_config()["journal_path"])
+        self._lock = threading.Lock()
+        self._committed: Dict[Tuple[str, int, str], int] = {}  # (facility, offset, task) -> records
+        self._sources: Dict[str, str] = {}
+        self._handle = None
+        self._load()
+
+    def _load(self):
+        """Replay the journal file left by an interrupted run"""
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave the final line half written
+                    continue
+                if entry.get("event") == "source":
+                    self._apply_source(entry["facility"], entry["fingerprint"])
+                elif entry.get("event") == "commit":
+                    key = (entry["facility"], entry["offset"], entry["task"])
+                    self._committed[key] = entry["records"]
+        if self._committed:
+            logger.info(f"Resuming from {len(self._committed)} journaled writes in {self.path}")
+
+    def _apply_source(self, facility_id: str, fingerprint: str):
+        """Forget a facility's checkpoints once its source file has changed"""
+        if self._sources.get(facility_id, fingerprint) != fingerprint:
+            self._committed = {
+                key: records for key, records in self._committed.items() if key[0] != facility_id
+            }
+        self._sources[facility_id] = fingerprint
+
+    def begin_source(self, facility_id: str, path: Union[str, Path]):
+        """Register the source file version checkpoints for this facility refer to"""
+        fingerprint = source_fingerprint(path)
+        with self._lock:
+            if self._sources.get(facility_id) == fingerprint:
+                return
+            if facility_id in self._sources:
+                logger.info(f"Source for {facility_id} changed, discarding its checkpoints")
+            self._apply_source(facility_id, fingerprint)
+            self._append({"event": "source", "facility": facility_id, "fingerprint": fingerprint})
+
+    def is_committed(self, facility_id: str, offset: int, records: int, task: str) -> bool:
+        """Whether this write of a same-sized batch already committed"""
+        return self._committed.get((facility_id, offset, task)) == records
+
+    def commit(self, facility_id: str, offset: int, records: int, task: str, rows: int = 0):
+        """Durably record one committed write"""
+        with self._lock:
+            self._committed[(facility_id, offset, task)] = records
+            self._append(
+                {
+                    "event": "commit",
+                    "facility": facility_id,
+                    "offset": offset,
+                    "records": records,
+                    "task": task,
+                    "rows": rows,
+                    "at": round(time.time(), 3),
+                }
+            )
+
+    def record_failure(self, facility_id: str, offset: int, task: str, error: Optional[str]):
+        """Log a failed write for the run summary; it is retried on resume"""
+        with self._lock:
+            self._append(
+                {
+                    "event": "failed",
+                    "facility": facility_id,
+                    "offset": offset,
+                    "task": task,
+                    "error": error,
+                    "at": round(time.time(), 3),
+                }
+            )
+
+    def reset(self):
+        """Start a fresh run, discarding all checkpoints"""
+        with self._lock:
+            self.close()
+            self._committed.clear()
+            self._sources.clear()
+            if self.path.exists():
+                self.path.unlink()
+
+    def close(self):
+        """Close the journal file"""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _append(self, entry: Dict[str, Any]):
+        """Write and fsync one line so it survives a crash"""
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.path, "a", encoding="utf-8")
+        self._handle.write(json.dumps(entry) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Facility Record Reader - Incremental JSON and JSONL Parsing
+Yields raw facility records one at a time without loading the whole file.
+"""
+
+import json
+import logging
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+logger = logging.getLogger(__name__)
+
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+
+_WHITESPACE = " \t\n\r\ufeff"
+
+
+class _JsonTokenizer:
+    """Chunked cursor over a text file that decodes one JSON value at a time"""
+
+    def __init__(self, handle: TextIO, chunk_bytes: int):
+        self.handle = handle
+        self.chunk_bytes = chunk_bytes
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping the consumed prefix; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.handle.read(self.chunk_bytes)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at end of file"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, token: str):
+        """Consume a structural character"""
+        found = self.peek()
+        if found != token:
+            raise ValueError(f"Expected '{token}' but found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value, reading further chunks until it is whole"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_records(
+    path: Union[str, Path], records_key: str = "records", chunk_bytes: int = 65536
+) -> Iterator[Dict[str, Any]]:
+    """Stream records from a top-level array, an object holding records_key, or a single record"""
+    with open(path, "r", encoding="utf-8") as handle:
+        tokens = _JsonTokenizer(handle, chunk_bytes)
+        first = tokens.peek()
+
+        if first == "[":
+            yield from _iter_array(tokens, path)
+        elif first == "{":
+            tokens.expect("{")
+            record: Dict[str, Any] = {}
+            streamed = False
+            while tokens.peek() != "}":
+                if record or streamed:
+                    tokens.expect(",")
+                key = tokens.value()
+                tokens.expect(":")
+                if key == records_key and tokens.peek() == "[":
+                    yield from _iter_array(tokens, path)
+                    streamed = True
+                else:
+                    record[key] = tokens.value()
+            if not streamed:
+                yield record
+        elif first:
+            raise ValueError(f"Unsupported JSON document in {path}: starts with '{first}'")
+
+
+def _iter_array(tokens: _JsonTokenizer, path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Yield object elements of the array at the cursor"""
+    tokens.expect("[")
+    index = 0
+    while tokens.peek() != "]":
+        if index:
+            tokens.expect(",")
+        element = tokens.value()
+        if isinstance(element, dict):
+            yield element
+        else:
+            logger.warning(f"Skipping non-object element {index} in {path}")
+        index += 1
+    tokens.expect("]")
+
+
+def iter_jsonl_records(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Stream records from a JSON Lines file, skipping blank and malformed lines"""
+    with open(path, "r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping malformed line {line_number} in {path}: {e}")
+                continue
+            if isinstance(record, dict):
+                yield record
+            else:
+                logger.warning(f"Skipping non-object line {line_number} in {path}")
+
+
+def iter_facility_records(
+    path: Union[str, Path], records_key: str = "records", chunk_bytes: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """Stream raw records from a facility file, choosing the parser by extension"""
+    path = Path(path)
+    if path.suffix.lower() in JSONL_SUFFIXES:
+        return iter_jsonl_records(path)
+    return iter_json_records(path, records_key=records_key, chunk_bytes=chunk_bytes or 65536)
+
+
+def iter_record_batches(
+    records: Iterable[Dict[str, Any]], batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Group a record stream into lists of at most batch_size records"""
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Import Scheduler - Dependency-Aware Parallel Facility Loading
+Runs each batch as a DAG of entity and relationship writes on a shared worker pool.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, Union
+
+from configs.environment import get_import_scheduler_config
+from mine_core.database.db import RETRYABLE_ERRORS
+from mine_core.pipelines.ingestor import (
+    EntityBatch,
+    IngestionStats,
+    StreamingIngestor,
+    WriteTask,
+    default_journal,
+)
+from mine_core.pipelines.journal import ImportJournal
+from mine_core.pipelines.transformer import RecordTransformer
+from mine_core.shared.common import handle_error
+
+logger = logging.getLogger(__name__)
+
+
+class ImportScheduler:
+    """Loads facilities concurrently, serialising writes only on relationship endpoints"""
+
+    def __init__(
+        self,
+        db=None,
+        transformer: RecordTransformer = None,
+        max_workers: int = None,
+        facility_workers: int = None,
+        max_attempts: int = None,
+        batch_size: int = None,
+        delta: bool = None,
+        journal: ImportJournal = None,
+    ):
+        config = get_import_scheduler_config()
+        self.ingestor = StreamingIngestor(
+            db=db, transformer=transformer, batch_size=batch_size, delta=delta, journal=journal
+        )
+        self.db = self.ingestor.db
+        self.graph = self.ingestor.transformer.graph
+
+        if config["dependency_resolution"] != "topological_sort":
+            logger.warning(
+                f"Unsupported dependency_resolution '{config['dependency_resolution']}', "
+                f"using topological_sort"
+            )
+        parallel = config["parallel_entity_loading"]
+        self.max_workers = (max_workers or config["max_workers"]) if parallel else 1
+        self.facility_workers = (facility_workers or config["facility_workers"]) if parallel else 1
+        self.max_attempts = max(1, max_attempts or config["max_attempts"])
+        self.retry_backoff = config["retry_backoff_seconds"]
+        self.continue_on_error = config["continue_on_error"]
+
+        self._stop = threading.Event()
+
+    def run(self, directory: Union[str, Path] = None, patterns: Iterable[str] = None) -> IngestionStats:
+        """Import every facility file, several files and several writes at a time"""
+        files = self.ingestor.facility_files(directory, patterns)
+        totals = IngestionStats()
+        started = time.perf_counter()
+        self._stop.clear()
+
+        logger.info(
+            f"Importing {len(files)} facility files with {self.facility_workers} facility workers "
+            f"and {self.max_workers} write workers"
+        )
+        with self.db.deferred_chain_maintenance():
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="import-write"
+            ) as writers, ThreadPoolExecutor(
+                max_workers=max(1, min(self.facility_workers, len(files))),
+                thread_name_prefix="import-facility",
+            ) as facilities:
+                for stats in facilities.map(lambda path: self.import_file(path, writers), files):
+                    totals.merge(stats)
+
+        # Facilities overlap, so wall time rather than the sum of per-file times
+        totals.elapsed_seconds = round(time.perf_counter() - started, 3)
+        self.ingestor.end_run(totals)
+        return totals
+
+    def import_file(self, path: Path, writers: ThreadPoolExecutor) -> IngestionStats:
+        """Stream one file, running each batch's write DAG before taking the next batch"""
+        stats = IngestionStats(files=1)
+        started = time.perf_counter()
+        try:
+            for batch in self.ingestor.prefetch(path):
+                if self._stop.is_set():
+                    break
+                stats.add_batch(batch, self.run_batch(batch, writers))
+                if stats.failed_batches and not self.continue_on_error:
+                    self._stop.set()
+        except Exception as e:
+            handle_error(logger, e, f"Parallel import of {path}")
+            stats.failed_batches += 1
+            stats.failures.append({"facility": path.stem, "error": str(e)})
+            if not self.continue_on_error:
+                self._stop.set()
+
+        stats.elapsed_seconds = round(time.perf_counter() - started, 3)
+        return stats
+
+    def run_batch(self, batch: EntityBatch, writers: ThreadPoolExecutor) -> Dict[str, Any]:
+        """Submit tasks as their dependencies finish; result matches StreamingIngestor.write_batch"""
+        tasks, resumed = self.ingestor.plan(batch)
+        result = self.ingestor.new_result(resumed)
+        pending = {task.name: task for task in tasks}
+        done, failed = set(), set()
+        running: Dict[Future, WriteTask] = {}
+
+        while pending or running:
+            for name, task in list(pending.items()):
+                if not all(dep in done for dep in task.depends_on):
+                    continue
+                del pending[name]
+                blocked = self.ingestor.blocked(task, failed)
+                if blocked:
+                    self.ingestor.record_write(batch, task, blocked, result)
+                    done.add(name)
+                    failed.add(name)
+                else:
+                    running[writers.submit(self._execute, task)] = task
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                task = running.pop(future)
+                stats = future.result()
+                self.ingestor.record_write(batch, task, stats, result)
+                done.add(task.name)
+                if not stats.get("success"):
+                    failed.add(task.name)
+
+        self.ingestor.finish_batch(batch, result)
+        return result
+
+    def _execute(self, task: WriteTask) -> Dict[str, Any]:
+        """Run a write, retrying only deadlocks and other transient errors, with backoff"""
+        stats: Dict[str, Any] = {"success": False}
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                stats = task.run()
+                # Bulk writers catch their own errors and flag the transient ones
+                if stats["success"] or not stats.get("retryable"):
+                    return stats
+            except RETRYABLE_ERRORS as e:
+                stats = {"success": False, "error": str(e), "retryable": True}
+            except Exception as e:
+                handle_error(logger, e, f"Import write {task.name}")
+                return {"success": False, "error": str(e)}
+
+            if attempt < self.max_attempts:
+                delay = self.retry_backoff * 2 ** (attempt - 1)
+                logger.warning(
+                    f"Import write {task.name} failed (attempt {attempt}/{self.max_attempts}), "
+                    f"retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+        return stats
+
+
+def import_facilities(
+    directory: Union[str, Path] = None, db=None, delta: bool = None, resume: bool = True
+) -> IngestionStats:
+    """Import all facility files under the data directory in parallel"""
+    return ImportScheduler(db=db, delta=delta, journal=default_journal(resume)).run(directory)
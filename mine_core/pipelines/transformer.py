@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Record Transformer - Per-Record Field Mapping and Normalisation
+Turns one raw facility record into schema entities and parent links.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from configs.environment import (
+    SchemaRegistry,
+    get_ingestion_config,
+    get_mappings,
+    get_root_cause_delimiters,
+    get_schema,
+    get_schema_registry,
+)
+from mine_core.pipelines.entity_graph import EntityDependencyGraph
+from mine_core.shared.columnar_utils import (
+    cascade_label_column,
+    column_from_records,
+    extract_tail_column,
+    normalize_column,
+    real_value_mask,
+)
+from mine_core.shared.field_utils import (
+    create_entity_id,
+    extract_root_cause_tail_extraction,
+    has_real_value,
+    is_missing_data_indicator,
+    normalize_field_value,
+    validate_cascade_labeling,
+)
+
+logger = logging.getLogger(__name__)
+
+FACILITY_ENTITY = "Facility"
+ROOT_ENTITY = "ActionRequest"
+# Root field whose value identifies an incident across exports of the same facility
+NATURAL_KEY_FIELD = "action_request_number"
+
+RelationshipKey = Tuple[str, str, str]
+EntityRows = Dict[str, List[Dict[str, Any]]]
+RelationshipPairs = Dict[RelationshipKey, List[Tuple[Any, Any]]]
+
+
+class RecordTransformer:
+    """Schema-driven mapping of raw records to entity property dicts"""
+
+    def __init__(
+        self,
+        schema: Dict[str, Any] = None,
+        mappings: Dict[str, Any] = None,
+        delimiters: List[str] = None,
+        graph: EntityDependencyGraph = None,
+        columnar: bool = None,
+    ):
+        self.schema = schema or get_schema()
+        self.registry = SchemaRegistry.compile(schema) if schema else get_schema_registry()
+        self.entity_mappings = (
+            mappings if mappings is not None else get_mappings()
+        ).get("entity_mappings", {})
+        self.delimiters = delimiters or get_root_cause_delimiters()
+
+        self.entities = self.registry.entities
+        self.primary_keys = self.registry.primary_keys
+        self.property_types = self.registry.property_types
+        self.graph = graph or EntityDependencyGraph(schema=self.schema)
+        # Schema relationships are many-to-one, so each child links to a single parent
+        self.parents: Dict[str, Tuple[str, str]] = {
+            child: parents[0] for child, parents in self.graph.parents.items() if parents
+        }
+        self.load_order = self.graph.order
+        self.columnar = (
+            get_ingestion_config()["columnar_normalization"] if columnar is None else columnar
+        )
+        self.raw_fields = list(
+            dict.fromkeys(
+                raw_field
+                for entity_type in self.load_order
+                for technical_field, raw_field in self.entity_mappings.get(entity_type, {}).items()
+                if technical_field in self.property_types.get(entity_type, {})
+            )
+        )
+
+    def facility(self, facility_id: str) -> Dict[str, Any]:
+        """Facility entity for a source file"""
+        return {
+            self.primary_keys[FACILITY_ENTITY]: facility_id,
+            "facility_name": facility_id,
+            "active": True,
+        }
+
+    def base_ids(
+        self,
+        records: List[Dict[str, Any]],
+        facility_id: str,
+        offset: int = 0,
+        occurrences: Dict[str, int] = None,
+    ) -> List[str]:
+        """Id stems from each record's natural key, falling back to its position in the file"""
+        # Counts keys seen earlier in the file, so a repeated key gets a #n suffix instead of
+        # overwriting the first incident; callers pass the same dict for every batch of a file
+        raw_field = self.entity_mappings.get(ROOT_ENTITY, {}).get(NATURAL_KEY_FIELD)
+        occurrences = {} if occurrences is None else occurrences
+        stems = []
+        for index, record in enumerate(records, start=offset):
+            value = record.get(raw_field) if raw_field else None
+            if not has_real_value(value) or is_missing_data_indicator(str(value)):
+                stems.append(f"{facility_id}-row-{index}")
+                continue
+            key = str(value).strip()
+            occurrences[key] = occurrences.get(key, 0) + 1
+            seen = occurrences[key]
+            stems.append(f"{facility_id}-{key}" if seen == 1 else f"{facility_id}-{key}#{seen}")
+        return stems
+
+    def transform(
+        self, record: Dict[str, Any], facility_id: str, index: int, base_id: str = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Map one raw record to {entity_type: properties}, keeping ancestors of populated entities"""
+        populated: Dict[str, Dict[str, Any]] = {}
+        for entity_type in self.load_order:
+            if entity_type == FACILITY_ENTITY:
+                continue
+            properties, has_data = self._map_entity(entity_type, record)
+            if has_data or entity_type == ROOT_ENTITY:
+                populated[entity_type] = properties
+
+        # A populated child needs its whole parent chain to attach to the incident
+        for entity_type in list(populated):
+            parent = self.parents.get(entity_type, (None, None))[1]
+            while parent and parent != FACILITY_ENTITY and parent not in populated:
+                populated[parent], _ = self._map_entity(parent, record)
+                parent = self.parents.get(parent, (None, None))[1]
+
+        # Natural keys keep ids stable when records are added to or removed from an export
+        if base_id is None:
+            base_id = self.base_ids([record], facility_id, index)[0]
+        entities: Dict[str, Dict[str, Any]] = {}
+        for entity_type in self.load_order:
+            if entity_type not in populated:
+                continue
+            properties = populated[entity_type]
+            properties[self.primary_keys[entity_type]] = create_entity_id(entity_type, base_id)
+
+            rel = self.parents.get(entity_type)
+            if rel:
+                parent_type = rel[1]
+                parent_id = (
+                    facility_id
+                    if parent_type == FACILITY_ENTITY
+                    else create_entity_id(parent_type, base_id)
+                )
+                properties[self.primary_keys[parent_type]] = parent_id
+
+            label = self._dynamic_label(entity_type, properties)
+            if label:
+                properties["_dynamic_label"] = label
+            entities[entity_type] = properties
+        return entities
+
+    def transform_batch(
+        self,
+        records: List[Dict[str, Any]],
+        facility_id: str,
+        offset: int = 0,
+        occurrences: Dict[str, int] = None,
+    ) -> Tuple[EntityRows, RelationshipPairs]:
+        """Map consecutive records to entity rows and parent links, column by column"""
+        stems = self.base_ids(records, facility_id, offset, occurrences)
+        if not self.columnar:
+            entities: EntityRows = {}
+            pairs: RelationshipPairs = {}
+            for index, (record, base_id) in enumerate(zip(records, stems), start=offset):
+                mapped = self.transform(record, facility_id, index, base_id)
+                for entity_type, properties in mapped.items():
+                    entities.setdefault(entity_type, []).append(properties)
+                for key, links in self.relationships(mapped).items():
+                    pairs.setdefault(key, []).extend(links)
+            return entities, pairs
+        return self._transform_columns(records, facility_id, stems)
+
+    def _transform_columns(
+        self, records: List[Dict[str, Any]], facility_id: str, stems: List[str]
+    ) -> Tuple[EntityRows, RelationshipPairs]:
+        """Vectorised transform(); rows and links come out in the same order and form"""
+        if not records:
+            return {}, {}
+        size = len(records)
+        raw = {field: column_from_records(records, field) for field in self.raw_fields}
+
+        columns: Dict[str, Dict[str, np.ndarray]] = {}
+        populated: Dict[str, np.ndarray] = {}
+        for entity_type in self.load_order:
+            if entity_type == FACILITY_ENTITY:
+                continue
+            columns[entity_type], has_data = self._map_columns(entity_type, raw, size)
+            populated[entity_type] = has_data | (entity_type == ROOT_ENTITY)
+
+        # Children come after parents in load order, so walking it backwards
+        # carries a populated grandchild's flag all the way up its chain
+        for entity_type in reversed(self.load_order):
+            parent = self.parents.get(entity_type, (None, None))[1]
+            if entity_type in populated and parent in populated:
+                populated[parent] = populated[parent] | populated[entity_type]
+
+        ids: Dict[str, np.ndarray] = {}
+        entities: EntityRows = {}
+        pairs: RelationshipPairs = {}
+        for entity_type in self.load_order:
+            if entity_type not in populated or not populated[entity_type].any():
+                continue
+            rows = np.flatnonzero(populated[entity_type])
+            entity_columns = dict(columns[entity_type])
+            primary_key = self.primary_keys[entity_type]
+            # Parents come first in load order, so a child reuses its parent's id column
+            ids[entity_type] = self._id_column(entity_type, stems)
+            entity_columns[primary_key] = ids[entity_type]
+
+            rel = self.parents.get(entity_type)
+            if rel:
+                rel_type, parent_type = rel
+                parent_key = self.primary_keys[parent_type]
+                entity_columns[parent_key] = (
+                    np.full(size, facility_id, dtype=object)
+                    if parent_type == FACILITY_ENTITY
+                    else ids[parent_type]
+                )
+                pairs[(entity_type, rel_type, parent_type)] = list(
+                    zip(entity_columns[primary_key][rows], entity_columns[parent_key][rows])
+                )
+
+            priority = self.registry.cascade_priorities.get(entity_type)
+            labels = None
+            if priority is not None:
+                labels = cascade_label_column(
+                    entity_columns, list(priority), entity_type, size
+                )[rows]
+
+            names = list(entity_columns)
+            entity_rows = [
+                dict(zip(names, values))
+                for values in zip(*(entity_columns[name][rows] for name in names))
+            ]
+            if labels is not None:
+                for row, label in zip(entity_rows, labels):
+                    if label != entity_type:
+                        row["_dynamic_label"] = label
+            entities[entity_type] = entity_rows
+        return entities, pairs
+
+    def _map_columns(
+        self, entity_type: str, raw: Dict[str, np.ndarray], size: int
+    ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Column-wise _map_entity: normalised property columns and a has-data mask"""
+        columns: Dict[str, np.ndarray] = {}
+        has_data = np.zeros(size, dtype=bool)
+        types = self.property_types[entity_type]
+
+        for technical_field, raw_field in self.entity_mappings.get(entity_type, {}).items():
+            if technical_field not in types:
+                continue
+            has_data |= real_value_mask(raw[raw_field])
+            columns[technical_field] = normalize_column(raw[raw_field], types[technical_field])
+
+        if "root_cause_tail_extraction" in types:
+            root_cause = columns.get("root_cause", np.full(size, None, dtype=object))
+            tails = extract_tail_column(root_cause, self.delimiters)
+            mapped = columns.get("root_cause_tail_extraction")
+            columns["root_cause_tail_extraction"] = (
+                tails if mapped is None else np.where(real_value_mask(mapped), mapped, tails)
+            )
+
+        return columns, has_data
+
+    @staticmethod
+    def _id_column(entity_type: str, stems: List[str]) -> np.ndarray:
+        """Entity ids for every row of a batch, as create_entity_id would build them"""
+        prefix = create_entity_id(entity_type, "")
+        ids = np.empty(len(stems), dtype=object)
+        ids[:] = [prefix + stem for stem in stems]
+        return ids
+
+    def relationships(
+        self, entities: Dict[str, Dict[str, Any]]
+    ) -> Dict[RelationshipKey, List[Tuple[Any, Any]]]:
+        """(child_id, parent_id) pairs for the parent links of transformed entities"""
+        pairs: Dict[RelationshipKey, List[Tuple[Any, Any]]] = {}
+        for entity_type, properties in entities.items():
+            rel = self.parents.get(entity_type)
+            if not rel:
+                continue
+            rel_type, parent_type = rel
+            pairs.setdefault((entity_type, rel_type, parent_type), []).append(
+                (
+                    properties[self.primary_keys[entity_type]],
+                    properties[self.primary_keys[parent_type]],
+                )
+            )
+        return pairs
+
+    def _map_entity(self, entity_type: str, record: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Normalised mapped properties and whether any carried real source data"""
+        properties: Dict[str, Any] = {}
+        has_data = False
+        types = self.property_types[entity_type]
+
+        for technical_field, raw_field in self.entity_mappings.get(entity_type, {}).items():
+            if technical_field not in types:
+                continue
+            value = record.get(raw_field)
+            if has_real_value(value):
+                has_data = True
+            properties[technical_field] = normalize_field_value(value, types[technical_field])
+
+        if "root_cause_tail_extraction" in types and not has_real_value(
+            properties.get("root_cause_tail_extraction")
+        ):
+            properties["root_cause_tail_extraction"] = extract_root_cause_tail_extraction(
+                properties.get("root_cause"), self.delimiters
+            )
+
+        return properties, has_data
+
+    def _dynamic_label(self, entity_type: str, properties: Dict[str, Any]) -> Optional[str]:
+        """Cascade label from the schema's dynamic_labeling priority"""
+        priority = self.registry.cascade_priorities.get(entity_type)
+        if priority is None:
+            return None
+        label = validate_cascade_labeling(
+            properties, {"label_priority": list(priority), "entity_type": entity_type}
+        )
+        return label if label != entity_type else None
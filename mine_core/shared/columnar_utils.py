@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Columnar Field Processing - Vectorised Counterparts of field_utils
+Applies field_utils once per distinct column value and broadcasts results by factorised codes.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+from mine_core.shared.field_utils import (
+    clean_label,
+    extract_root_cause_tail_extraction,
+    has_real_value,
+    is_missing_data_indicator,
+    normalize_field_value,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "column_from_records",
+    "map_unique",
+    "real_value_mask",
+    "normalize_column",
+    "extract_tail_column",
+    "cascade_label_column",
+]
+
+# Columns of a single scalar type; in mixed columns True == 1 == 1.0 would share one code
+_HASH_SAFE_DTYPES = {"string", "empty", "integer", "floating", "boolean"}
+
+
+def column_from_records(records: Sequence[Dict[str, Any]], field_name: str) -> np.ndarray:
+    """One raw field across a batch of records as an object array, None where absent"""
+    column = np.empty(len(records), dtype=object)
+    column[:] = [record.get(field_name) for record in records]
+    return column
+
+
+def map_unique(column: np.ndarray, func: Callable[[Any], Any]) -> np.ndarray:
+    """Apply a scalar function once per distinct value and broadcast it back to every row"""
+    if infer_dtype(column, skipna=True) not in _HASH_SAFE_DTYPES:
+        mapped = np.empty(len(column), dtype=object)
+        mapped[:] = [func(value) for value in column]
+        return mapped
+
+    codes, uniques = pd.factorize(column)
+    # Trailing slot holds the result for missing values, which factorize codes as -1
+    mapped = np.empty(len(uniques) + 1, dtype=object)
+    for index, value in enumerate(uniques):
+        mapped[index] = func(value)
+    mapped[-1] = func(None)
+    return mapped[codes]
+
+
+def real_value_mask(column: np.ndarray) -> np.ndarray:
+    """has_real_value for every row"""
+    return map_unique(column, has_real_value).astype(bool)
+
+
+def normalize_column(column: np.ndarray, field_type: str = "string") -> np.ndarray:
+    """normalize_field_value for every row"""
+    return map_unique(column, lambda value: normalize_field_value(value, field_type))
+
+
+def extract_tail_column(column: np.ndarray, delimiters: List[str] = None) -> np.ndarray:
+    """extract_root_cause_tail_extraction for every row"""
+    return map_unique(column, lambda value: extract_root_cause_tail_extraction(value, delimiters))
+
+
+def _label_candidate(value: Any) -> Any:
+    """Cleaned label for a usable cascade value, else None"""
+    if not has_real_value(value) or is_missing_data_indicator(str(value)):
+        return None
+    label = clean_label(str(value))
+    return label if label and label != "UnknownValue" else None
+
+
+def cascade_label_column(
+    columns: Dict[str, np.ndarray], priority_fields: List[str], entity_type: str, rows: int
+) -> np.ndarray:
+    """validate_cascade_labeling for every row: first usable priority field, else the type"""
+    labels = np.full(rows, entity_type, dtype=object)
+    pending = np.ones(rows, dtype=bool)
+    for field_name in priority_fields:
+        if field_name not in columns or not pending.any():
+            continue
+        candidates = map_unique(columns[field_name], _label_candidate)
+        usable = pending & pd.notna(candidates)
+        labels[usable] = candidates[usable]
+        pending &= ~usable
+    return labels
@@ -19,10 +19,10 @@ FIELD RESOLUTION METHODOLOGY:
 
 import json
 import logging
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .constants import DEFAULT_CONFIG_DIR
+from configs.environment import get_project_root
 
 __all__ = [
     "FieldResolver",
@@ -31,6 +31,8 @@ __all__ = [
     "get_business_field",
     "get_raw_data_field",
     "resolve_field_mapping",
+    "resolve_columns",
+    "normalize_field_name",
     "get_cascade_labeling_config",
     "get_all_technical_fields",
     "get_all_business_fields",
@@ -39,6 +41,14 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_HEADER_CACHE_SIZE = 256
+
+
+def normalize_field_name(field_name: str) -> str:
+    """Case-, colon- and whitespace-insensitive form of a raw field name"""
+    return _WHITESPACE_PATTERN.sub(" ", str(field_name)).strip().rstrip(":").strip().casefold()
+
 
 class FieldResolver:
     """
@@ -52,10 +62,17 @@ class FieldResolver:
     def __init__(self, config_path: Optional[str] = None):
         """Initialize field resolver with unified field mappings"""
         self.config_path = config_path or str(
-            Path(DEFAULT_CONFIG_DIR) / "field_mappings_unified.json"
+            get_project_root() / "configs" / "field_mappings_unified.json"
         )
         self._unified_mappings = None
+        # Per-entity hash indexes compiled once from the unified mappings
+        self._to_technical: Dict[str, Dict[str, str]] = {}
+        self._to_business: Dict[str, Dict[str, str]] = {}
+        self._to_raw: Dict[str, Dict[str, str]] = {}
+        self._normalized_raw: Dict[str, Dict[str, str]] = {}
+        self._header_cache: Dict[Tuple[str, Tuple[str, ...]], Dict[str, str]] = {}
         self._load_unified_mappings()
+        self._compile_indexes()
 
     def _load_unified_mappings(self) -> None:
         """Load unified field mappings configuration"""
@@ -78,6 +95,36 @@ class FieldResolver:
             logger.error(f"Invalid JSON in unified field mappings: {e}")
             raise
 
+    def _compile_indexes(self) -> None:
+        """Build technical/business/raw lookup tables for every entity"""
+        references = (self._unified_mappings or {}).get("unified_field_references", {})
+        for entity_name, entity_mappings in references.items():
+            technical_fields = entity_mappings.get("technical_fields", {})
+            business_fields = entity_mappings.get("business_fields", {})
+            raw_data_fields = entity_mappings.get("raw_data_fields", {})
+
+            # Lookup precedence: technical names, then business, then raw names;
+            # within a convention the first technical field listed wins
+            to_technical: Dict[str, str] = {}
+            for tech_field, raw_field in raw_data_fields.items():
+                to_technical.setdefault(raw_field, tech_field)
+            business_index: Dict[str, str] = {}
+            for tech_field, business_field in business_fields.items():
+                business_index.setdefault(business_field, tech_field)
+            to_technical.update(business_index)
+            to_technical.update(technical_fields)
+
+            normalized: Dict[str, str] = {}
+            for fields in (raw_data_fields, business_fields):
+                for tech_field, name in fields.items():
+                    normalized.setdefault(normalize_field_name(name), tech_field)
+
+            self._to_technical[entity_name] = to_technical
+            self._to_business[entity_name] = dict(business_fields)
+            self._to_raw[entity_name] = dict(raw_data_fields)
+            self._normalized_raw[entity_name] = normalized
+        self._header_cache.clear()
+
     def get_technical_field(self, entity_name: str, field_identifier: str) -> Optional[str]:
         """
         Get technical database field name for a given entity and field identifier.
@@ -89,35 +136,62 @@ class FieldResolver:
         Returns:
             Technical database field name (e.g., 'root_cause', 'action_request_number')
         """
-        if not self._unified_mappings:
+        index = self._to_technical.get(entity_name)
+        if index is None:
+            if self._unified_mappings:
+                logger.warning(f"Entity '{entity_name}' not found in unified mappings")
             return None
 
-        entity_mappings = self._unified_mappings.get("unified_field_references", {}).get(
-            entity_name
-        )
-        if not entity_mappings:
-            logger.warning(f"Entity '{entity_name}' not found in unified mappings")
-            return None
+        technical_field = index.get(field_identifier)
+        if technical_field is None:
+            logger.warning(f"Field '{field_identifier}' not found for entity '{entity_name}'")
+        return technical_field
 
-        # First try exact match in technical fields
-        technical_fields = entity_mappings.get("technical_fields", {})
-        if field_identifier in technical_fields:
-            return technical_fields[field_identifier]
+    def match_raw_field(self, entity_name: str, raw_field: str) -> Optional[str]:
+        """
+        Get technical field name for a raw column, tolerating case, colon and spacing variants.
 
-        # Try reverse lookup from business fields
-        business_fields = entity_mappings.get("business_fields", {})
-        for tech_field, business_field in business_fields.items():
-            if business_field == field_identifier:
-                return tech_field
+        Args:
+            entity_name: Entity name (e.g., 'RootCause', 'ActionRequest')
+            raw_field: Raw data column name (e.g., 'action request number')
 
-        # Try reverse lookup from raw data fields
-        raw_data_fields = entity_mappings.get("raw_data_fields", {})
-        for tech_field, raw_field in raw_data_fields.items():
-            if raw_field == field_identifier:
-                return tech_field
+        Returns:
+            Technical database field name, or None if no mapping matches
+        """
+        technical_field = self._to_technical.get(entity_name, {}).get(raw_field)
+        if technical_field is not None:
+            return technical_field
+        return self._normalized_raw.get(entity_name, {}).get(normalize_field_name(raw_field))
 
-        logger.warning(f"Field '{field_identifier}' not found for entity '{entity_name}'")
-        return None
+    def resolve_columns(self, entity_name: str, columns: Iterable[str]) -> Dict[str, str]:
+        """
+        Map a whole header row of raw column names to technical field names in one call.
+
+        Args:
+            entity_name: Entity name (e.g., 'RootCause', 'ActionRequest')
+            columns: Raw column names, typically the keys of a file's first record
+
+        Returns:
+            Dictionary of resolvable column name to technical field name; results are
+            cached per header, so files sharing a layout resolve it once
+        """
+        header = tuple(columns)
+        key = (entity_name, header)
+        resolved = self._header_cache.get(key)
+        if resolved is None:
+            resolved = {}
+            for column in header:
+                technical_field = self.match_raw_field(entity_name, column)
+                if technical_field is not None:
+                    resolved[column] = technical_field
+            if len(self._header_cache) >= _HEADER_CACHE_SIZE:
+                # Records with ragged key sets would otherwise grow the cache without bound
+                self._header_cache.clear()
+            self._header_cache[key] = resolved
+            logger.debug(
+                f"Resolved {len(resolved)}/{len(header)} columns for entity '{entity_name}'"
+            )
+        return dict(resolved)
 
     def get_business_field(self, entity_name: str, technical_field: str) -> Optional[str]:
         """
@@ -130,17 +204,7 @@ class FieldResolver:
         Returns:
             Business display field name (e.g., 'Root Cause', 'Action Request Number:')
         """
-        if not self._unified_mappings:
-            return None
-
-        entity_mappings = self._unified_mappings.get("unified_field_references", {}).get(
-            entity_name
-        )
-        if not entity_mappings:
-            return None
-
-        business_fields = entity_mappings.get("business_fields", {})
-        return business_fields.get(technical_field)
+        return self._to_business.get(entity_name, {}).get(technical_field)
 
     def get_raw_data_field(self, entity_name: str, technical_field: str) -> Optional[str]:
         """
@@ -153,17 +217,7 @@ class FieldResolver:
         Returns:
             Raw data field name (e.g., 'Action Request Number:', 'Root Cause')
         """
-        if not self._unified_mappings:
-            return None
-
-        entity_mappings = self._unified_mappings.get("unified_field_references", {}).get(
-            entity_name
-        )
-        if not entity_mappings:
-            return None
-
-        raw_data_fields = entity_mappings.get("raw_data_fields", {})
-        return raw_data_fields.get(technical_field)
+        return self._to_raw.get(entity_name, {}).get(technical_field)
 
     def resolve_field_mapping(
         self, entity_name: str, source_type: str, target_type: str, field_name: str
@@ -356,3 +410,28 @@ def resolve_field_mapping(
     return get_field_resolver().resolve_field_mapping(
         entity_name, source_type, target_type, field_name
     )
+
+
+def resolve_columns(entity_name: str, columns: Iterable[str]) -> Dict[str, str]:
+    """Map a header row of raw column names to technical field names"""
+    return get_field_resolver().resolve_columns(entity_name, columns)
+
+
+def get_cascade_labeling_config(entity_name: str) -> Optional[Dict[str, Any]]:
+    """Get unified cascade labeling configuration"""
+    return get_field_resolver().get_cascade_labeling_config(entity_name)
+
+
+def get_all_technical_fields(entity_name: str) -> List[str]:
+    """Get all technical field names for an entity"""
+    return get_field_resolver().get_all_technical_fields(entity_name)
+
+
+def get_all_business_fields(entity_name: str) -> List[str]:
+    """Get all business field names for an entity"""
+    return get_field_resolver().get_all_business_fields(entity_name)
+
+
+def validate_field_resolution() -> Dict[str, Any]:
+    """Validate the unified field resolution configuration"""
+    return get_field_resolver().validate_field_resolution()
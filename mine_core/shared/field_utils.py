@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "MISSING_DATA_INDICATORS",
     "MISSING_DATA_CONTEXT",
+    "MISSING_VALUE_TOKENS",
+    "LABEL_INVALID_CHARS",
     "has_real_value",
     "is_missing_data_indicator",
     "get_missing_indicator",
@@ -45,6 +47,22 @@ MISSING_DATA_INDICATORS = {
     "unknown",
 }
 
+# Case-insensitive spellings of missing data once surrounding whitespace is stripped
+MISSING_VALUE_TOKENS = frozenset(
+    {
+        "",
+        "null",
+        "n/a",
+        "unknown",
+        "data_not_available",
+        "not_specified",
+        "not_applicable",
+    }
+)
+
+# Characters not allowed in Neo4j labels
+LABEL_INVALID_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
 # Missing data context mappings
 MISSING_DATA_CONTEXT = {
     "DATA_NOT_AVAILABLE": "Field exists but value missing - potential collection system issue",
@@ -62,16 +80,7 @@ def has_real_value(value: Any) -> bool:
         return False
 
     if isinstance(value, str):
-        cleaned = value.strip().lower()
-        return cleaned not in {
-            "",
-            "null",
-            "n/a",
-            "unknown",
-            "data_not_available",
-            "not_specified",
-            "not_applicable",
-        }
+        return value.strip().lower() not in MISSING_VALUE_TOKENS
 
     return value is not None
 
@@ -103,7 +112,7 @@ def clean_label(value: str) -> str:
         value = str(value)
 
     # Remove special characters, keep alphanumeric and underscores
-    cleaned = re.sub(r"[^a-zA-Z0-9_]", "", value.replace(" ", "_").replace("-", "_"))
+    cleaned = LABEL_INVALID_CHARS.sub("", value.replace(" ", "_").replace("-", "_"))
 
     # Ensure starts with letter
     if cleaned and cleaned[0].isdigit():
@@ -0,0 +1,108 @@
+"""Shared fixtures: a small facility dataset and an in-memory stand-in for the graph"""
+
+import json
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from mine_core.pipelines import RecordTransformer
+
+MAPPINGS = {
+    "entity_mappings": {
+        "ActionRequest": {"action_request_number": "Action Request Number:", "title": "Title"},
+        "Problem": {"what_happened": "What happened?"},
+        "RootCause": {"root_cause": "Root Cause"},
+    }
+}
+
+
+def facility_records(count, prefix="2023"):
+    """Records shaped like a facility export, every third one without a root cause"""
+    return [
+        {
+            "Action Request Number:": f"{prefix}-{index}",
+            "Title": f"Pump failure {index}",
+            "What happened?": f"Seal leak on pump {index}",
+            "Root Cause": None if index % 3 == 0 else "wear; misalignment",
+        }
+        for index in range(count)
+    ]
+
+
+class InMemoryGraph:
+    """Records bulk writes the way the importers issue them and answers delta lookups"""
+
+    def __init__(self, primary_keys):
+        self.primary_keys = primary_keys
+        self.nodes = {}
+        self.links = set()
+        self.entity_writes = 0
+        self.link_writes = 0
+        # Entity writes left before bulk_create_entities starts failing; None never fails
+        self.fail_after = None
+        self.fail_links = False
+        self._lock = threading.Lock()
+
+    def bulk_create_entities(self, entity_type, rows, batch_size=None):
+        with self._lock:
+            if self.fail_after is not None:
+                if self.fail_after <= 0:
+                    return {"rows": 0, "success": False, "error": "boom"}
+                self.fail_after -= 1
+            primary_key = self.primary_keys[entity_type]
+            for row in rows:
+                stored = {key: value for key, value in row.items() if key != "_dynamic_label"}
+                self.nodes[(entity_type, row[primary_key])] = stored
+                self.entity_writes += 1
+        return {"entity_type": entity_type, "rows": len(rows), "success": True}
+
+    def bulk_create_relationships(self, batches, batch_size=None):
+        if self.fail_links:
+            return {"linked": 0, "success": False, "error": "link failure"}
+        with self._lock:
+            for (from_type, _, _), pairs in batches.items():
+                for child_id, _ in pairs:
+                    self.links.add((from_type, child_id))
+            linked = sum(len(pairs) for pairs in batches.values())
+            self.link_writes += linked
+        return {"linked": linked, "success": True}
+
+    def read_query(self, query, params=None, timeout=None, use_cache=True):
+        # Only DeltaFilter reads from the graph during an import
+        entity_type = query.split("MATCH (n:")[1].split(" ")[0]
+        checks_link = "EXISTS" in query
+        return [
+            {
+                "id": node_id,
+                "hash": self.nodes[(entity_type, node_id)].get("content_hash"),
+                "linked": not checks_link or (entity_type, node_id) in self.links,
+            }
+            for node_id in (params or {})["ids"]
+            if (entity_type, node_id) in self.nodes
+        ]
+
+    @contextmanager
+    def deferred_chain_maintenance(self):
+        yield self
+
+
+@pytest.fixture
+def transformer():
+    return RecordTransformer(mappings=MAPPINGS)
+
+
+@pytest.fixture
+def graph(transformer):
+    return InMemoryGraph(transformer.primary_keys)
+
+
+@pytest.fixture
+def facility_dir(tmp_path):
+    """Two facility files of 25 and 20 records"""
+    directory = tmp_path / "facility_data"
+    directory.mkdir()
+    for name, count in (("fac_a", 25), ("fac_b", 20)):
+        payload = {"records": facility_records(count, prefix=name.upper())}
+        (directory / f"{name}.json").write_text(json.dumps(payload), encoding="utf-8")
+    return directory
@@ -0,0 +1,98 @@
+"""Resumable and incremental imports against an in-memory graph"""
+
+from mine_core.pipelines import ImportJournal, ImportScheduler, StreamingIngestor
+
+
+def test_journal_resumes_after_partial_batch(graph, transformer, facility_dir, tmp_path):
+    journal_path = tmp_path / "journal.jsonl"
+    graph.fail_after = 4
+
+    first = StreamingIngestor(
+        db=graph, transformer=transformer, batch_size=10, journal=ImportJournal(journal_path)
+    ).ingest_directory(facility_dir)
+    assert first.failed_batches > 0
+    assert journal_path.exists()
+
+    graph.fail_after = None
+    graph.entity_writes = 0
+    second = StreamingIngestor(
+        db=graph, transformer=transformer, batch_size=10, journal=ImportJournal(journal_path)
+    ).ingest_directory(facility_dir)
+
+    assert second.success
+    assert second.resumed_batches + second.resumed_writes > 0
+
+    clean = type(graph)(graph.primary_keys)
+    StreamingIngestor(db=clean, transformer=transformer, batch_size=10).ingest_directory(
+        facility_dir
+    )
+    assert graph.nodes == clean.nodes
+    # Writes committed by the first run are not repeated
+    assert graph.entity_writes < clean.entity_writes
+    # A clean run leaves nothing to resume from
+    assert not journal_path.exists()
+
+
+def test_scheduler_resume_matches_clean_import(graph, transformer, facility_dir, tmp_path):
+    journal_path = tmp_path / "journal.jsonl"
+    graph.fail_after = 3
+    ImportScheduler(
+        db=graph,
+        transformer=transformer,
+        batch_size=10,
+        journal=ImportJournal(journal_path),
+        max_attempts=1,
+    ).run(facility_dir)
+
+    graph.fail_after = None
+    resumed = ImportScheduler(
+        db=graph,
+        transformer=transformer,
+        batch_size=10,
+        journal=ImportJournal(journal_path),
+        max_attempts=1,
+    ).run(facility_dir)
+    assert resumed.success
+
+    clean = type(graph)(graph.primary_keys)
+    ImportScheduler(db=clean, transformer=transformer, batch_size=10, max_attempts=1).run(
+        facility_dir
+    )
+    assert graph.nodes == clean.nodes
+    assert graph.links == clean.links
+
+
+def test_delta_skips_unchanged_rows(graph, transformer, facility_dir):
+    StreamingIngestor(
+        db=graph, transformer=transformer, batch_size=10, delta=True
+    ).ingest_directory(facility_dir)
+    graph.entity_writes = graph.link_writes = 0
+
+    rerun = StreamingIngestor(
+        db=graph, transformer=transformer, batch_size=10, delta=True
+    ).ingest_directory(facility_dir)
+
+    assert rerun.success
+    assert rerun.unchanged > 0
+    assert graph.entity_writes == 0
+    assert graph.link_writes == 0
+
+
+def test_delta_relinks_unchanged_rows_missing_parent_link(graph, transformer, facility_dir):
+    graph.fail_links = True
+    StreamingIngestor(
+        db=graph, transformer=transformer, batch_size=10, delta=True
+    ).ingest_directory(facility_dir)
+    assert not graph.links
+
+    graph.fail_links = False
+    graph.entity_writes = 0
+    rerun = StreamingIngestor(
+        db=graph, transformer=transformer, batch_size=10, delta=True
+    ).ingest_directory(facility_dir)
+
+    assert rerun.success
+    # Content is unchanged, so nothing is rewritten, but every child gets its parent link
+    assert graph.entity_writes == 0
+    children = {key for key in graph.nodes if key[0] != "Facility"}
+    assert graph.links == children
@@ -0,0 +1,115 @@
+"""Query result caching: what gets cached, and what a write throws away"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from mine_core.database.db import SimplifiedDatabase
+from mine_core.database.query_cache import QueryResultCache
+from mine_core.database.query_metrics import QueryMetrics
+
+
+class FakeResult:
+    def __init__(self, rows, query_type):
+        self._rows = rows
+        self._summary = SimpleNamespace(
+            query_type=query_type, result_available_after=1, result_consumed_after=1
+        )
+
+    def data(self):
+        return [dict(row) for row in self._rows]
+
+    def consume(self):
+        return self._summary
+
+
+class FakeServer:
+    """Answers every statement with the same rows and a server-side query type"""
+
+    def __init__(self):
+        self.rows = [{"name": "pump", "tags": ["seal"]}]
+        self.query_types = {}
+        self.calls = []
+
+    def run(self, query, parameters=None):
+        self.calls.append(query)
+        return FakeResult(self.rows, self.query_types.get(query, "r"))
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture
+def db(server):
+    database = SimplifiedDatabase()
+    database._query_cache = QueryResultCache()
+    database._query_metrics = QueryMetrics(log_slow_queries=False)
+    transactions = {"read": 0, "write": 0}
+    database.transactions = transactions
+
+    def execute_read(work):
+        transactions["read"] += 1
+        return work(server)
+
+    def execute_write(work):
+        transactions["write"] += 1
+        return work(server)
+
+    database.execute_read = execute_read
+    database.execute_write = execute_write
+    return database
+
+
+READ = "MATCH (n:Equipment) RETURN n.name AS name, n.tags AS tags"
+
+
+def test_read_is_served_from_cache(db, server):
+    assert db.read_query(READ) == db.read_query(READ)
+    assert server.calls == [READ]
+
+
+def test_write_invalidates_cached_reads(db, server):
+    write = "MATCH (n:Equipment) SET n.name = $name"
+    server.query_types[write] = "w"
+
+    db.read_query(READ)
+    db.execute_query(write, {"name": "valve"})
+    db.read_query(READ)
+
+    assert server.calls == [READ, write, READ]
+    assert db.transactions["write"] == 1
+
+
+def test_write_procedure_is_not_cached(db, server):
+    query = "MATCH (n) CALL apoc.create.addLabels(n, ['Seen']) YIELD node RETURN count(node)"
+    server.query_types[query] = "rw"
+
+    db.read_query(READ)
+    db.execute_query(query)
+    db.execute_query(query)
+
+    # Not cached, and each run throws away the read cached before it
+    assert server.calls == [READ, query, query]
+    assert db.transactions["write"] == 2
+    assert db._query_cache.get(db._query_cache.make_key(READ, {})) is None
+
+
+def test_untagged_read_with_write_keyword_is_cached(db, server):
+    query = "MATCH (n) WHERE n.note CONTAINS 'CREATE' RETURN n.name AS name"
+
+    db.execute_query(query)
+    db.execute_query(query)
+
+    assert server.calls == [query]
+    # The first run went to the leader; the server reported it read-only
+    assert db.transactions == {"read": 0, "write": 1}
+
+
+def test_cached_rows_are_independent_copies(db):
+    rows = db.read_query(READ)
+    rows[0]["tags"].append("mutated")
+    rows[0]["extra"] = True
+
+    assert db.read_query(READ) == [{"name": "pump", "tags": ["seal"]}]